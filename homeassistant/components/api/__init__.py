@@ -12,6 +12,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -34,7 +35,6 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import template
-from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.state import AsyncTrackStates
 
@@ -114,7 +114,11 @@ class APIEventStream(HomeAssistantView):
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                try:
+                    data = event.as_json()
+                except (ValueError, TypeError) as err:
+                    _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, event)
+                    return
 
             await to_write.put(data)
 
@@ -204,7 +208,15 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            body = "[{}]".format(", ".join(state.as_json() for state in states))
+        except (ValueError, TypeError):
+            # Let the view report the state that can't be serialized
+            return self.json(states)
+
+        response = web.Response(text=body, content_type=CONTENT_TYPE_JSON)
+        response.enable_compression()
+        return response
 
 
 class APIEntityStateView(HomeAssistantView):
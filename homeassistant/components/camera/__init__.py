@@ -4,9 +4,11 @@ import base64
 import collections
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import hashlib
 import logging
 from random import SystemRandom
+from time import monotonic
 
 from aiohttp import web
 import async_timeout
@@ -49,6 +51,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.loader import bind_hass
 from homeassistant.setup import async_when_setup
 
+from .broadcaster import FrameBroadcaster
 from .const import DATA_CAMERA_PREFS, DOMAIN
 from .prefs import CameraPreferences
 
@@ -84,6 +87,10 @@ _RND = SystemRandom()
 
 MIN_STREAM_INTERVAL = 0.5  # seconds
 
+# Images fetched this recently are shared by all requests for an image
+STILL_IMAGE_MAX_AGE = 1  # seconds
+STILL_IMAGE_FETCH_TIMEOUT = 10  # seconds
+
 CAMERA_SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids})
 
 CAMERA_SERVICE_SNAPSHOT = CAMERA_SERVICE_SCHEMA.extend(
@@ -146,7 +153,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.async_shared_camera_image()
 
             if image:
                 return Image(camera.content_type, image)
@@ -315,6 +322,10 @@ class Camera(Entity):
         self.content_type = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
         self.async_update_token()
+        self._shared_image_fetch = None
+        self._shared_image = None
+        self._shared_image_time = 0.0
+        self._frame_broadcaster = None
 
     @property
     def should_poll(self):
@@ -368,11 +379,64 @@ class Camera(Entity):
         """Return bytes of camera image."""
         return await self.hass.async_add_job(self.camera_image)
 
+    async def async_shared_camera_image(self, max_age=None):
+        """Return bytes of camera image, shared between requests.
+
+        Requests made while an image is fetched wait for that image. An
+        image fetched less than max_age seconds ago is returned as is.
+        """
+        if max_age is None:
+            max_age = STILL_IMAGE_MAX_AGE
+
+        if (
+            self._shared_image is not None
+            and monotonic() - self._shared_image_time < max_age
+        ):
+            return self._shared_image
+
+        if self._shared_image_fetch is None:
+            self._shared_image_fetch = self.hass.async_create_task(
+                self._async_fetch_shared_image()
+            )
+
+        # Don't cancel the fetch for the other requests waiting for it
+        return await asyncio.shield(self._shared_image_fetch)
+
+    async def _async_fetch_shared_image(self):
+        """Fetch an image and keep it for the next requests."""
+        try:
+            async with async_timeout.timeout(STILL_IMAGE_FETCH_TIMEOUT):
+                image = await self.async_camera_image()
+        finally:
+            self._shared_image_fetch = None
+
+        if image:
+            self._shared_image = image
+            self._shared_image_time = monotonic()
+
+        return image
+
     async def handle_async_still_stream(self, request, interval):
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        All streams of the camera show the images of a single producer.
+        """
+        if self._frame_broadcaster is None:
+            self._frame_broadcaster = FrameBroadcaster(
+                self.hass, partial(self.async_shared_camera_image, 0)
+            )
+
+        unsubscribe = self._frame_broadcaster.async_subscribe(interval)
+
+        try:
+            return await async_get_still_stream(
+                request,
+                self._frame_broadcaster.async_get_frame,
+                self.content_type,
+                interval,
+            )
+        finally:
+            unsubscribe()
 
     async def handle_async_mjpeg_stream(self, request):
         """Serve an HTTP MJPEG stream from the camera.
@@ -499,7 +563,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                image = await camera.async_shared_camera_image()
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -0,0 +1,85 @@
+"""Share the frames of a camera between the streams showing it."""
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.typing import HomeAssistantType
+
+
+class FrameBroadcaster:
+    """Fetch the frames of a camera once for all streams showing it.
+
+    A single producer fetches frames at the shortest interval requested by
+    the subscribed streams. The streams all show the latest fetched frame.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        image_cb: Callable[[], Awaitable[Optional[bytes]]],
+    ) -> None:
+        """Initialize the frame broadcaster."""
+        self.hass = hass
+        self._image_cb = image_cb
+        self._intervals: List[float] = []
+        self._frame: Optional[bytes] = None
+        self._error: Optional[Exception] = None
+        self._frame_fetched = asyncio.Event()
+        self._producer: Optional["asyncio.Task[None]"] = None
+
+    @callback
+    def async_subscribe(self, interval: float) -> CALLBACK_TYPE:
+        """Subscribe a stream that shows a frame every interval seconds."""
+        self._intervals.append(interval)
+
+        if self._producer is None:
+            self._frame = None
+            self._error = None
+            self._frame_fetched.clear()
+            self._producer = self.hass.async_create_task(self._async_produce())
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Unsubscribe the stream, stop fetching after the last one."""
+            self._intervals.remove(interval)
+
+            if not self._intervals and self._producer is not None:
+                self._producer.cancel()
+                self._producer = None
+
+        return async_unsubscribe
+
+    async def async_get_frame(self) -> Optional[bytes]:
+        """Return the latest frame, waiting for the first one.
+
+        Returns None once the camera no longer returns frames.
+        """
+        await self._frame_fetched.wait()
+
+        if self._error is not None:
+            raise self._error
+
+        return self._frame
+
+    async def _async_produce(self) -> None:
+        """Fetch frames until the camera stops returning them."""
+        try:
+            while True:
+                self._frame = await self._image_cb()
+                self._frame_fetched.set()
+
+                if not self._frame:
+                    break
+
+                await asyncio.sleep(min(self._intervals))
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as err:  # pylint: disable=broad-except
+            # Raised to the streams waiting for a frame
+            self._error = err
+            self._frame_fetched.set()
+
+        # Subscribing again starts a new producer
+        self._producer = None
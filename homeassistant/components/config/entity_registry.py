@@ -71,6 +71,9 @@ async def websocket_get_entity(hass, connection, msg):
         vol.Optional("new_entity_id"): str,
         # We only allow setting disabled_by user via API.
         vol.Optional("disabled_by"): vol.Any("user", None),
+        vol.Optional("coalesce_interval"): vol.Any(
+            vol.All(vol.Coerce(float), vol.Range(min=0)), None
+        ),
     }
 )
 async def websocket_update_entity(hass, connection, msg):
@@ -94,6 +97,9 @@ async def websocket_update_entity(hass, connection, msg):
     if "disabled_by" in msg:
         changes["disabled_by"] = msg["disabled_by"]
 
+    if "coalesce_interval" in msg:
+        changes["coalesce_interval"] = msg["coalesce_interval"]
+
     if "new_entity_id" in msg and msg["new_entity_id"] != msg["entity_id"]:
         changes["new_entity_id"] = msg["new_entity_id"]
         if hass.states.get(msg["new_entity_id"]) is not None:
@@ -5,7 +5,7 @@ from itertools import groupby
 import logging
 import time
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, case, func
 import voluptuous as vol
 
 from homeassistant.components import recorder
@@ -18,11 +18,16 @@ from homeassistant.const import (
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
 )
+from homeassistant.core import State, callback, split_entity_id
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
 
+from .cache import HistoryCache
+
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +47,17 @@ CONFIG_SCHEMA = vol.Schema(
 SIGNIFICANT_DOMAINS = ("thermostat", "climate", "water_heater")
 IGNORE_DOMAINS = ("zone", "scene")
 
+# Bounds of the in-memory cache used to answer recent history requests,
+# the size is an estimate in bytes
+CACHE_MAX_AGE = timedelta(hours=25)
+CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+# Make the SQL query for the uncached prefix include its end time
+CACHE_PREFIX_OVERLAP = timedelta(microseconds=1)
+
+# Number of rows fetched at once when streaming states
+STREAM_BATCH_SIZE = 1000
+
 
 def get_significant_states(
     hass,
@@ -61,21 +77,9 @@ def get_significant_states(
     timer_start = time.perf_counter()
 
     with session_scope(hass=hass) as session:
-        query = session.query(States).filter(
-            (
-                States.domain.in_(SIGNIFICANT_DOMAINS)
-                | (States.last_changed == States.last_updated)
-            )
-            & (States.last_updated > start_time)
-        )
-
-        if filters:
-            query = filters.apply(query, entity_ids)
-
-        if end_time is not None:
-            query = query.filter(States.last_updated < end_time)
-
-        query = query.order_by(States.last_updated)
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters
+        ).order_by(States.last_updated)
 
         states = (
             state
@@ -92,6 +96,123 @@ def get_significant_states(
     )
 
 
+def iter_significant_states(
+    hass,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    extra_states=None,
+):
+    """Yield the significant states of each entity during a period.
+
+    Streaming variant of get_significant_states. Rows are fetched in
+    batches ordered by entity, in the order of entity_ids if given, so only
+    the states of a single entity are in memory at a time. States in
+    extra_states, a dict of entity id to states, are appended to the states
+    of their entity.
+    """
+    extra_states = dict(extra_states or {})
+    groups = _iter_significant_state_groups(
+        hass, start_time, end_time, entity_ids, filters, include_start_time_state
+    )
+
+    for ent_id, states in groups:
+        states.extend(extra_states.pop(ent_id, ()))
+        yield states
+
+    for states in extra_states.values():
+        if states:
+            yield states
+
+
+def _iter_significant_state_groups(
+    hass, start_time, end_time, entity_ids, filters, include_start_time_state
+):
+    """Yield entity ids with their significant states during a period.
+
+    The entities are ordered as in entity_ids if given, by entity id otherwise.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        for state in get_states(hass, start_time, entity_ids, filters=filters):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            initial_states[state.entity_id] = state
+
+    positions = None
+    if entity_ids is not None:
+        positions = {}
+        for ent_id in entity_ids:
+            positions.setdefault(ent_id, len(positions))
+        initial_states = {
+            ent_id: initial_states[ent_id]
+            for ent_id in positions
+            if ent_id in initial_states
+        }
+
+    with session_scope(hass=hass) as session:
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters
+        )
+
+        if positions:
+            query = query.order_by(
+                case(positions, value=States.entity_id, else_=len(positions)),
+                States.last_updated,
+            )
+        else:
+            query = query.order_by(States.entity_id, States.last_updated)
+
+        states = (
+            state
+            for state in (row.to_native() for row in query.yield_per(STREAM_BATCH_SIZE))
+            if state is not None
+            and _is_significant(state)
+            and not state.attributes.get(ATTR_HIDDEN, False)
+        )
+
+        for ent_id, group in groupby(states, lambda state: state.entity_id):
+            if positions:
+                # Requested entities without significant states before this one
+                position = positions.get(ent_id, len(positions))
+                earlier_ids = []
+                for earlier_id in initial_states:
+                    if positions[earlier_id] >= position:
+                        break
+                    earlier_ids.append(earlier_id)
+                for earlier_id in earlier_ids:
+                    yield earlier_id, [initial_states.pop(earlier_id)]
+
+            initial_state = initial_states.pop(ent_id, None)
+            entity_states = [] if initial_state is None else [initial_state]
+            entity_states.extend(group)
+            yield ent_id, entity_states
+
+    for ent_id, initial_state in initial_states.items():
+        yield ent_id, [initial_state]
+
+
+def _significant_states_query(session, start_time, end_time, entity_ids, filters):
+    """Return the query for the significant states during a period."""
+    query = session.query(States).filter(
+        (
+            States.domain.in_(SIGNIFICANT_DOMAINS)
+            | (States.last_changed == States.last_updated)
+        )
+        & (States.last_updated > start_time)
+    )
+
+    if filters:
+        query = filters.apply(query, entity_ids)
+
+    if end_time is not None:
+        query = query.filter(States.last_updated < end_time)
+
+    return query
+
+
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
 
@@ -254,6 +375,56 @@ def states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
+@callback
+def async_get_cached_significant_states(
+    cache, start_time, end_time, entity_ids, filters, include_start_time_state
+):
+    """Return significant states from the history cache.
+
+    Equivalent to get_significant_states for periods covered by the cache.
+    """
+    result = defaultdict(list)
+    if entity_ids is not None:
+        for ent_id in entity_ids:
+            result[ent_id] = []
+        candidates = entity_ids
+    else:
+        candidates = [
+            ent_id
+            for ent_id in cache.async_entity_ids()
+            if filters is None or filters.match(ent_id)
+        ]
+
+    for ent_id in candidates:
+        if include_start_time_state:
+            state = cache.async_state_at(ent_id, start_time)
+            if state is not None and not state.attributes.get(ATTR_HIDDEN, False):
+                # Cached states are shared, don't modify them
+                result[ent_id].append(
+                    State(
+                        state.entity_id,
+                        state.state,
+                        state.attributes,
+                        start_time,
+                        start_time,
+                        state.context,
+                    )
+                )
+
+        result[ent_id].extend(
+            state
+            for state in cache.async_states_between(ent_id, start_time, end_time)
+            if (
+                state.domain in SIGNIFICANT_DOMAINS
+                or state.last_changed == state.last_updated
+            )
+            and _is_significant(state)
+            and not state.attributes.get(ATTR_HIDDEN, False)
+        )
+
+    return {key: val for key, val in result.items() if val}
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = list(get_states(hass, utc_point_in_time, (entity_id,), run))
@@ -274,7 +445,20 @@ async def async_setup(hass, config):
         filters.included_domains = include.get(CONF_DOMAINS, [])
     use_include_order = conf.get(CONF_ORDER)
 
-    hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    cache = None
+    instance = hass.data.get(recorder.DATA_INSTANCE)
+    if instance is not None and EVENT_STATE_CHANGED not in instance.exclude_t:
+        cache = HistoryCache(hass, CACHE_MAX_AGE, CACHE_MAX_SIZE)
+        cache.async_start(instance.entity_filter)
+
+        @callback
+        def async_stop_cache(event):
+            """Stop the history cache."""
+            cache.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_cache)
+
+    hass.http.register_view(HistoryPeriodView(filters, use_include_order, cache))
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -289,10 +473,11 @@ class HistoryPeriodView(HomeAssistantView):
     name = "api:history:view-period"
     extra_urls = ["/api/history/period/{datetime}"]
 
-    def __init__(self, filters, use_include_order):
+    def __init__(self, filters, use_include_order, cache=None):
         """Initialize the history period view."""
         self.filters = filters
         self.use_include_order = use_include_order
+        self.cache = cache
 
     async def get(self, request, datetime=None):
         """Return history over a period of time."""
@@ -329,17 +514,57 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state = "skip_initial_state" not in request.query
 
         hass = request.app["hass"]
+        cache = self.cache
+        cached = None
+
+        if cache is not None and cache.async_covers(start_time):
+            result = list(
+                async_get_cached_significant_states(
+                    cache,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                ).values()
+            )
+
+        else:
+            if cache is not None and cache.async_covers(end_time):
+                # Only query the database for the part that is not cached
+                covered_since = cache.covered_since
+                cached = async_get_cached_significant_states(
+                    cache, covered_since, end_time, entity_ids, self.filters, False
+                )
+                end_time = covered_since + CACHE_PREFIX_OVERLAP
+
+            if not self.use_include_order:
+                return await self.json_stream(
+                    request,
+                    iter_significant_states,
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    cached,
+                )
+
+            result = await hass.async_add_job(
+                lambda: list(
+                    iter_significant_states(
+                        hass,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        self.filters,
+                        include_start_time_state,
+                        cached,
+                    )
+                )
+            )
 
-        result = await hass.async_add_job(
-            get_significant_states,
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            self.filters,
-            include_start_time_state,
-        )
-        result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
             _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
@@ -423,6 +648,40 @@ class Filters:
             query = query.filter(~States.entity_id.in_(self.excluded_entities))
         return query
 
+    def match(self, entity_id):
+        """Return if an entity passes the filter, like apply does in SQL."""
+        domain = split_entity_id(entity_id)[0]
+        if domain in IGNORE_DOMAINS:
+            return False
+
+        keep = True
+        # filter if only excluded domain is configured
+        if self.excluded_domains and not self.included_domains:
+            keep = domain not in self.excluded_domains
+            if self.included_entities:
+                keep = keep and entity_id in self.included_entities
+        # filter if only included domain is configured
+        elif not self.excluded_domains and self.included_domains:
+            keep = domain in self.included_domains
+            if self.included_entities:
+                keep = keep or entity_id in self.included_entities
+        # filter if included and excluded domain is configured
+        elif self.excluded_domains and self.included_domains:
+            keep = domain not in self.excluded_domains
+            if self.included_entities:
+                keep = keep and (
+                    domain in self.included_domains
+                    or entity_id in self.included_entities
+                )
+            else:
+                keep = keep and domain in self.included_domains
+        # no domain filter just included entities
+        elif self.included_entities:
+            keep = entity_id in self.included_entities
+
+        # finally apply excluded entities filter if configured
+        return keep and entity_id not in self.excluded_entities
+
 
 def _is_significant(state):
     """Test if state is significant for history charts.
@@ -0,0 +1,317 @@
+"""In-memory cache of the recently recorded state history."""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime, timedelta
+import logging
+import sys
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+EVICT_INTERVAL = timedelta(minutes=5)
+
+# Compact the columns once this many evicted slots are at their start
+COMPACT_THRESHOLD = 64
+
+# Estimated memory used by a cached state besides its value and attributes:
+# the slots in the columns, the datetimes and the context
+STATE_SIZE = 300
+
+
+def _state_size(state: State, attributes_shared: bool) -> int:
+    """Estimate the memory used by a cached state.
+
+    The attributes are estimated by the length of the state serialized to
+    JSON, which is cached by the state for the websocket API.
+    """
+    if attributes_shared:
+        return STATE_SIZE + len(state.state)
+
+    try:
+        return STATE_SIZE + len(state.as_json())
+    except (ValueError, TypeError):
+        return STATE_SIZE + len(state.state)
+
+
+class EntityHistory:
+    """States of a single entity, in the order they were recorded.
+
+    The states are kept in columns. Consecutive states with equal attributes
+    share them and state values are interned. Evicted states are only
+    dropped from the start of the columns in bulk, the last one is kept as
+    the state that was in effect before the cached period.
+    """
+
+    __slots__ = [
+        "entity_id",
+        "base",
+        "timestamps",
+        "sizes",
+        "states",
+        "attributes",
+        "last_changed",
+        "last_updated",
+        "contexts",
+        "offset",
+    ]
+
+    def __init__(self, entity_id: str, base: Optional[State]) -> None:
+        """Initialize the entity history."""
+        self.entity_id = entity_id
+        self.base = base
+        self.timestamps: "array[float]" = array("d")
+        self.sizes: "array[int]" = array("L")
+        self.states: List[str] = []
+        self.attributes: List[Optional[Mapping[str, Any]]] = []
+        self.last_changed: List[datetime] = []
+        self.last_updated: List[datetime] = []
+        self.contexts: List[Optional[Context]] = []
+        self.offset = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached states."""
+        return len(self.states) - self.offset
+
+    def append(self, timestamp: float, state: State) -> int:
+        """Add a state and return its estimated size."""
+        attributes: Mapping[str, Any] = state.attributes
+        shared = False
+        if len(self) > 0:
+            previous = self.attributes[-1]
+            if previous is not None and previous == attributes:
+                attributes = previous
+                shared = True
+
+        size = _state_size(state, shared)
+        self.timestamps.append(timestamp)
+        self.sizes.append(size)
+        self.states.append(sys.intern(state.state))
+        self.attributes.append(attributes)
+        self.last_updated.append(state.last_updated)
+        # Most states changed when they were updated, store the same object
+        self.last_changed.append(
+            state.last_updated
+            if state.last_changed == state.last_updated
+            else state.last_changed
+        )
+        self.contexts.append(state.context)
+        return size
+
+    def oldest_timestamp(self) -> float:
+        """Return the timestamp of the oldest cached state."""
+        return self.timestamps[self.offset]
+
+    def evict_oldest(self) -> int:
+        """Evict the oldest cached state and return its estimated size."""
+        idx = self.offset
+        self.base = self._state(idx)
+        self.attributes[idx] = None
+        self.contexts[idx] = None
+        self.offset += 1
+
+        size = self.sizes[idx]
+        if self.offset > COMPACT_THRESHOLD and self.offset * 2 > len(self.states):
+            del self.timestamps[: self.offset]
+            del self.sizes[: self.offset]
+            del self.states[: self.offset]
+            del self.attributes[: self.offset]
+            del self.last_changed[: self.offset]
+            del self.last_updated[: self.offset]
+            del self.contexts[: self.offset]
+            self.offset = 0
+
+        return size
+
+    def state_at(self, timestamp: float) -> Optional[State]:
+        """Return the state that was in effect just before timestamp."""
+        idx = bisect_left(self.timestamps, timestamp, self.offset)
+        if idx == self.offset:
+            return self.base
+        return self._state(idx - 1)
+
+    def states_between(self, start: float, end: Optional[float]) -> List[State]:
+        """Return the states recorded after start and before end."""
+        low = bisect_right(self.timestamps, start, self.offset)
+        if end is None:
+            high = len(self.states)
+        else:
+            high = bisect_left(self.timestamps, end, low)
+        return [self._state(idx) for idx in range(low, high)]
+
+    def _state(self, idx: int) -> State:
+        """Return the cached state at an index."""
+        return State(
+            self.entity_id,
+            self.states[idx],
+            self.attributes[idx],
+            self.last_changed[idx],
+            self.last_updated[idx],
+            self.contexts[idx],
+        )
+
+
+class HistoryCache:
+    """Bounded cache of the state changes seen by the recorder.
+
+    All state changes after ``covered_since`` are known, as well as the
+    state of every entity at that moment. Entries are evicted once they are
+    older than max_age or when the estimated size of the cached states
+    exceeds max_size bytes.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_age: timedelta, max_size: int) -> None:
+        """Initialize the history cache."""
+        self.hass = hass
+        self.max_age = max_age
+        self.max_size = max_size
+        self.size = 0
+        self.covered_since: Optional[datetime] = None
+        self._covered_since_ts = 0.0
+        self._last_timestamp = 0.0
+        self._entities: Dict[str, EntityHistory] = {}
+        # Entity ids of the cached states in the order they were recorded
+        self._order: Deque[str] = deque()
+        self._unsubs: List[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self, entity_filter: Callable[[str], bool]) -> None:
+        """Start caching the states that pass the recorder entity filter."""
+        now = dt_util.utcnow()
+
+        for state in self.hass.states.async_all():
+            if entity_filter(state.entity_id):
+                self._entities[state.entity_id] = EntityHistory(state.entity_id, state)
+
+        self.covered_since = now
+        self._covered_since_ts = self._last_timestamp = now.timestamp()
+
+        @callback
+        def event_filter(event: Event) -> bool:
+            """Only cache states that are recorded."""
+            return entity_filter(event.data["entity_id"])
+
+        self._unsubs.append(
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed, event_filter
+            )
+        )
+        self._unsubs.append(
+            async_track_time_interval(
+                self.hass, self._async_evict_expired, EVICT_INTERVAL
+            )
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop caching and clear the cache."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self.covered_since = None
+        self.size = 0
+        self._entities.clear()
+        self._order.clear()
+
+    @callback
+    def async_covers(self, point_in_time: datetime) -> bool:
+        """Return if the history after point_in_time is fully cached."""
+        return self.covered_since is not None and point_in_time >= self.covered_since
+
+    @callback
+    def async_entity_ids(self) -> List[str]:
+        """Return the ids of the entities with cached history."""
+        return list(self._entities)
+
+    @callback
+    def async_state_at(
+        self, entity_id: str, point_in_time: datetime
+    ) -> Optional[State]:
+        """Return the state of an entity just before point_in_time."""
+        history = self._entities.get(entity_id)
+        if history is None:
+            return None
+        return history.state_at(point_in_time.timestamp())
+
+    @callback
+    def async_states_between(
+        self, entity_id: str, start_time: datetime, end_time: Optional[datetime]
+    ) -> List[State]:
+        """Return the states of an entity recorded between two points in time."""
+        history = self._entities.get(entity_id)
+        if history is None:
+            return []
+        return history.states_between(
+            start_time.timestamp(), end_time.timestamp() if end_time else None
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a state change to the cache."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+
+        if new_state is None:
+            # The recorder stores the removal of an entity as an empty state
+            new_state = State(
+                entity_id, "", {}, event.time_fired, event.time_fired, event.context,
+            )
+
+        timestamp = new_state.last_updated.timestamp()
+
+        # Keep the arrays sorted if the clock jumps backwards
+        timestamp = self._last_timestamp = max(timestamp, self._last_timestamp)
+
+        history = self._entities.get(entity_id)
+        if history is None:
+            history = self._entities[entity_id] = EntityHistory(entity_id, None)
+
+        self.size += history.append(timestamp, new_state)
+        self._order.append(entity_id)
+
+        while self.size > self.max_size and self._order:
+            self._async_evict_oldest()
+
+    @callback
+    def _async_evict_expired(self, now: datetime) -> None:
+        """Evict the states that are older than max age."""
+        cutoff = (now - self.max_age).timestamp()
+        evicted = 0
+
+        while (
+            self._order and self._entities[self._order[0]].oldest_timestamp() <= cutoff
+        ):
+            self._async_evict_oldest()
+            evicted += 1
+
+        if evicted:
+            _LOGGER.debug(
+                "Evicted %d states, %d states of about %d bytes cached",
+                evicted,
+                len(self._order),
+                self.size,
+            )
+
+    @callback
+    def _async_evict_oldest(self) -> None:
+        """Evict the oldest cached state."""
+        entity_id = self._order.popleft()
+        history = self._entities[entity_id]
+        timestamp = history.oldest_timestamp()
+        self.size -= history.evict_oldest()
+
+        # States recorded at the evicted timestamp are now incomplete
+        if timestamp > self._covered_since_ts:
+            self._covered_since_ts = timestamp
+            self.covered_since = dt_util.utc_from_timestamp(timestamp)
@@ -1,8 +1,10 @@
 """Support for views."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
-from typing import List, Optional
+from types import GeneratorType
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 from aiohttp import web
 from aiohttp.web_exceptions import (
@@ -21,6 +23,9 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size of the chunks written by streaming JSON responses
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -62,6 +67,70 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    async def json_stream(
+        self, request: web.Request, job: Callable[..., Iterable[Any]], *args: Any
+    ) -> web.StreamResponse:
+        """Return a JSON array response streamed while it is generated.
+
+        The job is called with args and the items of the iterable it returns
+        are serialized one chunk at a time, in a thread of the response. The
+        next chunk is only produced once the previous one is written, so
+        memory use does not depend on the number of items and a slow client
+        does not hold a thread of the executor shared by the integrations.
+        """
+        hass = request.app[KEY_HASS]
+        # The job may hold a database connection that must stay in one thread
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="JSONStream")
+        items: Optional[Iterator[Any]] = None
+        chunks: Optional[Iterator[bytes]] = None
+
+        def next_chunk() -> Optional[bytes]:
+            """Serialize the next chunk, None once all were serialized."""
+            nonlocal items, chunks
+            if chunks is None:
+                items = iter(job(*args))
+                chunks = _json_array_chunks(items)
+            return next(chunks, None)
+
+        def close() -> None:
+            """Stop the job if the response was not completed."""
+            if isinstance(items, GeneratorType):
+                items.close()
+
+        response: Optional[web.StreamResponse] = None
+
+        try:
+            while True:
+                try:
+                    chunk = await hass.loop.run_in_executor(executor, next_chunk)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.error("Unable to stream JSON response: %s", err)
+                    if response is None:
+                        raise HTTPInternalServerError
+                    # Headers are sent, the client gets a truncated response
+                    return response
+
+                if chunk is None:
+                    break
+
+                if response is None:
+                    response = web.StreamResponse(
+                        headers={"Content-Type": CONTENT_TYPE_JSON}
+                    )
+                    response.enable_compression()
+                    await response.prepare(request)
+
+                await response.write(chunk)
+
+        finally:
+            executor.submit(close)
+            executor.shutdown(wait=False)
+
+        # The array brackets are always written
+        assert response is not None
+        await response.write_eof()
+        return response
+
     def json_message(self, message, status_code=200, message_code=None, headers=None):
         """Return a JSON message response."""
         data = {"message": message}
@@ -93,6 +162,31 @@ class HomeAssistantView:
             app["allow_cors"](route)
 
 
+def _json_array_chunks(items: Iterable[Any]) -> Iterator[bytes]:
+    """Serialize items into chunks of a JSON array."""
+    chunk = [b"["]
+    size = 0
+    first = True
+
+    for item in items:
+        if not first:
+            chunk.append(b",")
+        first = False
+        data = json.dumps(
+            item, sort_keys=True, cls=JSONEncoder, allow_nan=False
+        ).encode("UTF-8")
+        chunk.append(data)
+        size += len(data)
+
+        if size >= JSON_STREAM_CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+
+    chunk.append(b"]")
+    yield b"".join(chunk)
+
+
 def request_handler_factory(view, handler):
     """Wrap the handler classes."""
     assert asyncio.iscoroutinefunction(handler) or is_callback(
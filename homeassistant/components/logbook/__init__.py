@@ -2,9 +2,8 @@
 from datetime import timedelta
 from itertools import groupby
 import logging
-import time
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import false
 import voluptuous as vol
 
 from homeassistant.components import sun
@@ -17,11 +16,7 @@ from homeassistant.components.homekit.const import (
 )
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import Events, States
-from homeassistant.components.recorder.util import (
-    QUERY_RETRY_WAIT,
-    RETRIES,
-    session_scope,
-)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
@@ -181,13 +176,9 @@ class LogbookView(HomeAssistantView):
         end_day = start_day + timedelta(days=period)
         hass = request.app["hass"]
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(hass, self.config, start_day, end_day, entity_id)
-            )
-
-        return await hass.async_add_job(json_events)
+        return await self.json_stream(
+            request, _iter_events, hass, self.config, start_day, end_day, entity_id
+        )
 
 
 def humanify(hass, events):
@@ -379,32 +370,6 @@ def humanify(hass, events):
                 }
 
 
-def _get_related_entity_ids(session, entity_filter):
-    timer_start = time.perf_counter()
-
-    query = session.query(States).with_entities(States.entity_id).distinct()
-
-    for tryno in range(0, RETRIES):
-        try:
-            result = [row.entity_id for row in query if entity_filter(row.entity_id)]
-
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                elapsed = time.perf_counter() - timer_start
-                _LOGGER.debug(
-                    "fetching %d distinct domain/entity_id pairs took %fs",
-                    len(result),
-                    elapsed,
-                )
-
-            return result
-        except SQLAlchemyError as err:
-            _LOGGER.error("Error executing query: %s", err)
-
-            if tryno == RETRIES - 1:
-                raise
-            time.sleep(QUERY_RETRY_WAIT)
-
-
 def _generate_filter_from_config(config):
     excluded_entities = []
     excluded_domains = []
@@ -425,8 +390,63 @@ def _generate_filter_from_config(config):
     )
 
 
+def _generate_filter_query_from_config(config):
+    """Return the SQL equivalent of the configured entity filter.
+
+    Mirrors the cases of generate_filter on the States table, returns None
+    if all entities pass.
+    """
+    exclude = config.get(CONF_EXCLUDE, {})
+    include = config.get(CONF_INCLUDE, {})
+    include_d = set(include.get(CONF_DOMAINS, []))
+    include_e = set(include.get(CONF_ENTITIES, []))
+    exclude_d = set(exclude.get(CONF_DOMAINS, []))
+    exclude_e = set(exclude.get(CONF_ENTITIES, []))
+
+    have_include = bool(include_e or include_d)
+    have_exclude = bool(exclude_e or exclude_d)
+
+    def in_domains(domains):
+        return States.domain.in_(domains) if domains else false()
+
+    def in_entities(entities):
+        return States.entity_id.in_(entities) if entities else false()
+
+    # Case 1 - no includes or excludes - pass all entities
+    if not have_include and not have_exclude:
+        return None
+
+    # Case 2 - includes, no excludes - only include specified entities
+    if have_include and not have_exclude:
+        return in_entities(include_e) | in_domains(include_d)
+
+    # Case 3 - excludes, no includes - only exclude specified entities
+    if not have_include and have_exclude:
+        return ~in_entities(exclude_e) & ~in_domains(exclude_d)
+
+    # Case 4a - include domain specified
+    if include_d:
+        return (in_domains(include_d) & ~in_entities(exclude_e)) | (
+            ~in_domains(include_d) & in_entities(include_e)
+        )
+
+    # Case 4b - exclude domain specified
+    if exclude_d:
+        return (in_domains(exclude_d) & in_entities(include_e)) | (
+            ~in_domains(exclude_d) & ~in_entities(exclude_e)
+        )
+
+    # Case 4c - neither include or exclude domain specified
+    return in_entities(include_e)
+
+
 def _get_events(hass, config, start_day, end_day, entity_id=None):
     """Get events for a period of time."""
+    return list(_iter_events(hass, config, start_day, end_day, entity_id))
+
+
+def _iter_events(hass, config, start_day, end_day, entity_id=None):
+    """Yield the logbook entries for a period of time."""
     entities_filter = _generate_filter_from_config(config)
 
     def yield_events(query):
@@ -436,28 +456,28 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
             if _keep_event(event, entities_filter):
                 yield event
 
-    with session_scope(hass=hass) as session:
-        if entity_id is not None:
-            entity_ids = [entity_id.lower()]
-        else:
-            entity_ids = _get_related_entity_ids(session, entities_filter)
+    # Filter the state changes in the database instead of
+    # looking up all entity ids that pass the filter first
+    if entity_id is not None:
+        entity_filter_query = States.entity_id == entity_id.lower()
+    else:
+        entity_filter_query = _generate_filter_query_from_config(config)
 
+    states_query = States.last_updated == States.last_changed
+    if entity_filter_query is not None:
+        states_query &= entity_filter_query
+
+    with session_scope(hass=hass) as session:
         query = (
             session.query(Events)
             .order_by(Events.time_fired)
             .outerjoin(States, (Events.event_id == States.event_id))
             .filter(Events.event_type.in_(ALL_EVENT_TYPES))
             .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
-            .filter(
-                (
-                    (States.last_updated == States.last_changed)
-                    & States.entity_id.in_(entity_ids)
-                )
-                | (States.state_id.is_(None))
-            )
+            .filter(states_query | (States.state_id.is_(None)))
         )
 
-        return list(humanify(hass, yield_events(query)))
+        yield from humanify(hass, yield_events(query))
 
 
 def _keep_event(event, entities_filter):
@@ -10,8 +10,9 @@ import os
 import socket
 import ssl
 import sys
+import threading
 import time
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import attr
 import requests.certs
@@ -121,6 +122,9 @@ ATTR_RETAIN = CONF_RETAIN
 
 MAX_RECONNECT_WAIT = 300  # seconds
 
+# Log a warning when a subscription takes longer to handle a message
+SLOW_MESSAGE_CALLBACK = 0.1  # seconds
+
 CONNECTION_SUCCESS = "connection_success"
 CONNECTION_FAILED = "connection_failed"
 CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
@@ -762,12 +766,20 @@ class MQTT:
         # should be able to optionally rely on MQTT.
         # pylint: disable=import-outside-toplevel
         import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.broker = broker
         self.port = port
         self.keepalive = keepalive
         self.subscriptions: List[Subscription] = []
+        # Topic filter -> subscriptions, matched against incoming topics
+        self._matcher = MQTTMatcher()
+        # Messages received by the paho thread with the time they arrived,
+        # handed to the event loop in batches
+        self._inbound: List[Tuple[float, Any]] = []
+        self._inbound_lock = threading.Lock()
+        self._inbound_scheduled = False
         self.birth_message = birth_message
         self.connected = False
         self._mqttc: mqtt.Client = None
@@ -863,6 +875,10 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        try:
+            self._matcher[topic].append(subscription)
+        except KeyError:
+            self._matcher[topic] = [subscription]
 
         await self._async_perform_subscription(topic, qos)
 
@@ -873,10 +889,14 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            topic_subscriptions = self._matcher[topic]
+            topic_subscriptions.remove(subscription)
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
+            del self._matcher[topic]
+
             # Only unsubscribe if currently connected.
             if self.connected:
                 self.hass.async_create_task(self._async_unsubscribe(topic))
@@ -940,8 +960,42 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Only the first message of a batch wakes up the event loop.
+        """
+        with self._inbound_lock:
+            self._inbound.append((time.monotonic(), msg))
+            if self._inbound_scheduled:
+                return
+            self._inbound_scheduled = True
+
+        self.hass.loop.call_soon_threadsafe(self._async_handle_inbound)
+
+    @callback
+    def _async_handle_inbound(self) -> None:
+        """Handle the messages received since the last batch."""
+        with self._inbound_lock:
+            inbound = self._inbound
+            self._inbound = []
+            self._inbound_scheduled = False
+
+        start = time.monotonic()
+
+        for _, msg in inbound:
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                # Handle the rest of the batch
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Handled %d queued messages in %.3fs, oldest waited %.3fs",
+                len(inbound),
+                time.monotonic() - start,
+                start - inbound[0][0],
+            )
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -952,27 +1006,44 @@ class MQTT:
             msg.payload,
         )
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
+        # Callbacks may unsubscribe, don't iterate the matcher while calling them
+        subscriptions = [
+            subscription
+            for topic_subscriptions in self._matcher.iter_match(msg.topic)
+            for subscription in topic_subscriptions
+        ]
+
+        # Payloads are decoded once for every encoding, None if that failed
+        messages: Dict[Optional[str], Optional[Message]] = {}
+
+        for subscription in subscriptions:
+            encoding = subscription.encoding
+            if encoding in messages:
+                message = messages[encoding]
+            else:
+                message = messages[encoding] = _decode_message(msg, encoding)
+
+            if message is None:
+                _LOGGER.warning(
+                    "Can't decode payload %s on %s with encoding %s (for %s)",
+                    msg.payload,
+                    msg.topic,
+                    encoding,
+                    subscription.callback,
+                )
                 continue
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload,
-                        msg.topic,
-                        subscription.encoding,
-                        subscription.callback,
-                    )
-                    continue
-
-            self.hass.async_run_job(
-                subscription.callback, Message(msg.topic, payload, msg.qos, msg.retain)
-            )
+            start = time.monotonic()
+            self.hass.async_run_job(subscription.callback, message)
+            elapsed = time.monotonic() - start
+
+            if elapsed > SLOW_MESSAGE_CALLBACK:
+                _LOGGER.warning(
+                    "Handling message on %s by %s took %.3fs",
+                    msg.topic,
+                    subscription.callback,
+                    elapsed,
+                )
 
     def _mqtt_on_disconnect(self, _mqttc, _userdata, result_code: int) -> None:
         """Disconnected callback."""
@@ -1015,18 +1086,16 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
+def _decode_message(msg, encoding: Optional[str]) -> Optional[Message]:
+    """Return the message with its payload decoded, None if that fails."""
+    payload: SubscribePayloadType = msg.payload
+    if encoding is not None:
+        try:
+            payload = msg.payload.decode(encoding)
+        except (AttributeError, UnicodeDecodeError):
+            return None
 
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
+    return Message(msg.topic, payload, msg.qos, msg.retain)
 
 
 class MqttAttributes(Entity):
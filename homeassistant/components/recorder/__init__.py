@@ -1,6 +1,6 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime, timedelta
 import logging
@@ -38,7 +38,7 @@ import homeassistant.util.dt as dt_util
 
 from . import migration, purge
 from .const import DATA_INSTANCE
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,9 +64,21 @@ CONF_DB_URL = "db_url"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
+CONF_COMMIT_INTERVAL = "commit_interval"
+
+DEFAULT_COMMIT_INTERVAL = 1
+
+# Maximum number of events written in a single transaction
+MAX_COMMIT_EVENTS = 1000
+
+# Number of recently used shared attributes to remember the id of
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 
 CONNECT_RETRY_WAIT = 3
 
+# Returned by _get_event_batch when no shutdown or purge task ended the batch
+_NO_PENDING = object()
+
 FILTER_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_EXCLUDE, default={}): vol.Schema(
@@ -96,6 +108,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Coerce(int), vol.Range(min=0)
                 ),
                 vol.Optional(CONF_DB_URL): cv.string,
+                vol.Optional(
+                    CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
             }
         )
     },
@@ -133,6 +148,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config[DOMAIN]
     keep_days = conf.get(CONF_PURGE_KEEP_DAYS)
     purge_interval = conf.get(CONF_PURGE_INTERVAL)
+    commit_interval = conf.get(CONF_COMMIT_INTERVAL, DEFAULT_COMMIT_INTERVAL)
 
     db_url = conf.get(CONF_DB_URL, None)
     if not db_url:
@@ -147,6 +163,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         uri=db_url,
         include=include,
         exclude=exclude,
+        commit_interval=commit_interval,
     )
     instance.async_initialize()
     instance.start()
@@ -176,6 +193,7 @@ class Recorder(threading.Thread):
         uri: str,
         include: Dict,
         exclude: Dict,
+        commit_interval: float = DEFAULT_COMMIT_INTERVAL,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -183,6 +201,7 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.keep_days = keep_days
         self.purge_interval = purge_interval
+        self.commit_interval = commit_interval
         self.queue: Any = queue.Queue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -198,12 +217,17 @@ class Recorder(threading.Thread):
         )
         self.exclude_t = exclude.get(CONF_EVENT_TYPES, [])
 
+        # Serialized attributes -> attributes_id, in least recently used order
+        self.state_attributes_ids: OrderedDict = OrderedDict()
+
         self.get_session = None
 
     @callback
     def async_initialize(self):
         """Initialize the recorder."""
-        self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
+        self.hass.bus.async_listen(
+            MATCH_ALL, self.event_listener, self._async_event_filter
+        )
 
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
@@ -310,8 +334,14 @@ class Recorder(threading.Thread):
 
             self.hass.helpers.event.track_point_in_time(async_purge, run)
 
+        # Shutdown or purge task received while collecting a batch
+        pending = _NO_PENDING
+
         while True:
-            event = self.queue.get()
+            if pending is not _NO_PENDING:
+                event, pending = pending, _NO_PENDING
+            else:
+                event = self.queue.get()
 
             if event is None:
                 self._close_run()
@@ -319,70 +349,168 @@ class Recorder(threading.Thread):
                 self.queue.task_done()
                 return
             if isinstance(event, PurgeTask):
-                purge.purge_old_data(self, event.keep_days, event.repack)
-                self.queue.task_done()
-                continue
-            if event.event_type == EVENT_TIME_CHANGED:
+                # Purge in batches, requeue the task to continue after the
+                # events that were queued in the meantime are written.
+                if not purge.purge_old_data(self, event.keep_days, event.repack):
+                    self.queue.put(event)
                 self.queue.task_done()
                 continue
-            if event.event_type in self.exclude_t:
+
+            batch, pending = self._get_event_batch(event)
+            self._commit_events(batch)
+
+            # Only mark the events done once they are committed so
+            # block_till_done keeps waiting for the write.
+            for _ in batch:
                 self.queue.task_done()
+
+    def _get_event_batch(self, first_event):
+        """Collect the events that arrive within the commit interval.
+
+        Returns the batch and the shutdown or purge task that ended it early,
+        or _NO_PENDING if the commit interval or batch size ended it.
+        """
+        batch = [first_event]
+        deadline = time.monotonic() + self.commit_interval
+
+        while len(batch) < MAX_COMMIT_EVENTS:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    event = self.queue.get(timeout=timeout)
+                else:
+                    event = self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if event is None or isinstance(event, PurgeTask):
+                return batch, event
+
+            batch.append(event)
+
+        return batch, _NO_PENDING
+
+    def _commit_events(self, batch):
+        """Write a batch of events in a single transaction."""
+        tries = 1
+        updated = False
+        while not updated and tries <= 10:
+            if tries != 1:
+                time.sleep(CONNECT_RETRY_WAIT)
+            try:
+                with session_scope(session=self.get_session()) as session:
+                    self._add_events(session, batch)
+
+                updated = True
+
+            except exc.OperationalError as err:
+                # Attributes added in the failed transaction are gone
+                self.state_attributes_ids.clear()
+                _LOGGER.error(
+                    "Error in database connectivity: %s. (retrying in %s seconds)",
+                    err,
+                    CONNECT_RETRY_WAIT,
+                )
+                tries += 1
+
+            except exc.SQLAlchemyError:
+                self.state_attributes_ids.clear()
+                updated = True
+                _LOGGER.exception("Error saving %d events", len(batch))
+
+        if not updated:
+            _LOGGER.error(
+                "Error in database update. Could not save after %d tries. Giving up",
+                tries,
+            )
+
+    def _add_events(self, session, batch):
+        """Add events and their states to the session."""
+        added = []
+        for event in batch:
+            try:
+                dbevent = Events.from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
                 continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    self.queue.task_done()
-                    continue
-
-            tries = 1
-            updated = False
-            while not updated and tries <= 10:
-                if tries != 1:
-                    time.sleep(CONNECT_RETRY_WAIT)
+            dbstate = None
+            if event.event_type == EVENT_STATE_CHANGED:
                 try:
-                    with session_scope(session=self.get_session()) as session:
-                        try:
-                            dbevent = Events.from_event(event)
-                            session.add(dbevent)
-                            session.flush()
-                        except (TypeError, ValueError):
-                            _LOGGER.warning("Event is not JSON serializable: %s", event)
-
-                        if event.event_type == EVENT_STATE_CHANGED:
-                            try:
-                                dbstate = States.from_event(event)
-                                dbstate.event_id = dbevent.event_id
-                                session.add(dbstate)
-                            except (TypeError, ValueError):
-                                _LOGGER.warning(
-                                    "State is not JSON serializable: %s",
-                                    event.data.get("new_state"),
-                                )
-
-                    updated = True
-
-                except exc.OperationalError as err:
-                    _LOGGER.error(
-                        "Error in database connectivity: %s. "
-                        "(retrying in %s seconds)",
-                        err,
-                        CONNECT_RETRY_WAIT,
+                    dbstate = States.from_event(event)
+                except (TypeError, ValueError):
+                    _LOGGER.warning(
+                        "State is not JSON serializable: %s",
+                        event.data.get("new_state"),
                     )
-                    tries += 1
 
-                except exc.SQLAlchemyError:
-                    updated = True
-                    _LOGGER.exception("Error saving event: %s", event)
+            session.add(dbevent)
+            added.append((dbevent, dbstate))
 
-            if not updated:
-                _LOGGER.error(
-                    "Error in database update. Could not save "
-                    "after %d tries. Giving up",
-                    tries,
+        # Flush once to get the event ids, the states don't need their
+        # primary key back so they can be inserted with executemany.
+        session.flush()
+
+        dbstates = []
+        for dbevent, dbstate in added:
+            if dbstate is not None:
+                dbstate.event_id = dbevent.event_id
+                dbstate.attributes_id = self._get_attributes_id(
+                    session, dbstate.attributes
                 )
+                dbstate.attributes = None
+                dbstates.append(dbstate)
+
+        if dbstates:
+            session.bulk_save_objects(dbstates)
+
+    def _get_attributes_id(self, session, shared_attrs):
+        """Return the id of the shared attributes, adding them if needed."""
+        attributes_id = self.state_attributes_ids.get(shared_attrs)
+
+        if attributes_id is not None:
+            self.state_attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        row = (
+            session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attr_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .first()
+        )
+
+        if row is not None:
+            attributes_id = row[0]
+        else:
+            dbattrs = StateAttributes(hash=attr_hash, shared_attrs=shared_attrs)
+            session.add(dbattrs)
+            session.flush()
+            attributes_id = dbattrs.attributes_id
+
+        self.state_attributes_ids[shared_attrs] = attributes_id
+        if len(self.state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self.state_attributes_ids.popitem(last=False)
+
+        return attributes_id
+
+    @callback
+    def _async_event_filter(self, event):
+        """Return if an event should be recorded.
+
+        Runs inline when the event is fired so excluded events never reach
+        the queue.
+        """
+        if event.event_type == EVENT_TIME_CHANGED:
+            return False
+        if event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        if entity_id is not None:
+            return self.entity_filter(entity_id)
 
-            self.queue.task_done()
+        return True
 
     @callback
     def event_listener(self, event):
@@ -400,12 +528,14 @@ class Recorder(threading.Thread):
         # pylint: disable=unused-variable
         @listens_for(Engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set sqlite's WAL mode."""
+            """Set sqlite's WAL and incremental auto vacuum mode."""
             if isinstance(dbapi_connection, Connection):
                 old_isolation = dbapi_connection.isolation_level
                 dbapi_connection.isolation_level = None
                 cursor = dbapi_connection.cursor()
                 cursor.execute("PRAGMA journal_mode=WAL")
+                # Applies to new databases and existing ones after a repack
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
                 cursor.close()
                 dbapi_connection.isolation_level = old_isolation
 
@@ -249,8 +249,11 @@ def _apply_update(engine, new_version, old_version):
     elif new_version == 7:
         _create_index(engine, "states", "ix_states_entity_id")
     elif new_version == 8:
-        # Pending migration, want to group a few.
-        pass
+        # The state_attributes table is created by create_all. Existing rows
+        # keep their attributes column, new rows reference shared attributes.
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
+        # Pending migration, to be grouped with the next schema change.
         # _add_columns(engine, "events", [
         #     'context_parent_id CHARACTER(36)',
         # ])
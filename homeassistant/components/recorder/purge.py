@@ -1,42 +1,136 @@
 """Purge old data helper."""
 from datetime import timedelta
 import logging
+import time
 
+from sqlalchemy import exists
 from sqlalchemy.exc import SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, States
+from .models import Events, StateAttributes, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of rows deleted per transaction
+PURGE_BATCH_SIZE = 1000
+
+# SQLite auto_vacuum mode that allows freeing pages incrementally
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+
 
 def purge_old_data(instance, purge_days, repack):
-    """Purge events and states older than purge_days ago."""
+    """Purge events and states older than purge_days ago.
+
+    Only a single batch of rows is deleted per call so the recorder can
+    keep writing new events in between. Returns True when there is
+    nothing left to purge.
+    """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging events before %s", purge_before)
 
     try:
-        with session_scope(session=instance.get_session()) as session:
-            deleted_rows = (
-                session.query(States)
-                .filter((States.last_updated < purge_before))
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
+        # States reference events, so they are purged first
+        if _purge_batch(
+            instance, States, States.state_id, States.last_updated, purge_before
+        ):
+            return False
 
-            deleted_rows = (
-                session.query(Events)
-                .filter((Events.time_fired < purge_before))
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
+        if _purge_batch(
+            instance, Events, Events.event_id, Events.time_fired, purge_before
+        ):
+            return False
+
+        if _purge_unused_attributes(instance):
+            return False
 
         # Execute sqlite vacuum command to free up space on disk
         if repack and instance.engine.driver in ("pysqlite", "postgresql"):
-            _LOGGER.debug("Vacuuming SQL DB to free space")
-            instance.engine.execute("VACUUM")
+            _repack(instance)
 
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s.", err)
+
+    return True
+
+
+def _purge_batch(instance, table, id_column, time_column, purge_before):
+    """Delete a batch of rows older than purge_before.
+
+    The rows are selected through the index on the time column and deleted
+    by primary key. Returns the number of deleted rows.
+    """
+    start = time.perf_counter()
+
+    with session_scope(session=instance.get_session()) as session:
+        ids = [
+            row[0]
+            for row in session.query(id_column)
+            .filter(time_column < purge_before)
+            .limit(PURGE_BATCH_SIZE)
+        ]
+
+        if not ids:
+            return 0
+
+        deleted_rows = (
+            session.query(table)
+            .filter(id_column.in_(ids))
+            .delete(synchronize_session=False)
+        )
+
+    elapsed = time.perf_counter() - start
+    _LOGGER.debug(
+        "Deleted %s rows from %s in %.3fs (%.0f rows/s)",
+        deleted_rows,
+        table.__tablename__,
+        elapsed,
+        deleted_rows / elapsed if elapsed else deleted_rows,
+    )
+
+    return deleted_rows
+
+
+def _purge_unused_attributes(instance):
+    """Delete a batch of shared attributes no state refers to anymore.
+
+    Returns the number of deleted rows.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        ids = [
+            row[0]
+            for row in session.query(StateAttributes.attributes_id)
+            .filter(
+                ~exists().where(States.attributes_id == StateAttributes.attributes_id)
+            )
+            .limit(PURGE_BATCH_SIZE)
+        ]
+
+        if not ids:
+            return 0
+
+        deleted_rows = (
+            session.query(StateAttributes)
+            .filter(StateAttributes.attributes_id.in_(ids))
+            .delete(synchronize_session=False)
+        )
+
+    # The recorder must not hand out ids of deleted attributes
+    instance.state_attributes_ids.clear()
+    _LOGGER.debug("Deleted %s unused state attributes", deleted_rows)
+
+    return deleted_rows
+
+
+def _repack(instance):
+    """Free up disk space, incrementally if the database supports it."""
+    if instance.engine.driver == "pysqlite":
+        auto_vacuum = instance.engine.execute("PRAGMA auto_vacuum").scalar()
+        if auto_vacuum == SQLITE_AUTO_VACUUM_INCREMENTAL:
+            _LOGGER.debug("Incrementally vacuuming SQL DB to free space")
+            instance.engine.execute("PRAGMA incremental_vacuum")
+            return
+
+    _LOGGER.debug("Vacuuming SQL DB to free space")
+    instance.engine.execute("VACUUM")
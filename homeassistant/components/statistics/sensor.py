@@ -1,7 +1,11 @@
 """Support for statistics for sensor values."""
-from collections import deque
+from collections import Counter, deque
+from fractions import Fraction
+import heapq
+from itertools import chain
 import logging
-import statistics
+import math
+import sys
 
 import voluptuous as vol
 
@@ -64,6 +68,231 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
+def _isqrt(value):
+    """Return the integer square root of a non-negative integer."""
+    if value == 0:
+        return 0
+    root = 1 << ((value.bit_length() + 1) // 2)
+    while True:
+        next_root = (root + value // root) // 2
+        if next_root >= root:
+            return root
+        root = next_root
+
+
+def _sqrt_of_fraction(value):
+    """Return the square root of a fraction, correctly rounded to a float.
+
+    Like statistics.stdev, which takes the square root of the exact variance.
+    """
+    # Round to odd with more bits than a float holds, so converting the
+    # result to a float rounds it correctly
+    numerator, denominator = value.numerator, value.denominator
+    shift = (
+        numerator.bit_length()
+        - denominator.bit_length()
+        - 2 * sys.float_info.mant_dig
+        - 3
+    ) // 2
+    if shift >= 0:
+        denominator <<= 2 * shift
+    else:
+        numerator <<= -2 * shift
+    root = _isqrt(numerator // denominator)
+    root |= root * root * denominator != numerator
+    if shift >= 0:
+        return float(root << shift)
+    return root / (1 << -shift)
+
+
+class RunningMedian:
+    """Median of a window of values that values are added to and removed from.
+
+    The lower half of the values is kept in a max heap and the upper half in
+    a min heap. Removed values are dropped once they reach the top of their
+    heap. The heaps are rebuilt when they hold more removed values than
+    values in the window.
+    """
+
+    def __init__(self):
+        """Initialize the running median."""
+        # The lower half is negated to use heapq as a max heap
+        self._low = []
+        self._high = []
+        self._low_count = 0
+        self._high_count = 0
+        self._removed = Counter()
+        self._removed_count = 0
+
+    @property
+    def median(self):
+        """Return the median of the values, like statistics.median."""
+        if self._low_count > self._high_count:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def add(self, value):
+        """Add a value."""
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_count += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_count += 1
+
+        self._rebalance()
+
+    def remove(self, value):
+        """Remove a value that was added before."""
+        self._removed[value] += 1
+        self._removed_count += 1
+
+        if value <= -self._low[0]:
+            self._low_count -= 1
+            if value == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._high_count -= 1
+            if value == self._high[0]:
+                self._prune(self._high, 1)
+
+        self._rebalance()
+
+        if self._removed_count > self._low_count + self._high_count:
+            self._rebuild()
+
+    def _rebalance(self):
+        """Move values between the heaps until they hold half of the values."""
+        if self._low_count > self._high_count + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_count -= 1
+            self._high_count += 1
+            self._prune(self._low, -1)
+        elif self._low_count < self._high_count:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._low_count += 1
+            self._high_count -= 1
+            self._prune(self._high, 1)
+
+    def _prune(self, heap, sign):
+        """Drop the removed values from the top of a heap."""
+        removed = self._removed
+        while heap and sign * heap[0] in removed:
+            value = sign * heapq.heappop(heap)
+            self._removed_count -= 1
+            if removed[value] == 1:
+                del removed[value]
+            else:
+                removed[value] -= 1
+
+    def _rebuild(self):
+        """Rebuild the heaps from the values in the window."""
+        removed = self._removed
+        values = []
+        for value in chain((-value for value in self._low), self._high):
+            if removed[value]:
+                removed[value] -= 1
+            else:
+                values.append(value)
+
+        values.sort()
+        self._low_count = (len(values) + 1) // 2
+        self._high_count = len(values) - self._low_count
+        # Sorted lists are valid heaps
+        self._low = [-value for value in reversed(values[: self._low_count])]
+        self._high = values[self._low_count :]
+        self._removed = Counter()
+        self._removed_count = 0
+
+
+class RunningStatistics:
+    """Statistics of a window of values, updated as the window moves.
+
+    Values are removed in the order they were added. The sums are kept
+    exactly, so the results match those of the statistics module.
+    """
+
+    def __init__(self):
+        """Initialize the running statistics."""
+        self.count = 0
+        self._sum = Fraction(0)
+        self._sum_squares = Fraction(0)
+        self._median = RunningMedian()
+        # Candidates for the minimum and maximum, oldest first
+        self._minima = deque()
+        self._maxima = deque()
+
+    @property
+    def total(self):
+        """Return the sum of the values."""
+        return float(self._sum)
+
+    @property
+    def mean(self):
+        """Return the mean of at least one value."""
+        return float(self._sum / self.count)
+
+    @property
+    def median(self):
+        """Return the median of at least one value."""
+        return self._median.median
+
+    @property
+    def variance(self):
+        """Return the sample variance of at least two values."""
+        return float(self._exact_variance())
+
+    @property
+    def stdev(self):
+        """Return the sample standard deviation of at least two values."""
+        return _sqrt_of_fraction(self._exact_variance())
+
+    def _exact_variance(self):
+        """Return the exact sample variance as a fraction."""
+        count = self.count
+        return (count * self._sum_squares - self._sum ** 2) / (count * (count - 1))
+
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._minima[0]
+
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._maxima[0]
+
+    def append(self, value):
+        """Add a value to the end of the window."""
+        exact = Fraction(value)
+        self.count += 1
+        self._sum += exact
+        self._sum_squares += exact * exact
+        self._median.add(value)
+
+        while self._minima and self._minima[-1] > value:
+            self._minima.pop()
+        self._minima.append(value)
+
+        while self._maxima and self._maxima[-1] < value:
+            self._maxima.pop()
+        self._maxima.append(value)
+
+    def popleft(self, value):
+        """Remove the value at the start of the window."""
+        exact = Fraction(value)
+        self.count -= 1
+        self._sum -= exact
+        self._sum_squares -= exact * exact
+        self._median.remove(value)
+
+        if self._minima[0] == value:
+            self._minima.popleft()
+
+        if self._maxima[0] == value:
+            self._maxima.popleft()
+
+
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Statistics sensor."""
     entity_id = config.get(CONF_ENTITY_ID)
@@ -93,6 +322,7 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._stats = RunningStatistics()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -139,17 +369,36 @@ class StatisticsSensor(Entity):
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                value = new_state.state
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+                # Statistics of NaN or infinity are meaningless
+                if not math.isfinite(value):
+                    raise ValueError
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
                 new_state.state,
             )
+            return
+
+        if len(self.states) == self._sampling_size:
+            self._remove_oldest_state()
+
+        self.states.append(value)
+        self.ages.append(new_state.last_updated)
+
+        if not self.is_binary:
+            self._stats.append(value)
+
+    def _remove_oldest_state(self):
+        """Remove the oldest state from the queue."""
+        self.ages.popleft()
+        value = self.states.popleft()
+
+        if not self.is_binary:
+            self._stats.popleft(value)
 
     @property
     def name(self):
@@ -215,8 +464,7 @@ class StatisticsSensor(Entity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_state()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -236,24 +484,30 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            stats = self._stats
+
+            if stats.count >= 1:
+                self.mean = round(stats.mean, self._precision)
+                self.median = round(stats.median, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: mean requires at least one data point", self.entity_id
+                )
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if stats.count >= 2:
+                self.stdev = round(stats.stdev, self._precision)
+                self.variance = round(stats.variance, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: variance requires at least two data points", self.entity_id
+                )
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(stats.total, self._precision)
+                self.min = round(stats.min, self._precision)
+                self.max = round(stats.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
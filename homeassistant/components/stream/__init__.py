@@ -16,7 +16,11 @@ from .const import (
     ATTR_STREAMS,
     CONF_DURATION,
     CONF_LOOKBACK,
+    CONF_MAX_BUFFER_SIZE,
+    CONF_MAX_SEGMENTS,
     CONF_STREAM_SOURCE,
+    DEFAULT_MAX_BUFFER_SIZE,
+    DEFAULT_MAX_SEGMENTS,
     DOMAIN,
     SERVICE_RECORD,
 )
@@ -25,7 +29,21 @@ from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_MAX_SEGMENTS, default=DEFAULT_MAX_SEGMENTS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(
+                    CONF_MAX_BUFFER_SIZE, default=DEFAULT_MAX_BUFFER_SIZE
+                ): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -85,9 +103,17 @@ async def async_setup(hass, config):
     # pylint: disable=import-outside-toplevel
     from .recorder import async_setup_recorder
 
+    conf = config.get(DOMAIN) or {}
+
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
+    hass.data[DOMAIN][CONF_MAX_SEGMENTS] = conf.get(
+        CONF_MAX_SEGMENTS, DEFAULT_MAX_SEGMENTS
+    )
+    hass.data[DOMAIN][CONF_MAX_BUFFER_SIZE] = (
+        conf.get(CONF_MAX_BUFFER_SIZE, DEFAULT_MAX_BUFFER_SIZE) * 1024 * 1024
+    )
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
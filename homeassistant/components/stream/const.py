@@ -4,6 +4,8 @@ DOMAIN = "stream"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_LOOKBACK = "lookback"
 CONF_DURATION = "duration"
+CONF_MAX_SEGMENTS = "max_segments"
+CONF_MAX_BUFFER_SIZE = "max_buffer_size"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_STREAMS = "streams"
@@ -16,3 +18,8 @@ OUTPUT_FORMATS = ["hls"]
 FORMAT_CONTENT_TYPE = {"hls": "application/vnd.apple.mpegurl"}
 
 AUDIO_SAMPLE_RATE = 44100
+
+# Segments kept by a stream output to serve to its clients
+DEFAULT_MAX_SEGMENTS = 3
+# Memory the segments of a stream output may use, in megabytes
+DEFAULT_MAX_BUFFER_SIZE = 64
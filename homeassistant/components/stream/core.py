@@ -12,7 +12,14 @@ from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN
+from .const import (
+    ATTR_STREAMS,
+    CONF_MAX_BUFFER_SIZE,
+    CONF_MAX_SEGMENTS,
+    DEFAULT_MAX_BUFFER_SIZE,
+    DEFAULT_MAX_SEGMENTS,
+    DOMAIN,
+)
 
 PROVIDERS = Registry()
 
@@ -27,28 +34,38 @@ class StreamBuffer:
     astream = attr.ib(default=None)  # type=av.AudioStream
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class Segment:
-    """Represent a segment."""
+    """Represent a segment.
+
+    The muxed data is immutable and shared by every output and client.
+    """
 
     sequence = attr.ib(type=int)
-    segment = attr.ib(type=io.BytesIO)
+    segment = attr.ib(type=memoryview)
     duration = attr.ib(type=float)
 
 
 class StreamOutput:
     """Represents a stream output."""
 
-    num_segments = 3
+    num_segments = DEFAULT_MAX_SEGMENTS
 
     def __init__(self, stream, timeout: int = 300) -> None:
         """Initialize a stream output."""
         self.idle = False
         self.timeout = timeout
+        stream_data = stream.hass.data.get(DOMAIN, {})
+        self.num_segments = stream_data.get(CONF_MAX_SEGMENTS, self.num_segments)
+        self.max_buffer_size = stream_data.get(
+            CONF_MAX_BUFFER_SIZE, DEFAULT_MAX_BUFFER_SIZE * 1024 * 1024
+        )
+        # Size in bytes of the buffered segments
+        self.buffer_size = 0
         self._stream = stream
         self._cursor = None
         self._event = asyncio.Event()
-        self._segments = deque(maxlen=self.num_segments)
+        self._segments = deque()
         self._unsub = None
 
     @property
@@ -129,9 +146,22 @@ class StreamOutput:
             return
 
         self._segments.append(segment)
+        self.buffer_size += segment.segment.nbytes
+        self._evict_segments()
         self._event.set()
         self._event.clear()
 
+    def _evict_segments(self) -> None:
+        """Evict the oldest segments that don't fit in the ring buffer.
+
+        The latest segment is always kept.
+        """
+        while len(self._segments) > 1 and (
+            len(self._segments) > self.num_segments
+            or self.buffer_size > self.max_buffer_size
+        ):
+            self.buffer_size -= self._segments.popleft().segment.nbytes
+
     @callback
     def _timeout(self, _now=None):
         """Handle stream timeout."""
@@ -144,7 +174,8 @@ class StreamOutput:
 
     def cleanup(self):
         """Handle cleanup."""
-        self._segments = deque(maxlen=self.num_segments)
+        self._segments = deque()
+        self.buffer_size = 0
         self._stream.remove_provider(self)
 
 
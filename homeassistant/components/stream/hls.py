@@ -51,7 +51,8 @@ class HlsSegmentView(StreamView):
         if not segment:
             return web.HTTPNotFound()
         headers = {"Content-Type": "video/mp2t"}
-        return web.Response(body=segment.segment.getvalue(), headers=headers)
+        # The shared segment data is sent without copying it
+        return web.Response(body=segment.segment, headers=headers)
 
 
 class M3U8Renderer:
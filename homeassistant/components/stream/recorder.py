@@ -1,5 +1,6 @@
 """Provide functionality to record stream."""
 
+import io
 import threading
 from typing import List
 
@@ -21,9 +22,8 @@ def recorder_save_worker(file_out: str, segments: List[Segment]):
     output_v = None
 
     for segment in segments:
-        # Seek to beginning and open segment
-        segment.segment.seek(0)
-        source = av.open(segment.segment, "r", format="mpegts")
+        # Open segment
+        source = av.open(io.BytesIO(segment.segment), "r", format="mpegts")
         source_v = source.streams.video[0]
 
         # Add output streams
@@ -74,6 +74,10 @@ class RecorderOutput(StreamOutput):
         own_segments = self.segments
         segments = [s for s in segments if s.sequence not in own_segments]
         self._segments = segments + self._segments
+        self.buffer_size += sum(segment.segment.nbytes for segment in segments)
+
+    def _evict_segments(self) -> None:
+        """Keep all segments of the recording."""
 
     @callback
     def _timeout(self, _now=None):
@@ -91,4 +95,5 @@ class RecorderOutput(StreamOutput):
         thread.start()
 
         self._segments = []
+        self.buffer_size = 0
         self._stream.remove_provider(self)
@@ -43,6 +43,14 @@ def create_stream_buffer(stream_output, video_stream, audio_frame):
     return (a_packet, StreamBuffer(segment, output, vstream, astream))
 
 
+def _output_key(stream_output):
+    """Return the container settings of a stream output.
+
+    Outputs with the same settings share the muxed segments.
+    """
+    return (stream_output.format, stream_output.audio_codec)
+
+
 def stream_worker(hass, stream, quit_event):
     """Handle consuming streams."""
 
@@ -56,7 +64,7 @@ def stream_worker(hass, stream, quit_event):
     audio_frame = generate_audio_frame()
 
     first_packet = True
-    # Holds the buffers for each stream provider
+    # Holds the buffers for each set of output container settings
     outputs = {}
     # Keep track of the number of segments we've processed
     sequence = 1
@@ -77,8 +85,9 @@ def stream_worker(hass, stream, quit_event):
                 raise StopIteration("No dts in packet")
         except (av.AVError, StopIteration) as ex:
             # End of stream, clear listeners and stop thread
-            for fmt, _ in outputs.items():
-                hass.loop.call_soon_threadsafe(stream.outputs[fmt].put, None)
+            for stream_output in list(stream.outputs.values()):
+                if _output_key(stream_output) in outputs:
+                    hass.loop.call_soon_threadsafe(stream_output.put, None)
             _LOGGER.error("Error demuxing stream: %s", str(ex))
             break
 
@@ -99,14 +108,19 @@ def stream_worker(hass, stream, quit_event):
             # each segment is, assuming the stream starts from 0.
             segment_duration = (packet.pts * packet.time_base) / sequence
             # Save segment to outputs
-            for fmt, buffer in outputs.items():
+            segments = {}
+            for key, buffer in outputs.items():
                 buffer.output.close()
                 del audio_packets[buffer.astream]
-                if stream.outputs.get(fmt):
-                    hass.loop.call_soon_threadsafe(
-                        stream.outputs[fmt].put,
-                        Segment(sequence, buffer.segment, segment_duration),
-                    )
+                # Usually returns the buffer of the BytesIO without copying it
+                segments[key] = Segment(
+                    sequence, memoryview(buffer.segment.getvalue()), segment_duration
+                )
+
+            for stream_output in list(stream.outputs.values()):
+                segment = segments.get(_output_key(stream_output))
+                if segment is not None:
+                    hass.loop.call_soon_threadsafe(stream_output.put, segment)
 
             # Clear outputs and increment sequence
             outputs = {}
@@ -114,15 +128,16 @@ def stream_worker(hass, stream, quit_event):
                 sequence += 1
 
             # Initialize outputs
-            for stream_output in stream.outputs.values():
-                if video_stream.name != stream_output.video_codec:
+            for stream_output in list(stream.outputs.values()):
+                key = _output_key(stream_output)
+                if video_stream.name != stream_output.video_codec or key in outputs:
                     continue
 
                 a_packet, buffer = create_stream_buffer(
                     stream_output, video_stream, audio_frame
                 )
                 audio_packets[buffer.astream] = a_packet
-                outputs[stream_output.name] = buffer
+                outputs[key] = buffer
 
         # First video packet tends to have a weird dts/pts
         if first_packet:
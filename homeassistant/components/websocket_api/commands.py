@@ -1,4 +1,6 @@
 """Commands part of Websocket API."""
+from typing import List
+
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import POLICY_READ
@@ -37,11 +39,17 @@ def pong_message(iden):
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("domain"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("batch_interval"): vol.All(vol.Coerce(int), vol.Range(min=1)),
     }
 )
 def handle_subscribe_events(hass, connection, msg):
     """Handle subscribe events command.
 
+    Events can be limited to the events of entity ids or domains. With a
+    batch interval in milliseconds, the events are sent in batches.
+
     Async friendly.
     """
     # Circular dep
@@ -53,35 +61,96 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
+    keys = msg.get("entity_id", []) + msg.get("domain", [])
+
+    if keys and event_type == MATCH_ALL:
+        raise vol.Invalid("Filtering by entity_id or domain requires an event_type")
+
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
+        def event_filter(event):
+            """Filter state changed events the user is not allowed to read."""
+            return connection.user.permissions.check_entity(
                 event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event))
+            )
 
     else:
 
         @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
+        def event_filter(event):
+            """Filter out time changed events."""
+            return event.event_type != EVENT_TIME_CHANGED
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+    forward_events, cancel_forward = _async_event_forwarder(
+        hass, connection, msg["id"], msg.get("batch_interval")
     )
 
+    if keys:
+        unsub = hass.bus.async_listen_keyed(
+            event_type, keys, forward_events, event_filter
+        )
+    else:
+        unsub = hass.bus.async_listen(event_type, forward_events, event_filter)
+
+    @callback
+    def unsubscribe():
+        """Stop forwarding events."""
+        unsub()
+        cancel_forward()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+def _async_event_forwarder(hass, connection, iden, batch_interval):
+    """Return a listener forwarding events and a callback to cancel it.
+
+    With a batch interval, the events are collected and sent in a single
+    message once the interval passed since the first pending event.
+    """
+    pending: List[str] = []
+    flush_handle = None
+
+    @callback
+    def flush_events():
+        """Send the pending events."""
+        nonlocal flush_handle
+        flush_handle = None
+        connection.send_message(messages.batched_event_message_json(iden, pending))
+        pending.clear()
+
+    @callback
+    def forward_events(event):
+        """Forward events to websocket."""
+        nonlocal flush_handle
+
+        try:
+            dumped_event = event.as_json()
+        except (ValueError, TypeError) as err:
+            connection.logger.error("Unable to serialize to JSON: %s\n%s", err, event)
+            return
+
+        if batch_interval is None:
+            connection.send_message(messages.event_message_json(iden, dumped_event))
+            return
+
+        pending.append(dumped_event)
+
+        if flush_handle is None:
+            flush_handle = hass.loop.call_later(batch_interval / 1000, flush_events)
+
+    @callback
+    def cancel_forward():
+        """Drop the pending events."""
+        if flush_handle is not None:
+            flush_handle.cancel()
+
+    return forward_events, cancel_forward
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -178,7 +247,14 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        dumped_states = "[{}]".format(", ".join(state.as_json() for state in states))
+    except (ValueError, TypeError):
+        # Let the writer report the state that can't be serialized
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(messages.result_message_json(msg["id"], dumped_states))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -1,4 +1,5 @@
 """Message templates for websocket commands."""
+from typing import Iterable
 
 import voluptuous as vol
 
@@ -36,3 +37,23 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def event_message_json(iden: int, dumped_event: str) -> str:
+    """Return an event message with an event serialized to JSON."""
+    return f'{{"id": {iden}, "type": "event", "event": {dumped_event}}}'
+
+
+def result_message_json(iden: int, dumped_result: str) -> str:
+    """Return a success result message with a result serialized to JSON."""
+    return (
+        f'{{"id": {iden}, "type": "{const.TYPE_RESULT}", "success": true, '
+        f'"result": {dumped_result}}}'
+    )
+
+
+def batched_event_message_json(iden: int, dumped_events: Iterable[str]) -> str:
+    """Return an event message with a batch of events serialized to JSON."""
+    return '{{"id": {}, "type": "event", "events": [{}]}}'.format(
+        iden, ", ".join(dumped_events)
+    )
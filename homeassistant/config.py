@@ -54,6 +54,7 @@ from homeassistant.requirements import (
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml.loader import YamlCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,6 +62,7 @@ DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
+DATA_YAML_CACHE = "yaml_cache"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
@@ -300,23 +302,32 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
+    yaml_cache = hass.data.get(DATA_YAML_CACHE)
+    if yaml_cache is None:
+        yaml_cache = hass.data[DATA_YAML_CACHE] = YamlCache()
+
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE), yaml_cache
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
-def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
+def load_yaml_config_file(
+    config_path: str, yaml_cache: Optional[YamlCache] = None
+) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path)
+    if yaml_cache is None:
+        conf_dict = load_yaml(config_path)
+    else:
+        conf_dict = yaml_cache.load_yaml(config_path)
 
     if not isinstance(conf_dict, dict):
         msg = "The configuration file {} does not contain a dictionary".format(
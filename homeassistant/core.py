@@ -9,6 +9,7 @@ from concurrent.futures import ThreadPoolExecutor
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -22,10 +23,12 @@ from typing import (
     Callable,
     Coroutine,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
     Set,
+    Tuple,
     TypeVar,
 )
 import uuid
@@ -37,6 +40,7 @@ import voluptuous as vol
 from homeassistant import loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -66,6 +70,7 @@ from homeassistant.exceptions import (
 from homeassistant.util import location, slugify
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSONEncoder
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 
 # Typing imports that create a circular dependency
@@ -98,6 +103,11 @@ TIMEOUT_EVENT_START = 15
 _LOGGER = logging.getLogger(__name__)
 
 
+def _json_dumps(data: Dict) -> str:
+    """Serialize a state or event to JSON."""
+    return json.dumps(data, cls=JSONEncoder, allow_nan=False)
+
+
 def split_entity_id(entity_id: str) -> List[str]:
     """Split a state entity_id into domain, object_id."""
     return entity_id.split(".", 1)
@@ -458,14 +468,22 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = [
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict",
+        "_as_json",
+    ]
 
     def __init__(
         self,
         event_type: str,
         data: Optional[Dict] = None,
         origin: EventOrigin = EventOrigin.local,
-        time_fired: Optional[int] = None,
+        time_fired: Optional[datetime.datetime] = None,
         context: Optional[Context] = None,
     ) -> None:
         """Initialize a new event."""
@@ -474,19 +492,38 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_dict: Optional[Dict] = None
+        self._as_json: Optional[str] = None
 
     def as_dict(self) -> Dict:
         """Create a dict representation of this Event.
 
+        The representation is created once, the nested data is shared by
+        all calls and must not be modified.
+
         Async friendly.
         """
-        return {
-            "event_type": self.event_type,
-            "data": dict(self.data),
-            "origin": str(self.origin),
-            "time_fired": self.time_fired,
-            "context": self.context.as_dict(),
-        }
+        if self._as_dict is None:
+            self._as_dict = {
+                "event_type": self.event_type,
+                "data": dict(self.data),
+                "origin": str(self.origin),
+                "time_fired": self.time_fired,
+                "context": self.context.as_dict(),
+            }
+        return dict(self._as_dict)
+
+    def as_json(self) -> str:
+        """Return this Event serialized to JSON.
+
+        The event is serialized once. Raises ValueError or TypeError if
+        it can't be serialized.
+
+        Async friendly.
+        """
+        if self._as_json is None:
+            self._as_json = _json_dumps(self.as_dict())
+        return self._as_json
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -510,12 +547,19 @@ class Event:
         )
 
 
+# A listener together with its optional event filter
+_ListenerType = Tuple[Callable, Optional[Callable[[Event], bool]]]
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[str, List[_ListenerType]] = {}
+        # event_type -> entity_id or domain -> listeners
+        self._keyed_listeners: Dict[str, Dict[str, List[_ListenerType]]] = {}
+        self._keyed_listener_count: Dict[str, int] = {}
         self._hass = hass
 
     @callback
@@ -524,7 +568,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key]) for key in self._listeners}
+        listeners = {key: len(self._listeners[key]) for key in self._listeners}
+        for key, count in self._keyed_listener_count.items():
+            listeners[key] = listeners.get(key, 0) + count
+        return listeners
 
     @property
     def listeners(self) -> Dict[str, int]:
@@ -564,6 +611,12 @@ class EventBus:
         if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        keyed_listeners = self._keyed_listeners.get(event_type)
+        if keyed_listeners is not None and event_data:
+            listeners = listeners + _async_match_keyed_listeners(
+                keyed_listeners, event_data.get(ATTR_ENTITY_ID)
+            )
+
         event = Event(event_type, event_data, origin, None, context)
 
         if event_type != EVENT_TIME_CHANGED:
@@ -572,7 +625,14 @@ class EventBus:
         if not listeners:
             return
 
-        for func in listeners:
+        for func, event_filter in listeners:
+            if event_filter is not None:
+                try:
+                    if not event_filter(event):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in event filter %s", event_filter)
+                    continue
             self._hass.async_add_job(func, event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
@@ -592,22 +652,74 @@ class EventBus:
         return remove_listener
 
     @callback
-    def async_listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        event_filter: Optional[Callable[[Event], bool]] = None,
+    ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
         To listen to all events specify the constant ``MATCH_ALL``
         as event_type.
 
+        An optional event_filter, which must be a callback, is called
+        inline when the event is fired. The listener is only scheduled if
+        the filter returns True.
+
         This method must be run in the event loop.
         """
+        entry = (listener, _async_check_event_filter(event_filter))
+
         if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
+            self._listeners[event_type].append(entry)
         else:
-            self._listeners[event_type] = [listener]
+            self._listeners[event_type] = [entry]
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_listener(event_type, entry)
+
+        return remove_listener
+
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: Iterable[str],
+        listener: Callable,
+        event_filter: Optional[Callable[[Event], bool]] = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type concerning specific entities.
+
+        Keys are entity ids or domains. The listener is only called for
+        events whose ``entity_id`` data matches one of the keys, which is
+        looked up in an index instead of calling every listener.
 
+        This method must be run in the event loop.
+        """
+        keys = tuple({key.lower() for key in keys})
+        entry = (listener, _async_check_event_filter(event_filter))
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(entry)
+
+        self._keyed_listener_count[event_type] = (
+            self._keyed_listener_count.get(event_type, 0) + 1
+        )
+
+        removed = False
+
+        @callback
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, listener)
+            nonlocal removed
+            if removed:
+                _LOGGER.warning("Unable to remove unknown listener %s", listener)
+                return
+            removed = True
+            self._async_remove_keyed_listener(event_type, keys, entry)
 
         return remove_listener
 
@@ -652,19 +764,19 @@ class EventBus:
             # multiple times as well.
             # This will make sure the second time it does nothing.
             setattr(onetime_listener, "run", True)
-            self._async_remove_listener(event_type, onetime_listener)
+            self._async_remove_listener(event_type, (onetime_listener, None))
             self._hass.async_run_job(listener, event)
 
         return self.async_listen(event_type, onetime_listener)
 
     @callback
-    def _async_remove_listener(self, event_type: str, listener: Callable) -> None:
+    def _async_remove_listener(self, event_type: str, entry: _ListenerType) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(listener)
+            self._listeners[event_type].remove(entry)
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -672,7 +784,62 @@ class EventBus:
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
-            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+            _LOGGER.warning("Unable to remove unknown listener %s", entry[0])
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, keys: Iterable[str], entry: _ListenerType
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners[event_type]
+
+        for key in keys:
+            key_listeners = keyed_listeners[key]
+            key_listeners.remove(entry)
+            if not key_listeners:
+                keyed_listeners.pop(key)
+
+        self._keyed_listener_count[event_type] -= 1
+        if not self._keyed_listener_count[event_type]:
+            self._keyed_listener_count.pop(event_type)
+            self._keyed_listeners.pop(event_type)
+
+
+def _async_check_event_filter(
+    event_filter: Optional[Callable[[Event], bool]]
+) -> Optional[Callable[[Event], bool]]:
+    """Validate that an event filter can be run inside the event loop."""
+    if event_filter is not None and not is_callback(event_filter):
+        raise HomeAssistantError(
+            f"Event filter {event_filter} is not decorated with @callback"
+        )
+    return event_filter
+
+
+def _async_match_keyed_listeners(
+    keyed_listeners: Dict[str, List[_ListenerType]], entity_id: Any
+) -> List[_ListenerType]:
+    """Return the keyed listeners matching an entity id or its domain."""
+    if not isinstance(entity_id, str):
+        return []
+
+    entity_id = entity_id.lower()
+    entity_listeners = keyed_listeners.get(entity_id)
+    domain_listeners = keyed_listeners.get(entity_id.partition(".")[0])
+
+    if domain_listeners is None:
+        return entity_listeners or []
+
+    if entity_listeners is None:
+        return domain_listeners
+
+    # A listener registered for both the entity and its domain runs once
+    return entity_listeners + [
+        entry for entry in domain_listeners if entry not in entity_listeners
+    ]
 
 
 class State:
@@ -693,6 +860,8 @@ class State:
         "last_changed",
         "last_updated",
         "context",
+        "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -728,6 +897,8 @@ class State:
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
+        self._as_dict: Optional[Dict] = None
+        self._as_json: Optional[str] = None
 
     @property
     def domain(self) -> str:
@@ -753,15 +924,32 @@ class State:
 
         To be used for JSON serialization.
         Ensures: state == State.from_dict(state.as_dict())
+
+        The representation is created once, the nested attributes are
+        shared by all calls and must not be modified.
         """
-        return {
-            "entity_id": self.entity_id,
-            "state": self.state,
-            "attributes": dict(self.attributes),
-            "last_changed": self.last_changed,
-            "last_updated": self.last_updated,
-            "context": self.context.as_dict(),
-        }
+        if self._as_dict is None:
+            self._as_dict = {
+                "entity_id": self.entity_id,
+                "state": self.state,
+                "attributes": dict(self.attributes),
+                "last_changed": self.last_changed,
+                "last_updated": self.last_updated,
+                "context": self.context.as_dict(),
+            }
+        return dict(self._as_dict)
+
+    def as_json(self) -> str:
+        """Return the State serialized to JSON.
+
+        The state is serialized once. Raises ValueError or TypeError if it
+        can't be serialized.
+
+        Async friendly.
+        """
+        if self._as_json is None:
+            self._as_json = _json_dumps(self.as_dict())
+        return self._as_json
 
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
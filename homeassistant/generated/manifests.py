@@ -0,0 +1,10206 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+MANIFESTS = {
+    "abode": {
+        "domain": "abode",
+        "name": "Abode",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/abode",
+        "requirements": [
+            "abodepy==0.17.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@shred86"
+        ]
+    },
+    "acer_projector": {
+        "domain": "acer_projector",
+        "name": "Acer Projector",
+        "documentation": "https://www.home-assistant.io/integrations/acer_projector",
+        "requirements": [
+            "pyserial==3.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "actiontec": {
+        "domain": "actiontec",
+        "name": "Actiontec",
+        "documentation": "https://www.home-assistant.io/integrations/actiontec",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "adguard": {
+        "domain": "adguard",
+        "name": "AdGuard Home",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/adguard",
+        "requirements": [
+            "adguardhome==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@frenck"
+        ]
+    },
+    "ads": {
+        "domain": "ads",
+        "name": "ADS",
+        "documentation": "https://www.home-assistant.io/integrations/ads",
+        "requirements": [
+            "pyads==3.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "aftership": {
+        "domain": "aftership",
+        "name": "AfterShip",
+        "documentation": "https://www.home-assistant.io/integrations/aftership",
+        "requirements": [
+            "pyaftership==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "air_quality": {
+        "domain": "air_quality",
+        "name": "Air Quality",
+        "documentation": "https://www.home-assistant.io/integrations/air_quality",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "airly": {
+        "domain": "airly",
+        "name": "Airly",
+        "documentation": "https://www.home-assistant.io/integrations/airly",
+        "dependencies": [],
+        "codeowners": [
+            "@bieniu"
+        ],
+        "requirements": [
+            "airly==0.0.2"
+        ],
+        "config_flow": True
+    },
+    "airvisual": {
+        "domain": "airvisual",
+        "name": "AirVisual",
+        "documentation": "https://www.home-assistant.io/integrations/airvisual",
+        "requirements": [
+            "pyairvisual==3.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "aladdin_connect": {
+        "domain": "aladdin_connect",
+        "name": "Aladdin Connect",
+        "documentation": "https://www.home-assistant.io/integrations/aladdin_connect",
+        "requirements": [
+            "aladdin_connect==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "alarm_control_panel": {
+        "domain": "alarm_control_panel",
+        "name": "Alarm Control Panel",
+        "documentation": "https://www.home-assistant.io/integrations/alarm_control_panel",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "alarmdecoder": {
+        "domain": "alarmdecoder",
+        "name": "AlarmDecoder",
+        "documentation": "https://www.home-assistant.io/integrations/alarmdecoder",
+        "requirements": [
+            "alarmdecoder==1.13.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "alarmdotcom": {
+        "domain": "alarmdotcom",
+        "name": "Alarm.com",
+        "documentation": "https://www.home-assistant.io/integrations/alarmdotcom",
+        "requirements": [
+            "pyalarmdotcom==0.3.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "alert": {
+        "domain": "alert",
+        "name": "Alert",
+        "documentation": "https://www.home-assistant.io/integrations/alert",
+        "requirements": [],
+        "dependencies": [],
+        "after_dependencies": [
+            "notify"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "alexa": {
+        "domain": "alexa",
+        "name": "Amazon Alexa",
+        "documentation": "https://www.home-assistant.io/integrations/alexa",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud",
+            "@ochlocracy"
+        ]
+    },
+    "almond": {
+        "domain": "almond",
+        "name": "Almond",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/almond",
+        "dependencies": [
+            "http",
+            "conversation"
+        ],
+        "codeowners": [
+            "@gcampax",
+            "@balloob"
+        ],
+        "requirements": [
+            "pyalmond==0.0.2"
+        ]
+    },
+    "alpha_vantage": {
+        "domain": "alpha_vantage",
+        "name": "Alpha Vantage",
+        "documentation": "https://www.home-assistant.io/integrations/alpha_vantage",
+        "requirements": [
+            "alpha_vantage==2.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "amazon_polly": {
+        "domain": "amazon_polly",
+        "name": "Amazon Polly",
+        "documentation": "https://www.home-assistant.io/integrations/amazon_polly",
+        "requirements": [
+            "boto3==1.9.252"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "ambiclimate": {
+        "domain": "ambiclimate",
+        "name": "Ambiclimate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambiclimate",
+        "requirements": [
+            "ambiclimate==0.2.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "ambient_station": {
+        "domain": "ambient_station",
+        "name": "Ambient Weather Station",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambient_station",
+        "requirements": [
+            "aioambient==1.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "amcrest": {
+        "domain": "amcrest",
+        "name": "Amcrest",
+        "documentation": "https://www.home-assistant.io/integrations/amcrest",
+        "requirements": [
+            "amcrest==1.5.6"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@pnbruckner"
+        ]
+    },
+    "ampio": {
+        "domain": "ampio",
+        "name": "Ampio Smart Smog System",
+        "documentation": "https://www.home-assistant.io/integrations/ampio",
+        "requirements": [
+            "asmog==0.0.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "android_ip_webcam": {
+        "domain": "android_ip_webcam",
+        "name": "Android IP Webcam",
+        "documentation": "https://www.home-assistant.io/integrations/android_ip_webcam",
+        "requirements": [
+            "pydroid-ipcam==0.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "androidtv": {
+        "domain": "androidtv",
+        "name": "Android TV",
+        "documentation": "https://www.home-assistant.io/integrations/androidtv",
+        "requirements": [
+            "adb-shell==0.1.1",
+            "androidtv==0.0.39",
+            "pure-python-adb==0.2.2.dev0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@JeffLIrion"
+        ]
+    },
+    "anel_pwrctrl": {
+        "domain": "anel_pwrctrl",
+        "name": "Anel NET-PwrCtrl",
+        "documentation": "https://www.home-assistant.io/integrations/anel_pwrctrl",
+        "requirements": [
+            "anel_pwrctrl-homeassistant==0.0.1.dev2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "anthemav": {
+        "domain": "anthemav",
+        "name": "Anthem A/V Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/anthemav",
+        "requirements": [
+            "anthemav==1.1.10"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "apache_kafka": {
+        "domain": "apache_kafka",
+        "name": "Apache Kafka",
+        "documentation": "https://www.home-assistant.io/integrations/apache_kafka",
+        "requirements": [
+            "aiokafka==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "apcupsd": {
+        "domain": "apcupsd",
+        "name": "APCUPSd",
+        "documentation": "https://www.home-assistant.io/integrations/apcupsd",
+        "requirements": [
+            "apcaccess==0.0.13"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "api": {
+        "domain": "api",
+        "name": "Home Assistant API",
+        "documentation": "https://www.home-assistant.io/integrations/api",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "apns": {
+        "domain": "apns",
+        "name": "Apple Push Notification Service (APNS)",
+        "documentation": "https://www.home-assistant.io/integrations/apns",
+        "requirements": [
+            "apns2==0.3.0"
+        ],
+        "dependencies": [],
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "codeowners": []
+    },
+    "apple_tv": {
+        "domain": "apple_tv",
+        "name": "Apple TV",
+        "documentation": "https://www.home-assistant.io/integrations/apple_tv",
+        "requirements": [
+            "pyatv==0.3.13"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "apprise": {
+        "domain": "apprise",
+        "name": "Apprise",
+        "documentation": "https://www.home-assistant.io/integrations/apprise",
+        "requirements": [
+            "apprise==0.8.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@caronc"
+        ]
+    },
+    "aprs": {
+        "domain": "aprs",
+        "name": "APRS",
+        "documentation": "https://www.home-assistant.io/integrations/aprs",
+        "dependencies": [],
+        "codeowners": [
+            "@PhilRW"
+        ],
+        "requirements": [
+            "aprslib==0.6.46",
+            "geopy==1.19.0"
+        ]
+    },
+    "aqualogic": {
+        "domain": "aqualogic",
+        "name": "AquaLogic",
+        "documentation": "https://www.home-assistant.io/integrations/aqualogic",
+        "requirements": [
+            "aqualogic==1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "aquostv": {
+        "domain": "aquostv",
+        "name": "Sharp Aquos TV",
+        "documentation": "https://www.home-assistant.io/integrations/aquostv",
+        "requirements": [
+            "sharp_aquos_rc==0.3.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "arcam_fmj": {
+        "domain": "arcam_fmj",
+        "name": "Arcam FMJ Receivers",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/arcam_fmj",
+        "requirements": [
+            "arcam-fmj==0.4.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@elupus"
+        ]
+    },
+    "arduino": {
+        "domain": "arduino",
+        "name": "Arduino",
+        "documentation": "https://www.home-assistant.io/integrations/arduino",
+        "requirements": [
+            "PyMata==2.20"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "arest": {
+        "domain": "arest",
+        "name": "aREST",
+        "documentation": "https://www.home-assistant.io/integrations/arest",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "arlo": {
+        "domain": "arlo",
+        "name": "Arlo",
+        "documentation": "https://www.home-assistant.io/integrations/arlo",
+        "requirements": [
+            "pyarlo==0.2.3"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "aruba": {
+        "domain": "aruba",
+        "name": "Aruba",
+        "documentation": "https://www.home-assistant.io/integrations/aruba",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "arwn": {
+        "domain": "arwn",
+        "name": "Ambient Radio Weather Network",
+        "documentation": "https://www.home-assistant.io/integrations/arwn",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "asterisk_cdr": {
+        "domain": "asterisk_cdr",
+        "name": "Asterisk Call Detail Records",
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_cdr",
+        "requirements": [],
+        "dependencies": [
+            "asterisk_mbox"
+        ],
+        "codeowners": []
+    },
+    "asterisk_mbox": {
+        "domain": "asterisk_mbox",
+        "name": "Asterisk Voicemail",
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_mbox",
+        "requirements": [
+            "asterisk_mbox==0.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "asuswrt": {
+        "domain": "asuswrt",
+        "name": "Asuswrt",
+        "documentation": "https://www.home-assistant.io/integrations/asuswrt",
+        "requirements": [
+            "aioasuswrt==1.1.22"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kennedyshead"
+        ]
+    },
+    "aten_pe": {
+        "domain": "aten_pe",
+        "name": "ATEN Rack PDU",
+        "documentation": "https://www.home-assistant.io/integrations/aten_pe",
+        "requirements": [
+            "atenpdu==0.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mtdcr"
+        ]
+    },
+    "atome": {
+        "domain": "atome",
+        "name": "Atome Linky",
+        "documentation": "https://www.home-assistant.io/integrations/atome",
+        "dependencies": [],
+        "codeowners": [
+            "@baqs"
+        ],
+        "requirements": [
+            "pyatome==0.1.1"
+        ]
+    },
+    "august": {
+        "domain": "august",
+        "name": "August",
+        "documentation": "https://www.home-assistant.io/integrations/august",
+        "requirements": [
+            "py-august==0.7.0"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "aurora": {
+        "domain": "aurora",
+        "name": "Aurora",
+        "documentation": "https://www.home-assistant.io/integrations/aurora",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "aurora_abb_powerone": {
+        "domain": "aurora_abb_powerone",
+        "name": "Aurora ABB Solar PV",
+        "documentation": "https://www.home-assistant.io/integrations/aurora_abb_powerone/",
+        "dependencies": [],
+        "codeowners": [
+            "@davet2001"
+        ],
+        "requirements": [
+            "aurorapy==0.2.6"
+        ]
+    },
+    "auth": {
+        "domain": "auth",
+        "name": "Auth",
+        "documentation": "https://www.home-assistant.io/integrations/auth",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "onboarding"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "automatic": {
+        "domain": "automatic",
+        "name": "Automatic",
+        "documentation": "https://www.home-assistant.io/integrations/automatic",
+        "requirements": [
+            "aioautomatic==0.6.5"
+        ],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "codeowners": [
+            "@armills"
+        ]
+    },
+    "automation": {
+        "domain": "automation",
+        "name": "Automation",
+        "documentation": "https://www.home-assistant.io/integrations/automation",
+        "requirements": [],
+        "dependencies": [
+            "device_automation",
+            "group",
+            "webhook"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "avea": {
+        "domain": "avea",
+        "name": "Elgato Avea",
+        "documentation": "https://www.home-assistant.io/integrations/avea",
+        "dependencies": [],
+        "codeowners": [
+            "@pattyland"
+        ],
+        "requirements": [
+            "avea==1.4"
+        ]
+    },
+    "avion": {
+        "domain": "avion",
+        "name": "Avi-on",
+        "documentation": "https://www.home-assistant.io/integrations/avion",
+        "requirements": [
+            "avion==0.10"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "awair": {
+        "domain": "awair",
+        "name": "Awair",
+        "documentation": "https://www.home-assistant.io/integrations/awair",
+        "requirements": [
+            "python_awair==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielsjf"
+        ]
+    },
+    "aws": {
+        "domain": "aws",
+        "name": "Amazon Web Services (AWS)",
+        "documentation": "https://www.home-assistant.io/integrations/aws",
+        "requirements": [
+            "aiobotocore==0.11.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@awarecan",
+            "@robbiet480"
+        ]
+    },
+    "axis": {
+        "domain": "axis",
+        "name": "Axis",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/axis",
+        "requirements": [
+            "axis==25"
+        ],
+        "dependencies": [],
+        "zeroconf": [
+            "_axis-video._tcp.local."
+        ],
+        "codeowners": [
+            "@kane610"
+        ]
+    },
+    "azure_event_hub": {
+        "domain": "azure_event_hub",
+        "name": "Azure Event Hub",
+        "documentation": "https://www.home-assistant.io/integrations/azure_event_hub",
+        "requirements": [
+            "azure-eventhub==1.3.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@eavanvalkenburg"
+        ]
+    },
+    "azure_service_bus": {
+        "domain": "azure_service_bus",
+        "name": "Azure Service Bus",
+        "documentation": "https://www.home-assistant.io/integrations/azure_service_bus",
+        "requirements": [
+            "azure-servicebus==0.50.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@hfurubotten"
+        ]
+    },
+    "baidu": {
+        "domain": "baidu",
+        "name": "Baidu",
+        "documentation": "https://www.home-assistant.io/integrations/baidu",
+        "requirements": [
+            "baidu-aip==1.6.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bayesian": {
+        "domain": "bayesian",
+        "name": "Bayesian",
+        "documentation": "https://www.home-assistant.io/integrations/bayesian",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "bbb_gpio": {
+        "domain": "bbb_gpio",
+        "name": "BeagleBone Black GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/bbb_gpio",
+        "requirements": [
+            "Adafruit_BBIO==1.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bbox": {
+        "domain": "bbox",
+        "name": "Bbox",
+        "documentation": "https://www.home-assistant.io/integrations/bbox",
+        "requirements": [
+            "pybbox==0.0.5-alpha"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "beewi_smartclim": {
+        "domain": "beewi_smartclim",
+        "name": "BeeWi SmartClim BLE sensor",
+        "documentation": "https://www.home-assistant.io/integrations/beewi_smartclim",
+        "requirements": [
+            "beewi_smartclim==0.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@alemuro"
+        ]
+    },
+    "bh1750": {
+        "domain": "bh1750",
+        "name": "BH1750",
+        "documentation": "https://www.home-assistant.io/integrations/bh1750",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "binary_sensor": {
+        "domain": "binary_sensor",
+        "name": "Binary Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/binary_sensor",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "bitcoin": {
+        "domain": "bitcoin",
+        "name": "Bitcoin",
+        "documentation": "https://www.home-assistant.io/integrations/bitcoin",
+        "requirements": [
+            "blockchain==1.4.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "bizkaibus": {
+        "domain": "bizkaibus",
+        "name": "Bizkaibus",
+        "documentation": "https://www.home-assistant.io/integrations/bizkaibus",
+        "dependencies": [],
+        "codeowners": [
+            "@UgaitzEtxebarria"
+        ],
+        "requirements": [
+            "bizkaibus==0.1.1"
+        ]
+    },
+    "blackbird": {
+        "domain": "blackbird",
+        "name": "Monoprice Blackbird Matrix Switch",
+        "documentation": "https://www.home-assistant.io/integrations/blackbird",
+        "requirements": [
+            "pyblackbird==0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "blink": {
+        "domain": "blink",
+        "name": "Blink",
+        "documentation": "https://www.home-assistant.io/integrations/blink",
+        "requirements": [
+            "blinkpy==0.14.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fronzbot"
+        ]
+    },
+    "blinksticklight": {
+        "domain": "blinksticklight",
+        "name": "BlinkStick",
+        "documentation": "https://www.home-assistant.io/integrations/blinksticklight",
+        "requirements": [
+            "blinkstick==1.1.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "blinkt": {
+        "domain": "blinkt",
+        "name": "Blinkt!",
+        "documentation": "https://www.home-assistant.io/integrations/blinkt",
+        "requirements": [
+            "blinkt==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "blockchain": {
+        "domain": "blockchain",
+        "name": "Blockchain.com",
+        "documentation": "https://www.home-assistant.io/integrations/blockchain",
+        "requirements": [
+            "python-blockchain-api==0.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bloomsky": {
+        "domain": "bloomsky",
+        "name": "BloomSky",
+        "documentation": "https://www.home-assistant.io/integrations/bloomsky",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bluesound": {
+        "domain": "bluesound",
+        "name": "Bluesound",
+        "documentation": "https://www.home-assistant.io/integrations/bluesound",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bluetooth_le_tracker": {
+        "domain": "bluetooth_le_tracker",
+        "name": "Bluetooth LE Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_le_tracker",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bluetooth_tracker": {
+        "domain": "bluetooth_tracker",
+        "name": "Bluetooth Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_tracker",
+        "requirements": [
+            "bt_proximity==0.2",
+            "pybluez==0.22"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bme280": {
+        "domain": "bme280",
+        "name": "Bosch BME280 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bme280",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bme680": {
+        "domain": "bme680",
+        "name": "Bosch BME680 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bme680",
+        "requirements": [
+            "bme680==1.0.5",
+            "smbus-cffi==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bmw_connected_drive": {
+        "domain": "bmw_connected_drive",
+        "name": "BMW Connected Drive",
+        "documentation": "https://www.home-assistant.io/integrations/bmw_connected_drive",
+        "requirements": [
+            "bimmer_connected==0.6.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@gerard33"
+        ]
+    },
+    "bom": {
+        "domain": "bom",
+        "name": "Australian Bureau of Meteorology (BOM)",
+        "documentation": "https://www.home-assistant.io/integrations/bom",
+        "requirements": [
+            "bomradarloop==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "braviatv": {
+        "domain": "braviatv",
+        "name": "Sony Bravia TV",
+        "documentation": "https://www.home-assistant.io/integrations/braviatv",
+        "requirements": [
+            "bravia-tv==1.0",
+            "getmac==0.8.1"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "broadlink": {
+        "domain": "broadlink",
+        "name": "Broadlink",
+        "documentation": "https://www.home-assistant.io/integrations/broadlink",
+        "requirements": [
+            "broadlink==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen",
+            "@felipediel"
+        ]
+    },
+    "brother": {
+        "domain": "brother",
+        "name": "Brother Printer",
+        "documentation": "https://www.home-assistant.io/integrations/brother",
+        "dependencies": [],
+        "codeowners": [
+            "@bieniu"
+        ],
+        "requirements": [
+            "brother==0.1.4"
+        ],
+        "zeroconf": [
+            "_printer._tcp.local."
+        ],
+        "config_flow": True
+    },
+    "brottsplatskartan": {
+        "domain": "brottsplatskartan",
+        "name": "Brottsplatskartan",
+        "documentation": "https://www.home-assistant.io/integrations/brottsplatskartan",
+        "requirements": [
+            "brottsplatskartan==0.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "browser": {
+        "domain": "browser",
+        "name": "Browser",
+        "documentation": "https://www.home-assistant.io/integrations/browser",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "brunt": {
+        "domain": "brunt",
+        "name": "Brunt Blind Engine",
+        "documentation": "https://www.home-assistant.io/integrations/brunt",
+        "requirements": [
+            "brunt==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@eavanvalkenburg"
+        ]
+    },
+    "bt_home_hub_5": {
+        "domain": "bt_home_hub_5",
+        "name": "BT Home Hub 5",
+        "documentation": "https://www.home-assistant.io/integrations/bt_home_hub_5",
+        "requirements": [
+            "bthomehub5-devicelist==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "bt_smarthub": {
+        "domain": "bt_smarthub",
+        "name": "BT Smart Hub",
+        "documentation": "https://www.home-assistant.io/integrations/bt_smarthub",
+        "requirements": [
+            "btsmarthub_devicelist==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jxwolstenholme"
+        ]
+    },
+    "buienradar": {
+        "domain": "buienradar",
+        "name": "Buienradar",
+        "documentation": "https://www.home-assistant.io/integrations/buienradar",
+        "requirements": [
+            "buienradar==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mjj4791",
+            "@ties"
+        ]
+    },
+    "caldav": {
+        "domain": "caldav",
+        "name": "CalDav",
+        "documentation": "https://www.home-assistant.io/integrations/caldav",
+        "requirements": [
+            "caldav==0.6.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "calendar": {
+        "domain": "calendar",
+        "name": "Calendar",
+        "documentation": "https://www.home-assistant.io/integrations/calendar",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "camera": {
+        "domain": "camera",
+        "name": "Camera",
+        "documentation": "https://www.home-assistant.io/integrations/camera",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "media_player"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "canary": {
+        "domain": "canary",
+        "name": "Canary",
+        "documentation": "https://www.home-assistant.io/integrations/canary",
+        "requirements": [
+            "py-canary==0.5.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "cast": {
+        "domain": "cast",
+        "name": "Google Cast",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/cast",
+        "requirements": [
+            "pychromecast==4.1.1"
+        ],
+        "dependencies": [],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "zeroconf": [
+            "_googlecast._tcp.local."
+        ],
+        "codeowners": []
+    },
+    "cert_expiry": {
+        "domain": "cert_expiry",
+        "name": "Certificate Expiry",
+        "documentation": "https://www.home-assistant.io/integrations/cert_expiry",
+        "requirements": [],
+        "config_flow": True,
+        "dependencies": [],
+        "codeowners": [
+            "@Cereal2nd",
+            "@jjlawren"
+        ]
+    },
+    "channels": {
+        "domain": "channels",
+        "name": "Channels",
+        "documentation": "https://www.home-assistant.io/integrations/channels",
+        "requirements": [
+            "pychannels==1.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "cisco_ios": {
+        "domain": "cisco_ios",
+        "name": "Cisco IOS",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_ios",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "cisco_mobility_express": {
+        "domain": "cisco_mobility_express",
+        "name": "Cisco Mobility Express",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_mobility_express",
+        "requirements": [
+            "ciscomobilityexpress==0.3.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "cisco_webex_teams": {
+        "domain": "cisco_webex_teams",
+        "name": "Cisco Webex Teams",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_webex_teams",
+        "requirements": [
+            "webexteamssdk==1.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "citybikes": {
+        "domain": "citybikes",
+        "name": "CityBikes",
+        "documentation": "https://www.home-assistant.io/integrations/citybikes",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "clementine": {
+        "domain": "clementine",
+        "name": "Clementine Music Player",
+        "documentation": "https://www.home-assistant.io/integrations/clementine",
+        "requirements": [
+            "python-clementine-remote==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "clickatell": {
+        "domain": "clickatell",
+        "name": "Clickatell",
+        "documentation": "https://www.home-assistant.io/integrations/clickatell",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "clicksend": {
+        "domain": "clicksend",
+        "name": "ClickSend SMS",
+        "documentation": "https://www.home-assistant.io/integrations/clicksend",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "clicksend_tts": {
+        "domain": "clicksend_tts",
+        "name": "ClickSend TTS",
+        "documentation": "https://www.home-assistant.io/integrations/clicksend_tts",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "climate": {
+        "domain": "climate",
+        "name": "Climate",
+        "documentation": "https://www.home-assistant.io/integrations/climate",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "cloud": {
+        "domain": "cloud",
+        "name": "Home Assistant Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/cloud",
+        "requirements": [
+            "hass-nabucasa==0.31"
+        ],
+        "dependencies": [
+            "http",
+            "webhook"
+        ],
+        "after_dependencies": [
+            "alexa",
+            "google_assistant"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud"
+        ]
+    },
+    "cloudflare": {
+        "domain": "cloudflare",
+        "name": "Cloudflare",
+        "documentation": "https://www.home-assistant.io/integrations/cloudflare",
+        "requirements": [
+            "pycfdns==0.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "cmus": {
+        "domain": "cmus",
+        "name": "cmus",
+        "documentation": "https://www.home-assistant.io/integrations/cmus",
+        "requirements": [
+            "pycmus==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "co2signal": {
+        "domain": "co2signal",
+        "name": "CO2 Signal",
+        "documentation": "https://www.home-assistant.io/integrations/co2signal",
+        "requirements": [
+            "co2signal==0.4.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "coinbase": {
+        "domain": "coinbase",
+        "name": "Coinbase",
+        "documentation": "https://www.home-assistant.io/integrations/coinbase",
+        "requirements": [
+            "coinbase==2.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "coinmarketcap": {
+        "domain": "coinmarketcap",
+        "name": "CoinMarketCap",
+        "documentation": "https://www.home-assistant.io/integrations/coinmarketcap",
+        "requirements": [
+            "coinmarketcap==5.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "comed_hourly_pricing": {
+        "domain": "comed_hourly_pricing",
+        "name": "ComEd Hourly Pricing",
+        "documentation": "https://www.home-assistant.io/integrations/comed_hourly_pricing",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "comfoconnect": {
+        "domain": "comfoconnect",
+        "name": "Zehnder ComfoAir Q",
+        "documentation": "https://www.home-assistant.io/integrations/comfoconnect",
+        "requirements": [
+            "pycomfoconnect==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@michaelarnauts"
+        ]
+    },
+    "command_line": {
+        "domain": "command_line",
+        "name": "Command Line",
+        "documentation": "https://www.home-assistant.io/integrations/command_line",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "concord232": {
+        "domain": "concord232",
+        "name": "Concord232",
+        "documentation": "https://www.home-assistant.io/integrations/concord232",
+        "requirements": [
+            "concord232==0.15"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "config": {
+        "domain": "config",
+        "name": "Config",
+        "documentation": "https://www.home-assistant.io/integrations/config",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "configurator": {
+        "domain": "configurator",
+        "name": "Configurator",
+        "documentation": "https://www.home-assistant.io/integrations/configurator",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "conversation": {
+        "domain": "conversation",
+        "name": "Conversation",
+        "documentation": "https://www.home-assistant.io/integrations/conversation",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "coolmaster": {
+        "domain": "coolmaster",
+        "name": "CoolMasterNet",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coolmaster",
+        "requirements": [
+            "pycoolmasternet==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@OnFreund"
+        ]
+    },
+    "counter": {
+        "domain": "counter",
+        "name": "Counter",
+        "documentation": "https://www.home-assistant.io/integrations/counter",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "cover": {
+        "domain": "cover",
+        "name": "Cover",
+        "documentation": "https://www.home-assistant.io/integrations/cover",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "cppm_tracker": {
+        "domain": "cppm_tracker",
+        "name": "Aruba ClearPass",
+        "documentation": "https://www.home-assistant.io/integrations/cppm_tracker",
+        "requirements": [
+            "clearpasspy==1.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "cpuspeed": {
+        "domain": "cpuspeed",
+        "name": "CPU Speed",
+        "documentation": "https://www.home-assistant.io/integrations/cpuspeed",
+        "requirements": [
+            "py-cpuinfo==5.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "crimereports": {
+        "domain": "crimereports",
+        "name": "Crime Reports",
+        "documentation": "https://www.home-assistant.io/integrations/crimereports",
+        "requirements": [
+            "crimereports==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "cups": {
+        "domain": "cups",
+        "name": "CUPS",
+        "documentation": "https://www.home-assistant.io/integrations/cups",
+        "requirements": [
+            "pycups==1.9.73"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "currencylayer": {
+        "domain": "currencylayer",
+        "name": "currencylayer",
+        "documentation": "https://www.home-assistant.io/integrations/currencylayer",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "daikin": {
+        "domain": "daikin",
+        "name": "Daikin AC",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/daikin",
+        "requirements": [
+            "pydaikin==1.6.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fredrike",
+            "@rofrantz"
+        ],
+        "quality_scale": "platinum"
+    },
+    "danfoss_air": {
+        "domain": "danfoss_air",
+        "name": "Danfoss Air",
+        "documentation": "https://www.home-assistant.io/integrations/danfoss_air",
+        "requirements": [
+            "pydanfossair==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "darksky": {
+        "domain": "darksky",
+        "name": "Dark Sky",
+        "documentation": "https://www.home-assistant.io/integrations/darksky",
+        "requirements": [
+            "python-forecastio==1.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "datadog": {
+        "domain": "datadog",
+        "name": "Datadog",
+        "documentation": "https://www.home-assistant.io/integrations/datadog",
+        "requirements": [
+            "datadog==0.15.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ddwrt": {
+        "domain": "ddwrt",
+        "name": "DD-WRT",
+        "documentation": "https://www.home-assistant.io/integrations/ddwrt",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "deconz": {
+        "domain": "deconz",
+        "name": "deCONZ",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/deconz",
+        "requirements": [
+            "pydeconz==70"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics"
+            }
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kane610"
+        ],
+        "quality_scale": "platinum"
+    },
+    "decora": {
+        "domain": "decora",
+        "name": "Leviton Decora",
+        "documentation": "https://www.home-assistant.io/integrations/decora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "decora==0.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "decora_wifi": {
+        "domain": "decora_wifi",
+        "name": "Leviton Decora Wi-Fi",
+        "documentation": "https://www.home-assistant.io/integrations/decora_wifi",
+        "requirements": [
+            "decora_wifi==1.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "default_config": {
+        "domain": "default_config",
+        "name": "Default Config",
+        "documentation": "https://www.home-assistant.io/integrations/default_config",
+        "requirements": [],
+        "dependencies": [
+            "automation",
+            "cloud",
+            "config",
+            "frontend",
+            "history",
+            "logbook",
+            "map",
+            "mobile_app",
+            "person",
+            "script",
+            "ssdp",
+            "sun",
+            "system_health",
+            "updater",
+            "zeroconf",
+            "zone"
+        ],
+        "codeowners": []
+    },
+    "delijn": {
+        "domain": "delijn",
+        "name": "De Lijn",
+        "documentation": "https://www.home-assistant.io/integrations/delijn",
+        "dependencies": [],
+        "codeowners": [
+            "@bollewolle"
+        ],
+        "requirements": [
+            "pydelijn==0.5.1"
+        ]
+    },
+    "deluge": {
+        "domain": "deluge",
+        "name": "Deluge",
+        "documentation": "https://www.home-assistant.io/integrations/deluge",
+        "requirements": [
+            "deluge-client==1.7.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "demo": {
+        "domain": "demo",
+        "name": "Demo",
+        "documentation": "https://www.home-assistant.io/integrations/demo",
+        "requirements": [],
+        "dependencies": [
+            "conversation",
+            "zone",
+            "group",
+            "configurator"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "denon": {
+        "domain": "denon",
+        "name": "Denon Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/denon",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "denonavr": {
+        "domain": "denonavr",
+        "name": "Denon AVR Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/denonavr",
+        "requirements": [
+            "denonavr==0.7.11"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "derivative": {
+        "domain": "derivative",
+        "name": "Derivative",
+        "documentation": "https://www.home-assistant.io/integrations/derivative",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@afaucogney"
+        ]
+    },
+    "deutsche_bahn": {
+        "domain": "deutsche_bahn",
+        "name": "Deutsche Bahn",
+        "documentation": "https://www.home-assistant.io/integrations/deutsche_bahn",
+        "requirements": [
+            "schiene==0.23"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "device_automation": {
+        "domain": "device_automation",
+        "name": "Device Automation",
+        "documentation": "https://www.home-assistant.io/integrations/device_automation",
+        "requirements": [],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "device_sun_light_trigger": {
+        "domain": "device_sun_light_trigger",
+        "name": "Presence-based Lights",
+        "documentation": "https://www.home-assistant.io/integrations/device_sun_light_trigger",
+        "requirements": [],
+        "dependencies": [
+            "device_tracker",
+            "group",
+            "light",
+            "person"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "device_tracker": {
+        "domain": "device_tracker",
+        "name": "Device Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/device_tracker",
+        "requirements": [],
+        "dependencies": [
+            "group",
+            "zone"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "dht": {
+        "domain": "dht",
+        "name": "DHT Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/dht",
+        "requirements": [
+            "Adafruit-DHT==1.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dialogflow": {
+        "domain": "dialogflow",
+        "name": "Dialogflow",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dialogflow",
+        "requirements": [],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "digital_ocean": {
+        "domain": "digital_ocean",
+        "name": "Digital Ocean",
+        "documentation": "https://www.home-assistant.io/integrations/digital_ocean",
+        "requirements": [
+            "python-digitalocean==1.13.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "digitalloggers": {
+        "domain": "digitalloggers",
+        "name": "Digital Loggers",
+        "documentation": "https://www.home-assistant.io/integrations/digitalloggers",
+        "requirements": [
+            "dlipower==0.7.165"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "directv": {
+        "domain": "directv",
+        "name": "DirecTV",
+        "documentation": "https://www.home-assistant.io/integrations/directv",
+        "requirements": [
+            "directpy==0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "discogs": {
+        "domain": "discogs",
+        "name": "Discogs",
+        "documentation": "https://www.home-assistant.io/integrations/discogs",
+        "requirements": [
+            "discogs_client==2.2.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@thibmaek"
+        ]
+    },
+    "discord": {
+        "domain": "discord",
+        "name": "Discord",
+        "documentation": "https://www.home-assistant.io/integrations/discord",
+        "requirements": [
+            "discord.py==1.3.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "discovery": {
+        "domain": "discovery",
+        "name": "Discovery",
+        "documentation": "https://www.home-assistant.io/integrations/discovery",
+        "requirements": [
+            "netdisco==2.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "dlib_face_detect": {
+        "domain": "dlib_face_detect",
+        "name": "Dlib Face Detect",
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_detect",
+        "requirements": [
+            "face_recognition==1.2.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dlib_face_identify": {
+        "domain": "dlib_face_identify",
+        "name": "Dlib Face Identify",
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_identify",
+        "requirements": [
+            "face_recognition==1.2.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dlink": {
+        "domain": "dlink",
+        "name": "D-Link Wi-Fi Smart Plugs",
+        "documentation": "https://www.home-assistant.io/integrations/dlink",
+        "requirements": [
+            "pyW215==0.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dlna_dmr": {
+        "domain": "dlna_dmr",
+        "name": "DLNA Digital Media Renderer",
+        "documentation": "https://www.home-assistant.io/integrations/dlna_dmr",
+        "requirements": [
+            "async-upnp-client==0.14.12"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dnsip": {
+        "domain": "dnsip",
+        "name": "DNS IP",
+        "documentation": "https://www.home-assistant.io/integrations/dnsip",
+        "requirements": [
+            "aiodns==2.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dominos": {
+        "domain": "dominos",
+        "name": "Dominos Pizza",
+        "documentation": "https://www.home-assistant.io/integrations/dominos",
+        "requirements": [
+            "pizzapi==0.0.3"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "doods": {
+        "domain": "doods",
+        "name": "DOODS - Distributed Outside Object Detection Service",
+        "documentation": "https://www.home-assistant.io/integrations/doods",
+        "requirements": [
+            "pydoods==1.0.2",
+            "pillow==6.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "doorbird": {
+        "domain": "doorbird",
+        "name": "DoorBird",
+        "documentation": "https://www.home-assistant.io/integrations/doorbird",
+        "requirements": [
+            "doorbirdpy==2.0.8"
+        ],
+        "dependencies": [
+            "http",
+            "logbook"
+        ],
+        "codeowners": [
+            "@oblogic7"
+        ]
+    },
+    "dovado": {
+        "domain": "dovado",
+        "name": "Dovado",
+        "documentation": "https://www.home-assistant.io/integrations/dovado",
+        "requirements": [
+            "dovado==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "downloader": {
+        "domain": "downloader",
+        "name": "Downloader",
+        "documentation": "https://www.home-assistant.io/integrations/downloader",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "dsmr": {
+        "domain": "dsmr",
+        "name": "DSMR Slimme Meter",
+        "documentation": "https://www.home-assistant.io/integrations/dsmr",
+        "requirements": [
+            "dsmr_parser==0.18"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dsmr_reader": {
+        "domain": "dsmr_reader",
+        "name": "DSMR Reader",
+        "documentation": "https://www.home-assistant.io/integrations/dsmr_reader",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@depl0y"
+        ]
+    },
+    "dte_energy_bridge": {
+        "domain": "dte_energy_bridge",
+        "name": "DTE Energy Bridge",
+        "documentation": "https://www.home-assistant.io/integrations/dte_energy_bridge",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dublin_bus_transport": {
+        "domain": "dublin_bus_transport",
+        "name": "Dublin Bus",
+        "documentation": "https://www.home-assistant.io/integrations/dublin_bus_transport",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "duckdns": {
+        "domain": "duckdns",
+        "name": "Duck DNS",
+        "documentation": "https://www.home-assistant.io/integrations/duckdns",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "duke_energy": {
+        "domain": "duke_energy",
+        "name": "Duke Energy",
+        "documentation": "https://www.home-assistant.io/integrations/duke_energy",
+        "requirements": [
+            "pydukeenergy==0.0.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dunehd": {
+        "domain": "dunehd",
+        "name": "DuneHD",
+        "documentation": "https://www.home-assistant.io/integrations/dunehd",
+        "requirements": [
+            "pdunehd==1.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dwd_weather_warnings": {
+        "domain": "dwd_weather_warnings",
+        "name": "Deutsche Wetter Dienst (DWD) Weather Warnings",
+        "documentation": "https://www.home-assistant.io/integrations/dwd_weather_warnings",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "dweet": {
+        "domain": "dweet",
+        "name": "dweet.io",
+        "documentation": "https://www.home-assistant.io/integrations/dweet",
+        "requirements": [
+            "dweepy==0.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "dyson": {
+        "domain": "dyson",
+        "name": "Dyson",
+        "documentation": "https://www.home-assistant.io/integrations/dyson",
+        "requirements": [
+            "libpurecool==0.6.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@etheralm"
+        ]
+    },
+    "ebox": {
+        "domain": "ebox",
+        "name": "EBox",
+        "documentation": "https://www.home-assistant.io/integrations/ebox",
+        "requirements": [
+            "pyebox==1.1.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ebusd": {
+        "domain": "ebusd",
+        "name": "ebusd",
+        "documentation": "https://www.home-assistant.io/integrations/ebusd",
+        "requirements": [
+            "ebusdpy==0.0.16"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ecoal_boiler": {
+        "domain": "ecoal_boiler",
+        "name": "eSterownik eCoal.pl Boiler",
+        "documentation": "https://www.home-assistant.io/integrations/ecoal_boiler",
+        "requirements": [
+            "ecoaliface==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ecobee": {
+        "domain": "ecobee",
+        "name": "Ecobee",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ecobee",
+        "dependencies": [],
+        "requirements": [
+            "python-ecobee-api==0.1.4"
+        ],
+        "codeowners": [
+            "@marthoc"
+        ]
+    },
+    "econet": {
+        "domain": "econet",
+        "name": "Rheem EcoNET Water Products",
+        "documentation": "https://www.home-assistant.io/integrations/econet",
+        "requirements": [
+            "pyeconet==0.0.11"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ecovacs": {
+        "domain": "ecovacs",
+        "name": "Ecovacs",
+        "documentation": "https://www.home-assistant.io/integrations/ecovacs",
+        "requirements": [
+            "sucks==0.9.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@OverloadUT"
+        ]
+    },
+    "eddystone_temperature": {
+        "domain": "eddystone_temperature",
+        "name": "Eddystone",
+        "documentation": "https://www.home-assistant.io/integrations/eddystone_temperature",
+        "requirements": [
+            "beacontools[scan]==1.2.3",
+            "construct==2.9.45"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "edimax": {
+        "domain": "edimax",
+        "name": "Edimax",
+        "documentation": "https://www.home-assistant.io/integrations/edimax",
+        "requirements": [
+            "pyedimax==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ee_brightbox": {
+        "domain": "ee_brightbox",
+        "name": "EE Bright Box",
+        "documentation": "https://www.home-assistant.io/integrations/ee_brightbox",
+        "requirements": [
+            "eebrightbox==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "efergy": {
+        "domain": "efergy",
+        "name": "Efergy",
+        "documentation": "https://www.home-assistant.io/integrations/efergy",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "egardia": {
+        "domain": "egardia",
+        "name": "Egardia",
+        "documentation": "https://www.home-assistant.io/integrations/egardia",
+        "requirements": [
+            "pythonegardia==1.0.40"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jeroenterheerdt"
+        ]
+    },
+    "eight_sleep": {
+        "domain": "eight_sleep",
+        "name": "Eight Sleep",
+        "documentation": "https://www.home-assistant.io/integrations/eight_sleep",
+        "requirements": [
+            "pyeight==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mezz64"
+        ]
+    },
+    "elgato": {
+        "domain": "elgato",
+        "name": "Elgato Key Light",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/elgato",
+        "requirements": [
+            "elgato==0.2.0"
+        ],
+        "dependencies": [],
+        "zeroconf": [
+            "_elg._tcp.local."
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "quality_scale": "platinum"
+    },
+    "eliqonline": {
+        "domain": "eliqonline",
+        "name": "Eliqonline",
+        "documentation": "https://www.home-assistant.io/integrations/eliqonline",
+        "requirements": [
+            "eliqonline==1.2.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "elkm1": {
+        "domain": "elkm1",
+        "name": "Elk-M1 Control",
+        "documentation": "https://www.home-assistant.io/integrations/elkm1",
+        "requirements": [
+            "elkm1-lib==0.7.15"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "elv": {
+        "domain": "elv",
+        "name": "ELV PCA",
+        "documentation": "https://www.home-assistant.io/integrations/pca",
+        "dependencies": [],
+        "codeowners": [
+            "@majuss"
+        ],
+        "requirements": [
+            "pypca==0.0.7"
+        ]
+    },
+    "emby": {
+        "domain": "emby",
+        "name": "Emby",
+        "documentation": "https://www.home-assistant.io/integrations/emby",
+        "requirements": [
+            "pyemby==1.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mezz64"
+        ]
+    },
+    "emoncms": {
+        "domain": "emoncms",
+        "name": "Emoncms",
+        "documentation": "https://www.home-assistant.io/integrations/emoncms",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "emoncms_history": {
+        "domain": "emoncms_history",
+        "name": "Emoncms History",
+        "documentation": "https://www.home-assistant.io/integrations/emoncms_history",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "emulated_hue": {
+        "domain": "emulated_hue",
+        "name": "Emulated Hue",
+        "documentation": "https://www.home-assistant.io/integrations/emulated_hue",
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "emulated_roku": {
+        "domain": "emulated_roku",
+        "name": "Emulated Roku",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/emulated_roku",
+        "requirements": [
+            "emulated_roku==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "enigma2": {
+        "domain": "enigma2",
+        "name": "Enigma2 (OpenWebif)",
+        "documentation": "https://www.home-assistant.io/integrations/enigma2",
+        "requirements": [
+            "openwebifpy==3.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "enocean": {
+        "domain": "enocean",
+        "name": "EnOcean",
+        "documentation": "https://www.home-assistant.io/integrations/enocean",
+        "requirements": [
+            "enocean==0.50"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bdurrer"
+        ]
+    },
+    "enphase_envoy": {
+        "domain": "enphase_envoy",
+        "name": "Enphase Envoy",
+        "documentation": "https://www.home-assistant.io/integrations/enphase_envoy",
+        "requirements": [
+            "envoy_reader==0.11.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "entur_public_transport": {
+        "domain": "entur_public_transport",
+        "name": "Entur",
+        "documentation": "https://www.home-assistant.io/integrations/entur_public_transport",
+        "requirements": [
+            "enturclient==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@hfurubotten"
+        ]
+    },
+    "environment_canada": {
+        "domain": "environment_canada",
+        "name": "Environment Canada",
+        "documentation": "https://www.home-assistant.io/integrations/environment_canada",
+        "requirements": [
+            "env_canada==0.0.34"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@michaeldavie"
+        ]
+    },
+    "envirophat": {
+        "domain": "envirophat",
+        "name": "Enviro pHAT",
+        "documentation": "https://www.home-assistant.io/integrations/envirophat",
+        "requirements": [
+            "envirophat==0.0.6",
+            "smbus-cffi==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "envisalink": {
+        "domain": "envisalink",
+        "name": "Envisalink",
+        "documentation": "https://www.home-assistant.io/integrations/envisalink",
+        "requirements": [
+            "pyenvisalink==4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ephember": {
+        "domain": "ephember",
+        "name": "EPH Controls",
+        "documentation": "https://www.home-assistant.io/integrations/ephember",
+        "requirements": [
+            "pyephember==0.3.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ttroy50"
+        ]
+    },
+    "epson": {
+        "domain": "epson",
+        "name": "Epson",
+        "documentation": "https://www.home-assistant.io/integrations/epson",
+        "requirements": [
+            "epson-projector==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "epsonworkforce": {
+        "domain": "epsonworkforce",
+        "name": "Epson Workforce",
+        "documentation": "https://www.home-assistant.io/integrations/epsonworkforce",
+        "dependencies": [],
+        "codeowners": [
+            "@ThaStealth"
+        ],
+        "requirements": [
+            "epsonprinter==0.0.9"
+        ]
+    },
+    "eq3btsmart": {
+        "domain": "eq3btsmart",
+        "name": "EQ3 Bluetooth Smart Thermostats",
+        "documentation": "https://www.home-assistant.io/integrations/eq3btsmart",
+        "requirements": [
+            "construct==2.9.45",
+            "python-eq3bt==0.1.11"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rytilahti"
+        ]
+    },
+    "esphome": {
+        "domain": "esphome",
+        "name": "ESPHome",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/esphome",
+        "requirements": [
+            "aioesphomeapi==2.6.1"
+        ],
+        "dependencies": [],
+        "zeroconf": [
+            "_esphomelib._tcp.local."
+        ],
+        "codeowners": [
+            "@OttoWinter"
+        ]
+    },
+    "essent": {
+        "domain": "essent",
+        "name": "Essent",
+        "documentation": "https://www.home-assistant.io/integrations/essent",
+        "requirements": [
+            "PyEssent==0.13"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@TheLastProject"
+        ]
+    },
+    "etherscan": {
+        "domain": "etherscan",
+        "name": "Etherscan",
+        "documentation": "https://www.home-assistant.io/integrations/etherscan",
+        "requirements": [
+            "python-etherscan-api==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "eufy": {
+        "domain": "eufy",
+        "name": "eufy",
+        "documentation": "https://www.home-assistant.io/integrations/eufy",
+        "requirements": [
+            "lakeside==0.12"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "everlights": {
+        "domain": "everlights",
+        "name": "EverLights",
+        "documentation": "https://www.home-assistant.io/integrations/everlights",
+        "requirements": [
+            "pyeverlights==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "evohome": {
+        "domain": "evohome",
+        "name": "Honeywell Total Connect Comfort (Europe)",
+        "documentation": "https://www.home-assistant.io/integrations/evohome",
+        "requirements": [
+            "evohome-async==0.3.5.post1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "facebook": {
+        "domain": "facebook",
+        "name": "Facebook Messenger",
+        "documentation": "https://www.home-assistant.io/integrations/facebook",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "facebox": {
+        "domain": "facebox",
+        "name": "Facebox",
+        "documentation": "https://www.home-assistant.io/integrations/facebox",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fail2ban": {
+        "domain": "fail2ban",
+        "name": "Fail2Ban",
+        "documentation": "https://www.home-assistant.io/integrations/fail2ban",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "familyhub": {
+        "domain": "familyhub",
+        "name": "Samsung Family Hub",
+        "documentation": "https://www.home-assistant.io/integrations/familyhub",
+        "requirements": [
+            "python-family-hub-local==0.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fan": {
+        "domain": "fan",
+        "name": "Fan",
+        "documentation": "https://www.home-assistant.io/integrations/fan",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "fastdotcom": {
+        "domain": "fastdotcom",
+        "name": "Fast.com",
+        "documentation": "https://www.home-assistant.io/integrations/fastdotcom",
+        "requirements": [
+            "fastdotcom==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "feedreader": {
+        "domain": "feedreader",
+        "name": "Feedreader",
+        "documentation": "https://www.home-assistant.io/integrations/feedreader",
+        "requirements": [
+            "feedparser-homeassistant==5.2.2.dev1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ffmpeg": {
+        "domain": "ffmpeg",
+        "name": "FFmpeg",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg",
+        "requirements": [
+            "ha-ffmpeg==2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ffmpeg_motion": {
+        "domain": "ffmpeg_motion",
+        "name": "FFmpeg Motion",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_motion",
+        "requirements": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "ffmpeg_noise": {
+        "domain": "ffmpeg_noise",
+        "name": "FFmpeg Noise",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_noise",
+        "requirements": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "fibaro": {
+        "domain": "fibaro",
+        "name": "Fibaro",
+        "documentation": "https://www.home-assistant.io/integrations/fibaro",
+        "requirements": [
+            "fiblary3==0.1.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fido": {
+        "domain": "fido",
+        "name": "Fido",
+        "documentation": "https://www.home-assistant.io/integrations/fido",
+        "requirements": [
+            "pyfido==2.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "file": {
+        "domain": "file",
+        "name": "File",
+        "documentation": "https://www.home-assistant.io/integrations/file",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "filesize": {
+        "domain": "filesize",
+        "name": "File Size",
+        "documentation": "https://www.home-assistant.io/integrations/filesize",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "filter": {
+        "domain": "filter",
+        "name": "Filter",
+        "documentation": "https://www.home-assistant.io/integrations/filter",
+        "requirements": [],
+        "dependencies": [
+            "history"
+        ],
+        "codeowners": [
+            "@dgomes"
+        ],
+        "quality_scale": "internal"
+    },
+    "fints": {
+        "domain": "fints",
+        "name": "FinTS",
+        "documentation": "https://www.home-assistant.io/integrations/fints",
+        "requirements": [
+            "fints==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fitbit": {
+        "domain": "fitbit",
+        "name": "Fitbit",
+        "documentation": "https://www.home-assistant.io/integrations/fitbit",
+        "requirements": [
+            "fitbit==0.3.1"
+        ],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "fixer": {
+        "domain": "fixer",
+        "name": "Fixer",
+        "documentation": "https://www.home-assistant.io/integrations/fixer",
+        "requirements": [
+            "fixerio==1.0.0a0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "fleetgo": {
+        "domain": "fleetgo",
+        "name": "FleetGO",
+        "documentation": "https://www.home-assistant.io/integrations/fleetgo",
+        "requirements": [
+            "ritassist==0.9.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "flexit": {
+        "domain": "flexit",
+        "name": "Flexit",
+        "documentation": "https://www.home-assistant.io/integrations/flexit",
+        "requirements": [
+            "pyflexit==0.3"
+        ],
+        "dependencies": [
+            "modbus"
+        ],
+        "codeowners": []
+    },
+    "flic": {
+        "domain": "flic",
+        "name": "Flic",
+        "documentation": "https://www.home-assistant.io/integrations/flic",
+        "requirements": [
+            "pyflic-homeassistant==0.4.dev0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "flock": {
+        "domain": "flock",
+        "name": "Flock",
+        "documentation": "https://www.home-assistant.io/integrations/flock",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "flume": {
+        "domain": "flume",
+        "name": "flume",
+        "documentation": "https://www.home-assistant.io/integrations/flume/",
+        "requirements": [
+            "pyflume==0.2.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ChrisMandich"
+        ]
+    },
+    "flunearyou": {
+        "domain": "flunearyou",
+        "name": "Flu Near You",
+        "documentation": "https://www.home-assistant.io/integrations/flunearyou",
+        "requirements": [
+            "pyflunearyou==1.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "flux": {
+        "domain": "flux",
+        "name": "Flux",
+        "documentation": "https://www.home-assistant.io/integrations/flux",
+        "requirements": [],
+        "dependencies": [],
+        "after_dependencies": [
+            "light"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "flux_led": {
+        "domain": "flux_led",
+        "name": "Flux LED/MagicLight",
+        "documentation": "https://www.home-assistant.io/integrations/flux_led",
+        "requirements": [
+            "flux_led==0.22"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "folder": {
+        "domain": "folder",
+        "name": "Folder",
+        "documentation": "https://www.home-assistant.io/integrations/folder",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "folder_watcher": {
+        "domain": "folder_watcher",
+        "name": "Folder Watcher",
+        "documentation": "https://www.home-assistant.io/integrations/folder_watcher",
+        "requirements": [
+            "watchdog==0.8.3"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "foobot": {
+        "domain": "foobot",
+        "name": "Foobot",
+        "documentation": "https://www.home-assistant.io/integrations/foobot",
+        "requirements": [
+            "foobot_async==0.3.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fortigate": {
+        "domain": "fortigate",
+        "name": "FortiGate",
+        "documentation": "https://www.home-assistant.io/integrations/fortigate",
+        "dependencies": [],
+        "codeowners": [
+            "@kifeo"
+        ],
+        "requirements": [
+            "pyfgt==0.5.1"
+        ]
+    },
+    "fortios": {
+        "domain": "fortios",
+        "name": "Home Assistant Device Tracker to support FortiOS",
+        "documentation": "https://www.home-assistant.io/integrations/fortios/",
+        "requirements": [
+            "fortiosapi==0.10.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kimfrellsen"
+        ]
+    },
+    "foscam": {
+        "domain": "foscam",
+        "name": "Foscam",
+        "documentation": "https://www.home-assistant.io/integrations/foscam",
+        "requirements": [
+            "libpyfoscam==1.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@skgsergio"
+        ]
+    },
+    "foursquare": {
+        "domain": "foursquare",
+        "name": "Foursquare",
+        "documentation": "https://www.home-assistant.io/integrations/foursquare",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "free_mobile": {
+        "domain": "free_mobile",
+        "name": "Free Mobile",
+        "documentation": "https://www.home-assistant.io/integrations/free_mobile",
+        "requirements": [
+            "freesms==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "freebox": {
+        "domain": "freebox",
+        "name": "Freebox",
+        "documentation": "https://www.home-assistant.io/integrations/freebox",
+        "requirements": [
+            "aiofreepybox==0.0.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@snoof85"
+        ]
+    },
+    "freedns": {
+        "domain": "freedns",
+        "name": "FreeDNS",
+        "documentation": "https://www.home-assistant.io/integrations/freedns",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fritz": {
+        "domain": "fritz",
+        "name": "AVM Fritzbox",
+        "documentation": "https://www.home-assistant.io/integrations/fritz",
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fritzbox": {
+        "domain": "fritzbox",
+        "name": "AVM FRITZ!Box",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox",
+        "requirements": [
+            "pyfritzhome==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fritzbox_callmonitor": {
+        "domain": "fritzbox_callmonitor",
+        "name": "AVM FRITZ!Box Call Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_callmonitor",
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fritzbox_netmonitor": {
+        "domain": "fritzbox_netmonitor",
+        "name": "AVM FRITZ!Box Net Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_netmonitor",
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "fronius": {
+        "domain": "fronius",
+        "name": "Fronius",
+        "documentation": "https://www.home-assistant.io/integrations/fronius",
+        "requirements": [
+            "pyfronius==0.4.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@nielstron"
+        ]
+    },
+    "frontend": {
+        "domain": "frontend",
+        "name": "Home Assistant Frontend",
+        "documentation": "https://www.home-assistant.io/integrations/frontend",
+        "requirements": [
+            "home-assistant-frontend==20200130.2"
+        ],
+        "dependencies": [
+            "api",
+            "auth",
+            "http",
+            "lovelace",
+            "onboarding",
+            "search",
+            "system_log",
+            "websocket_api"
+        ],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "quality_scale": "internal"
+    },
+    "frontier_silicon": {
+        "domain": "frontier_silicon",
+        "name": "Frontier Silicon",
+        "documentation": "https://www.home-assistant.io/integrations/frontier_silicon",
+        "requirements": [
+            "afsapi==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "futurenow": {
+        "domain": "futurenow",
+        "name": "P5 FutureNow",
+        "documentation": "https://www.home-assistant.io/integrations/futurenow",
+        "requirements": [
+            "pyfnip==0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "garadget": {
+        "domain": "garadget",
+        "name": "Garadget",
+        "documentation": "https://www.home-assistant.io/integrations/garadget",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "garmin_connect": {
+        "domain": "garmin_connect",
+        "name": "Garmin Connect",
+        "documentation": "https://www.home-assistant.io/integrations/garmin_connect",
+        "dependencies": [],
+        "requirements": [
+            "garminconnect==0.1.8"
+        ],
+        "codeowners": [
+            "@cyberjunky"
+        ],
+        "config_flow": True
+    },
+    "gc100": {
+        "domain": "gc100",
+        "name": "Global Cach\u00e9 GC-100",
+        "documentation": "https://www.home-assistant.io/integrations/gc100",
+        "requirements": [
+            "python-gc100==1.0.3a"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "gdacs": {
+        "domain": "gdacs",
+        "name": "Global Disaster Alert and Coordination System (GDACS)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gdacs",
+        "requirements": [
+            "aio_georss_gdacs==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "quality_scale": "platinum"
+    },
+    "gearbest": {
+        "domain": "gearbest",
+        "name": "Gearbest",
+        "documentation": "https://www.home-assistant.io/integrations/gearbest",
+        "requirements": [
+            "gearbest_parser==1.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@HerrHofrat"
+        ]
+    },
+    "geizhals": {
+        "domain": "geizhals",
+        "name": "Geizhals",
+        "documentation": "https://www.home-assistant.io/integrations/geizhals",
+        "requirements": [
+            "geizhals==0.0.9"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "generic": {
+        "domain": "generic",
+        "name": "Generic",
+        "documentation": "https://www.home-assistant.io/integrations/generic",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "generic_thermostat": {
+        "domain": "generic_thermostat",
+        "name": "Generic Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/generic_thermostat",
+        "requirements": [],
+        "dependencies": [
+            "sensor",
+            "switch"
+        ],
+        "codeowners": []
+    },
+    "geniushub": {
+        "domain": "geniushub",
+        "name": "Genius Hub",
+        "documentation": "https://www.home-assistant.io/integrations/geniushub",
+        "requirements": [
+            "geniushub-client==0.6.30"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "geo_json_events": {
+        "domain": "geo_json_events",
+        "name": "GeoJSON",
+        "documentation": "https://www.home-assistant.io/integrations/geo_json_events",
+        "requirements": [
+            "geojson_client==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "geo_location": {
+        "domain": "geo_location",
+        "name": "Geolocation",
+        "documentation": "https://www.home-assistant.io/integrations/geo_location",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "geo_rss_events": {
+        "domain": "geo_rss_events",
+        "name": "GeoRSS",
+        "documentation": "https://www.home-assistant.io/integrations/geo_rss_events",
+        "requirements": [
+            "georss_generic_client==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "geofency": {
+        "domain": "geofency",
+        "name": "Geofency",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geofency",
+        "requirements": [],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "geonetnz_quakes": {
+        "domain": "geonetnz_quakes",
+        "name": "GeoNet NZ Quakes",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_quakes",
+        "requirements": [
+            "aio_geojson_geonetnz_quakes==0.11"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "geonetnz_volcano": {
+        "domain": "geonetnz_volcano",
+        "name": "GeoNet NZ Volcano",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_volcano",
+        "requirements": [
+            "aio_geojson_geonetnz_volcano==0.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "gios": {
+        "domain": "gios",
+        "name": "GIO\u015a",
+        "documentation": "https://www.home-assistant.io/integrations/gios",
+        "dependencies": [],
+        "codeowners": [
+            "@bieniu"
+        ],
+        "requirements": [
+            "gios==0.0.3"
+        ],
+        "config_flow": True
+    },
+    "github": {
+        "domain": "github",
+        "name": "GitHub",
+        "documentation": "https://www.home-assistant.io/integrations/github",
+        "requirements": [
+            "PyGithub==1.43.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "gitlab_ci": {
+        "domain": "gitlab_ci",
+        "name": "GitLab-CI",
+        "documentation": "https://www.home-assistant.io/integrations/gitlab_ci",
+        "requirements": [
+            "python-gitlab==1.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "gitter": {
+        "domain": "gitter",
+        "name": "Gitter",
+        "documentation": "https://www.home-assistant.io/integrations/gitter",
+        "requirements": [
+            "gitterpy==0.1.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "glances": {
+        "domain": "glances",
+        "name": "Glances",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/glances",
+        "requirements": [
+            "glances_api==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff",
+            "@engrbm87"
+        ]
+    },
+    "gntp": {
+        "domain": "gntp",
+        "name": "Growl (GnGNTP)",
+        "documentation": "https://www.home-assistant.io/integrations/gntp",
+        "requirements": [
+            "gntp==1.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "goalfeed": {
+        "domain": "goalfeed",
+        "name": "Goalfeed",
+        "documentation": "https://www.home-assistant.io/integrations/goalfeed",
+        "requirements": [
+            "pysher==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "gogogate2": {
+        "domain": "gogogate2",
+        "name": "Gogogate2",
+        "documentation": "https://www.home-assistant.io/integrations/gogogate2",
+        "requirements": [
+            "pygogogate2==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "google": {
+        "domain": "google",
+        "name": "Google Calendars",
+        "documentation": "https://www.home-assistant.io/integrations/google",
+        "requirements": [
+            "google-api-python-client==1.6.4",
+            "httplib2==0.10.3",
+            "oauth2client==4.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "google_assistant": {
+        "domain": "google_assistant",
+        "name": "Google Assistant",
+        "documentation": "https://www.home-assistant.io/integrations/google_assistant",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "camera"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud"
+        ]
+    },
+    "google_cloud": {
+        "domain": "google_cloud",
+        "name": "Google Cloud Platform",
+        "documentation": "https://www.home-assistant.io/integrations/google_cloud",
+        "requirements": [
+            "google-cloud-texttospeech==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@lufton"
+        ]
+    },
+    "google_domains": {
+        "domain": "google_domains",
+        "name": "Google Domains",
+        "documentation": "https://www.home-assistant.io/integrations/google_domains",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "google_maps": {
+        "domain": "google_maps",
+        "name": "Google Maps",
+        "documentation": "https://www.home-assistant.io/integrations/google_maps",
+        "requirements": [
+            "locationsharinglib==4.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "google_pubsub": {
+        "domain": "google_pubsub",
+        "name": "Google Pub/Sub",
+        "documentation": "https://www.home-assistant.io/integrations/google_pubsub",
+        "requirements": [
+            "google-cloud-pubsub==0.39.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "google_translate": {
+        "domain": "google_translate",
+        "name": "Google Translate Text-to-Speech",
+        "documentation": "https://www.home-assistant.io/integrations/google_translate",
+        "requirements": [
+            "gTTS-token==1.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@awarecan"
+        ]
+    },
+    "google_travel_time": {
+        "domain": "google_travel_time",
+        "name": "Google Maps Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/google_travel_time",
+        "requirements": [
+            "googlemaps==2.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "google_wifi": {
+        "domain": "google_wifi",
+        "name": "Google Wifi",
+        "documentation": "https://www.home-assistant.io/integrations/google_wifi",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "gpmdp": {
+        "domain": "gpmdp",
+        "name": "Google Play Music Desktop Player (GPMDP)",
+        "documentation": "https://www.home-assistant.io/integrations/gpmdp",
+        "requirements": [
+            "websocket-client==0.54.0"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "gpsd": {
+        "domain": "gpsd",
+        "name": "GPSD",
+        "documentation": "https://www.home-assistant.io/integrations/gpsd",
+        "requirements": [
+            "gps3==0.33.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "gpslogger": {
+        "domain": "gpslogger",
+        "name": "GPSLogger",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gpslogger",
+        "requirements": [],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "graphite": {
+        "domain": "graphite",
+        "name": "Graphite",
+        "documentation": "https://www.home-assistant.io/integrations/graphite",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "greeneye_monitor": {
+        "domain": "greeneye_monitor",
+        "name": "GreenEye Monitor (GEM)",
+        "documentation": "https://www.home-assistant.io/integrations/greeneye_monitor",
+        "requirements": [
+            "greeneye_monitor==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jkeljo"
+        ]
+    },
+    "greenwave": {
+        "domain": "greenwave",
+        "name": "Greenwave Reality",
+        "documentation": "https://www.home-assistant.io/integrations/greenwave",
+        "requirements": [
+            "greenwavereality==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "group": {
+        "domain": "group",
+        "name": "Group",
+        "documentation": "https://www.home-assistant.io/integrations/group",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "growatt_server": {
+        "domain": "growatt_server",
+        "name": "Growatt",
+        "documentation": "https://www.home-assistant.io/integrations/growatt_server/",
+        "requirements": [
+            "growattServer==0.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@indykoning"
+        ]
+    },
+    "gstreamer": {
+        "domain": "gstreamer",
+        "name": "GStreamer",
+        "documentation": "https://www.home-assistant.io/integrations/gstreamer",
+        "requirements": [
+            "gstreamer-player==1.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "gtfs": {
+        "domain": "gtfs",
+        "name": "General Transit Feed Specification (GTFS)",
+        "documentation": "https://www.home-assistant.io/integrations/gtfs",
+        "requirements": [
+            "pygtfs==0.1.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "habitica": {
+        "domain": "habitica",
+        "name": "Habitica",
+        "documentation": "https://www.home-assistant.io/integrations/habitica",
+        "requirements": [
+            "habitipy==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hangouts": {
+        "domain": "hangouts",
+        "name": "Google Hangouts",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hangouts",
+        "requirements": [
+            "hangups==0.4.9"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "harman_kardon_avr": {
+        "domain": "harman_kardon_avr",
+        "name": "Harman Kardon AVR",
+        "documentation": "https://www.home-assistant.io/integrations/harman_kardon_avr",
+        "requirements": [
+            "hkavr==0.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "harmony": {
+        "domain": "harmony",
+        "name": "Logitech Harmony Hub",
+        "documentation": "https://www.home-assistant.io/integrations/harmony",
+        "requirements": [
+            "aioharmony==0.1.13"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ehendrix23"
+        ]
+    },
+    "hassio": {
+        "domain": "hassio",
+        "name": "Hass.io",
+        "documentation": "https://www.home-assistant.io/hassio",
+        "requirements": [],
+        "dependencies": [
+            "http",
+            "panel_custom"
+        ],
+        "codeowners": [
+            "@home-assistant/hass-io"
+        ]
+    },
+    "haveibeenpwned": {
+        "domain": "haveibeenpwned",
+        "name": "HaveIBeenPwned",
+        "documentation": "https://www.home-assistant.io/integrations/haveibeenpwned",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hddtemp": {
+        "domain": "hddtemp",
+        "name": "hddtemp",
+        "documentation": "https://www.home-assistant.io/integrations/hddtemp",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hdmi_cec": {
+        "domain": "hdmi_cec",
+        "name": "HDMI-CEC",
+        "documentation": "https://www.home-assistant.io/integrations/hdmi_cec",
+        "requirements": [
+            "pyCEC==0.4.13"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "heatmiser": {
+        "domain": "heatmiser",
+        "name": "Heatmiser",
+        "documentation": "https://www.home-assistant.io/integrations/heatmiser",
+        "requirements": [
+            "heatmiserV3==1.1.18"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@andylockran"
+        ]
+    },
+    "heos": {
+        "domain": "heos",
+        "name": "Denon HEOS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/heos",
+        "requirements": [
+            "pyheos==0.6.0"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-denon-com:device:ACT-Denon:1"
+            }
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@andrewsayre"
+        ]
+    },
+    "here_travel_time": {
+        "domain": "here_travel_time",
+        "name": "HERE Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/here_travel_time",
+        "requirements": [
+            "herepy==2.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@eifinger"
+        ]
+    },
+    "hikvision": {
+        "domain": "hikvision",
+        "name": "Hikvision",
+        "documentation": "https://www.home-assistant.io/integrations/hikvision",
+        "requirements": [
+            "pyhik==0.2.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mezz64"
+        ]
+    },
+    "hikvisioncam": {
+        "domain": "hikvisioncam",
+        "name": "Hikvision",
+        "documentation": "https://www.home-assistant.io/integrations/hikvisioncam",
+        "requirements": [
+            "hikvision==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "hisense_aehw4a1": {
+        "domain": "hisense_aehw4a1",
+        "name": "Hisense AEH-W4A1",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hisense_aehw4a1",
+        "requirements": [
+            "pyaehw4a1==0.3.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bannhead"
+        ]
+    },
+    "history": {
+        "domain": "history",
+        "name": "History",
+        "documentation": "https://www.home-assistant.io/integrations/history",
+        "requirements": [],
+        "dependencies": [
+            "http",
+            "recorder"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "history_graph": {
+        "domain": "history_graph",
+        "name": "History Graph",
+        "documentation": "https://www.home-assistant.io/integrations/history_graph",
+        "requirements": [],
+        "dependencies": [
+            "history"
+        ],
+        "codeowners": [
+            "@andrey-git"
+        ],
+        "quality_scale": "internal"
+    },
+    "history_stats": {
+        "domain": "history_stats",
+        "name": "History Stats",
+        "documentation": "https://www.home-assistant.io/integrations/history_stats",
+        "requirements": [],
+        "dependencies": [
+            "history"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "hitron_coda": {
+        "domain": "hitron_coda",
+        "name": "Rogers Hitron CODA",
+        "documentation": "https://www.home-assistant.io/integrations/hitron_coda",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hive": {
+        "domain": "hive",
+        "name": "Hive",
+        "documentation": "https://www.home-assistant.io/integrations/hive",
+        "requirements": [
+            "pyhiveapi==0.2.19.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Rendili",
+            "@KJonline"
+        ]
+    },
+    "hlk_sw16": {
+        "domain": "hlk_sw16",
+        "name": "Hi-Link HLK-SW16",
+        "documentation": "https://www.home-assistant.io/integrations/hlk_sw16",
+        "requirements": [
+            "hlk-sw16==0.0.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "homeassistant": {
+        "domain": "homeassistant",
+        "name": "Home Assistant Core Integration",
+        "documentation": "https://www.home-assistant.io/integrations/homeassistant",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "homekit": {
+        "domain": "homekit",
+        "name": "HomeKit",
+        "documentation": "https://www.home-assistant.io/integrations/homekit",
+        "requirements": [
+            "HAP-python==2.7.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "homekit_controller": {
+        "domain": "homekit_controller",
+        "name": "HomeKit Controller",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homekit_controller",
+        "requirements": [
+            "homekit[IP]==0.15.0"
+        ],
+        "dependencies": [],
+        "zeroconf": [
+            "_hap._tcp.local."
+        ],
+        "codeowners": [
+            "@Jc2k"
+        ]
+    },
+    "homematic": {
+        "domain": "homematic",
+        "name": "Homematic",
+        "documentation": "https://www.home-assistant.io/integrations/homematic",
+        "requirements": [
+            "pyhomematic==0.1.64"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@pvizeli",
+            "@danielperna84"
+        ]
+    },
+    "homematicip_cloud": {
+        "domain": "homematicip_cloud",
+        "name": "HomematicIP Cloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homematicip_cloud",
+        "requirements": [
+            "homematicip==0.10.15"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@SukramJ"
+        ],
+        "quality_scale": "platinum"
+    },
+    "homeworks": {
+        "domain": "homeworks",
+        "name": "Lutron Homeworks",
+        "documentation": "https://www.home-assistant.io/integrations/homeworks",
+        "requirements": [
+            "pyhomeworks==0.0.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "honeywell": {
+        "domain": "honeywell",
+        "name": "Honeywell Total Connect Comfort (US)",
+        "documentation": "https://www.home-assistant.io/integrations/honeywell",
+        "requirements": [
+            "somecomfort==0.5.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "horizon": {
+        "domain": "horizon",
+        "name": "Unitymedia Horizon HD Recorder",
+        "documentation": "https://www.home-assistant.io/integrations/horizon",
+        "requirements": [
+            "horimote==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hp_ilo": {
+        "domain": "hp_ilo",
+        "name": "HP Integrated Lights-Out (ILO)",
+        "documentation": "https://www.home-assistant.io/integrations/hp_ilo",
+        "requirements": [
+            "python-hpilo==4.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "html5": {
+        "domain": "html5",
+        "name": "HTML5 Push Notifications",
+        "documentation": "https://www.home-assistant.io/integrations/html5",
+        "requirements": [
+            "pywebpush==1.9.2"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "http": {
+        "domain": "http",
+        "name": "HTTP",
+        "documentation": "https://www.home-assistant.io/integrations/http",
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "htu21d": {
+        "domain": "htu21d",
+        "name": "HTU21D(F) Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/htu21d",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "huawei_lte": {
+        "domain": "huawei_lte",
+        "name": "Huawei LTE",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/huawei_lte",
+        "requirements": [
+            "getmac==0.8.1",
+            "huawei-lte-api==1.4.7",
+            "stringcase==1.2.0",
+            "url-normalize==1.4.1"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "manufacturer": "Huawei"
+            }
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@scop"
+        ]
+    },
+    "huawei_router": {
+        "domain": "huawei_router",
+        "name": "Huawei Router",
+        "documentation": "https://www.home-assistant.io/integrations/huawei_router",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@abmantis"
+        ]
+    },
+    "hue": {
+        "domain": "hue",
+        "name": "Philips Hue",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hue",
+        "requirements": [
+            "aiohue==1.10.1"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2012"
+            },
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2015"
+            },
+            {
+                "manufacturer": "Signify",
+                "modelName": "Philips hue bridge 2015"
+            }
+        ],
+        "homekit": {
+            "models": [
+                "BSB002"
+            ]
+        },
+        "dependencies": [],
+        "codeowners": [
+            "@balloob"
+        ],
+        "quality_scale": "platinum"
+    },
+    "hunterdouglas_powerview": {
+        "domain": "hunterdouglas_powerview",
+        "name": "Hunter Douglas PowerView",
+        "documentation": "https://www.home-assistant.io/integrations/hunterdouglas_powerview",
+        "requirements": [
+            "aiopvapi==1.6.14"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hydrawise": {
+        "domain": "hydrawise",
+        "name": "Hunter Hydrawise",
+        "documentation": "https://www.home-assistant.io/integrations/hydrawise",
+        "requirements": [
+            "hydrawiser==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "hyperion": {
+        "domain": "hyperion",
+        "name": "Hyperion",
+        "documentation": "https://www.home-assistant.io/integrations/hyperion",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ialarm": {
+        "domain": "ialarm",
+        "name": "Antifurto365 iAlarm",
+        "documentation": "https://www.home-assistant.io/integrations/ialarm",
+        "requirements": [
+            "pyialarm==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "iaqualink": {
+        "domain": "iaqualink",
+        "name": "Jandy iAqualink",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iaqualink/",
+        "dependencies": [],
+        "codeowners": [
+            "@flz"
+        ],
+        "requirements": [
+            "iaqualink==0.3.1"
+        ]
+    },
+    "icloud": {
+        "domain": "icloud",
+        "name": "Apple iCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/icloud",
+        "requirements": [
+            "pyicloud==0.9.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Quentame"
+        ]
+    },
+    "idteck_prox": {
+        "domain": "idteck_prox",
+        "name": "IDTECK Proximity Reader",
+        "documentation": "https://www.home-assistant.io/integrations/idteck_prox",
+        "requirements": [
+            "rfk101py==0.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ifttt": {
+        "domain": "ifttt",
+        "name": "IFTTT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ifttt",
+        "requirements": [
+            "pyfttt==0.3"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "iglo": {
+        "domain": "iglo",
+        "name": "iGlo",
+        "documentation": "https://www.home-assistant.io/integrations/iglo",
+        "requirements": [
+            "iglo==1.2.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ign_sismologia": {
+        "domain": "ign_sismologia",
+        "name": "IGN Sismolog\u00eda",
+        "documentation": "https://www.home-assistant.io/integrations/ign_sismologia",
+        "requirements": [
+            "georss_ign_sismologia_client==0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "ihc": {
+        "domain": "ihc",
+        "name": "IHC Controller",
+        "documentation": "https://www.home-assistant.io/integrations/ihc",
+        "requirements": [
+            "defusedxml==0.6.0",
+            "ihcsdk==2.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "image_processing": {
+        "domain": "image_processing",
+        "name": "Image Processing",
+        "documentation": "https://www.home-assistant.io/integrations/image_processing",
+        "requirements": [],
+        "dependencies": [
+            "camera"
+        ],
+        "codeowners": []
+    },
+    "imap": {
+        "domain": "imap",
+        "name": "IMAP",
+        "documentation": "https://www.home-assistant.io/integrations/imap",
+        "requirements": [
+            "aioimaplib==0.7.15"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "imap_email_content": {
+        "domain": "imap_email_content",
+        "name": "IMAP Email Content",
+        "documentation": "https://www.home-assistant.io/integrations/imap_email_content",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "incomfort": {
+        "domain": "incomfort",
+        "name": "Intergas InComfort/Intouch Lan2RF gateway",
+        "documentation": "https://www.home-assistant.io/integrations/incomfort",
+        "requirements": [
+            "incomfort-client==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "influxdb": {
+        "domain": "influxdb",
+        "name": "InfluxDB",
+        "documentation": "https://www.home-assistant.io/integrations/influxdb",
+        "requirements": [
+            "influxdb==5.2.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "input_boolean": {
+        "domain": "input_boolean",
+        "name": "Input Boolean",
+        "documentation": "https://www.home-assistant.io/integrations/input_boolean",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_datetime": {
+        "domain": "input_datetime",
+        "name": "Input Datetime",
+        "documentation": "https://www.home-assistant.io/integrations/input_datetime",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_number": {
+        "domain": "input_number",
+        "name": "Input Number",
+        "documentation": "https://www.home-assistant.io/integrations/input_number",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_select": {
+        "domain": "input_select",
+        "name": "Input Select",
+        "documentation": "https://www.home-assistant.io/integrations/input_select",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_text": {
+        "domain": "input_text",
+        "name": "Input Text",
+        "documentation": "https://www.home-assistant.io/integrations/input_text",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "insteon": {
+        "domain": "insteon",
+        "name": "Insteon",
+        "documentation": "https://www.home-assistant.io/integrations/insteon",
+        "requirements": [
+            "insteonplm==0.16.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "integration": {
+        "domain": "integration",
+        "name": "Integration - Riemann sum integral",
+        "documentation": "https://www.home-assistant.io/integrations/integration",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@dgomes"
+        ],
+        "quality_scale": "internal"
+    },
+    "intent": {
+        "domain": "intent",
+        "name": "Intent",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/intent",
+        "requirements": [],
+        "ssdp": [],
+        "homekit": {},
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "intent_script": {
+        "domain": "intent_script",
+        "name": "Intent Script",
+        "documentation": "https://www.home-assistant.io/integrations/intent_script",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "intesishome": {
+        "domain": "intesishome",
+        "name": "IntesisHome",
+        "documentation": "https://www.home-assistant.io/integrations/intesishome",
+        "dependencies": [],
+        "codeowners": [
+            "@jnimmo"
+        ],
+        "requirements": [
+            "pyintesishome==1.6"
+        ]
+    },
+    "ios": {
+        "domain": "ios",
+        "name": "Apple iOS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ios",
+        "requirements": [],
+        "dependencies": [
+            "device_tracker",
+            "http",
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "iota": {
+        "domain": "iota",
+        "name": "IOTA",
+        "documentation": "https://www.home-assistant.io/integrations/iota",
+        "requirements": [
+            "pyota==2.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "iperf3": {
+        "domain": "iperf3",
+        "name": "Iperf3",
+        "documentation": "https://www.home-assistant.io/integrations/iperf3",
+        "requirements": [
+            "iperf3==0.1.11"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "ipma": {
+        "domain": "ipma",
+        "name": "Instituto Portugu\u00eas do Mar e Atmosfera (IPMA)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ipma",
+        "requirements": [
+            "pyipma==2.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dgomes",
+            "@abmantis"
+        ]
+    },
+    "iqvia": {
+        "domain": "iqvia",
+        "name": "IQVIA",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iqvia",
+        "requirements": [
+            "numpy==1.18.1",
+            "pyiqvia==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "irish_rail_transport": {
+        "domain": "irish_rail_transport",
+        "name": "Irish Rail Transport",
+        "documentation": "https://www.home-assistant.io/integrations/irish_rail_transport",
+        "requirements": [
+            "pyirishrail==0.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ttroy50"
+        ]
+    },
+    "islamic_prayer_times": {
+        "domain": "islamic_prayer_times",
+        "name": "Islamic Prayer Times",
+        "documentation": "https://www.home-assistant.io/integrations/islamic_prayer_times",
+        "requirements": [
+            "prayer_times_calculator==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "iss": {
+        "domain": "iss",
+        "name": "International Space Station (ISS)",
+        "documentation": "https://www.home-assistant.io/integrations/iss",
+        "requirements": [
+            "pyiss==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "isy994": {
+        "domain": "isy994",
+        "name": "Universal Devices ISY994",
+        "documentation": "https://www.home-assistant.io/integrations/isy994",
+        "requirements": [
+            "PyISY==1.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "itach": {
+        "domain": "itach",
+        "name": "Global Cach\u00e9 iTach TCP/IP to IR",
+        "documentation": "https://www.home-assistant.io/integrations/itach",
+        "requirements": [
+            "pyitachip2ir==0.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "itunes": {
+        "domain": "itunes",
+        "name": "Apple iTunes",
+        "documentation": "https://www.home-assistant.io/integrations/itunes",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "izone": {
+        "domain": "izone",
+        "name": "iZone",
+        "documentation": "https://www.home-assistant.io/integrations/izone",
+        "requirements": [
+            "python-izone==1.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Swamp-Ig"
+        ],
+        "config_flow": True
+    },
+    "jewish_calendar": {
+        "domain": "jewish_calendar",
+        "name": "Jewish Calendar",
+        "documentation": "https://www.home-assistant.io/integrations/jewish_calendar",
+        "requirements": [
+            "hdate==0.9.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@tsvi"
+        ]
+    },
+    "joaoapps_join": {
+        "domain": "joaoapps_join",
+        "name": "Joaoapps Join",
+        "documentation": "https://www.home-assistant.io/integrations/joaoapps_join",
+        "requirements": [
+            "python-join-api==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "juicenet": {
+        "domain": "juicenet",
+        "name": "JuiceNet",
+        "documentation": "https://www.home-assistant.io/integrations/juicenet",
+        "requirements": [
+            "python-juicenet==0.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jesserockz"
+        ]
+    },
+    "kaiterra": {
+        "domain": "kaiterra",
+        "name": "Kaiterra",
+        "documentation": "https://www.home-assistant.io/integrations/kaiterra",
+        "requirements": [
+            "kaiterra-async-client==0.0.2"
+        ],
+        "codeowners": [
+            "@Michsior14"
+        ],
+        "dependencies": []
+    },
+    "kankun": {
+        "domain": "kankun",
+        "name": "Kankun",
+        "documentation": "https://www.home-assistant.io/integrations/kankun",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "keba": {
+        "domain": "keba",
+        "name": "Keba Charging Station",
+        "documentation": "https://www.home-assistant.io/integrations/keba",
+        "requirements": [
+            "keba-kecontact==1.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dannerph"
+        ]
+    },
+    "keenetic_ndms2": {
+        "domain": "keenetic_ndms2",
+        "name": "Keenetic NDMS2 Routers",
+        "documentation": "https://www.home-assistant.io/integrations/keenetic_ndms2",
+        "requirements": [
+            "ndms2_client==0.0.11"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@foxel"
+        ]
+    },
+    "kef": {
+        "domain": "kef",
+        "name": "KEF",
+        "documentation": "https://www.home-assistant.io/integrations/kef",
+        "dependencies": [],
+        "codeowners": [
+            "@basnijholt"
+        ],
+        "requirements": [
+            "aiokef==0.2.7",
+            "getmac==0.8.1"
+        ]
+    },
+    "keyboard": {
+        "domain": "keyboard",
+        "name": "Keyboard",
+        "documentation": "https://www.home-assistant.io/integrations/keyboard",
+        "requirements": [
+            "pyuserinput==0.1.11"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "keyboard_remote": {
+        "domain": "keyboard_remote",
+        "name": "Keyboard Remote",
+        "documentation": "https://www.home-assistant.io/integrations/keyboard_remote",
+        "requirements": [
+            "evdev==1.1.2",
+            "aionotify==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bendavid"
+        ]
+    },
+    "kira": {
+        "domain": "kira",
+        "name": "Kira",
+        "documentation": "https://www.home-assistant.io/integrations/kira",
+        "requirements": [
+            "pykira==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "kiwi": {
+        "domain": "kiwi",
+        "name": "KIWI",
+        "documentation": "https://www.home-assistant.io/integrations/kiwi",
+        "requirements": [
+            "kiwiki-client==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "knx": {
+        "domain": "knx",
+        "name": "KNX",
+        "documentation": "https://www.home-assistant.io/integrations/knx",
+        "requirements": [
+            "xknx==0.11.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Julius2342"
+        ]
+    },
+    "kodi": {
+        "domain": "kodi",
+        "name": "Kodi",
+        "documentation": "https://www.home-assistant.io/integrations/kodi",
+        "requirements": [
+            "jsonrpc-async==0.6",
+            "jsonrpc-websocket==0.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@armills"
+        ]
+    },
+    "konnected": {
+        "domain": "konnected",
+        "name": "Konnected",
+        "documentation": "https://www.home-assistant.io/integrations/konnected",
+        "requirements": [
+            "konnected==0.1.5"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@heythisisnate"
+        ]
+    },
+    "kwb": {
+        "domain": "kwb",
+        "name": "KWB Easyfire",
+        "documentation": "https://www.home-assistant.io/integrations/kwb",
+        "requirements": [
+            "pykwb==0.0.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lacrosse": {
+        "domain": "lacrosse",
+        "name": "LaCrosse",
+        "documentation": "https://www.home-assistant.io/integrations/lacrosse",
+        "requirements": [
+            "pylacrosse==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lametric": {
+        "domain": "lametric",
+        "name": "LaMetric",
+        "documentation": "https://www.home-assistant.io/integrations/lametric",
+        "requirements": [
+            "lmnotify==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "lannouncer": {
+        "domain": "lannouncer",
+        "name": "LANnouncer",
+        "documentation": "https://www.home-assistant.io/integrations/lannouncer",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lastfm": {
+        "domain": "lastfm",
+        "name": "Last.fm",
+        "documentation": "https://www.home-assistant.io/integrations/lastfm",
+        "requirements": [
+            "pylast==3.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "launch_library": {
+        "domain": "launch_library",
+        "name": "Launch Library",
+        "documentation": "https://www.home-assistant.io/integrations/launch_library",
+        "requirements": [
+            "pylaunches==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "lcn": {
+        "domain": "lcn",
+        "name": "LCN",
+        "documentation": "https://www.home-assistant.io/integrations/lcn",
+        "requirements": [
+            "pypck==0.6.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@alengwenus"
+        ]
+    },
+    "lg_netcast": {
+        "domain": "lg_netcast",
+        "name": "LG Netcast",
+        "documentation": "https://www.home-assistant.io/integrations/lg_netcast",
+        "requirements": [
+            "pylgnetcast-homeassistant==0.2.0.dev0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lg_soundbar": {
+        "domain": "lg_soundbar",
+        "name": "LG Soundbars",
+        "documentation": "https://www.home-assistant.io/integrations/lg_soundbar",
+        "requirements": [
+            "temescal==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "life360": {
+        "domain": "life360",
+        "name": "Life360",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/life360",
+        "dependencies": [],
+        "codeowners": [
+            "@pnbruckner"
+        ],
+        "requirements": [
+            "life360==4.1.1"
+        ]
+    },
+    "lifx": {
+        "domain": "lifx",
+        "name": "LIFX",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/lifx",
+        "requirements": [
+            "aiolifx==0.6.7",
+            "aiolifx_effects==0.2.2"
+        ],
+        "homekit": {
+            "models": [
+                "LIFX"
+            ]
+        },
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lifx_cloud": {
+        "domain": "lifx_cloud",
+        "name": "LIFX Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/lifx_cloud",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lifx_legacy": {
+        "domain": "lifx_legacy",
+        "name": "LIFX Legacy",
+        "documentation": "https://www.home-assistant.io/integrations/lifx_legacy",
+        "requirements": [
+            "liffylights==0.9.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "light": {
+        "domain": "light",
+        "name": "Light",
+        "documentation": "https://www.home-assistant.io/integrations/light",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "lightwave": {
+        "domain": "lightwave",
+        "name": "Lightwave",
+        "documentation": "https://www.home-assistant.io/integrations/lightwave",
+        "requirements": [
+            "lightwave==0.17"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "limitlessled": {
+        "domain": "limitlessled",
+        "name": "LimitlessLED",
+        "documentation": "https://www.home-assistant.io/integrations/limitlessled",
+        "requirements": [
+            "limitlessled==1.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "linksys_smart": {
+        "domain": "linksys_smart",
+        "name": "Linksys Smart Wi-Fi",
+        "documentation": "https://www.home-assistant.io/integrations/linksys_smart",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "linky": {
+        "domain": "linky",
+        "name": "Enedis Linky",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/linky",
+        "requirements": [
+            "pylinky==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Quentame"
+        ]
+    },
+    "linode": {
+        "domain": "linode",
+        "name": "Linode",
+        "documentation": "https://www.home-assistant.io/integrations/linode",
+        "requirements": [
+            "linode-api==4.1.9b1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "linux_battery": {
+        "domain": "linux_battery",
+        "name": "Linux Battery",
+        "documentation": "https://www.home-assistant.io/integrations/linux_battery",
+        "requirements": [
+            "batinfo==0.4.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "lirc": {
+        "domain": "lirc",
+        "name": "LIRC",
+        "documentation": "https://www.home-assistant.io/integrations/lirc",
+        "requirements": [
+            "python-lirc==1.2.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "litejet": {
+        "domain": "litejet",
+        "name": "LiteJet",
+        "documentation": "https://www.home-assistant.io/integrations/litejet",
+        "requirements": [
+            "pylitejet==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "llamalab_automate": {
+        "domain": "llamalab_automate",
+        "name": "LlamaLab Automate",
+        "documentation": "https://www.home-assistant.io/integrations/llamalab_automate",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "local_file": {
+        "domain": "local_file",
+        "name": "Local File",
+        "documentation": "https://www.home-assistant.io/integrations/local_file",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "local_ip": {
+        "domain": "local_ip",
+        "name": "Local IP Address",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/local_ip",
+        "dependencies": [],
+        "codeowners": [
+            "@issacg"
+        ],
+        "requirements": []
+    },
+    "locative": {
+        "domain": "locative",
+        "name": "Locative",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/locative",
+        "requirements": [],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "lock": {
+        "domain": "lock",
+        "name": "Lock",
+        "documentation": "https://www.home-assistant.io/integrations/lock",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "lockitron": {
+        "domain": "lockitron",
+        "name": "Lockitron",
+        "documentation": "https://www.home-assistant.io/integrations/lockitron",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "logbook": {
+        "domain": "logbook",
+        "name": "Logbook",
+        "documentation": "https://www.home-assistant.io/integrations/logbook",
+        "requirements": [],
+        "dependencies": [
+            "frontend",
+            "http",
+            "recorder"
+        ],
+        "after_dependencies": [
+            "homekit"
+        ],
+        "codeowners": []
+    },
+    "logentries": {
+        "domain": "logentries",
+        "name": "Logentries",
+        "documentation": "https://www.home-assistant.io/integrations/logentries",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "logger": {
+        "domain": "logger",
+        "name": "Logger",
+        "documentation": "https://www.home-assistant.io/integrations/logger",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "logi_circle": {
+        "domain": "logi_circle",
+        "name": "Logi Circle",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/logi_circle",
+        "requirements": [
+            "logi_circle==0.2.2"
+        ],
+        "dependencies": [
+            "ffmpeg",
+            "http"
+        ],
+        "codeowners": [
+            "@evanjd"
+        ]
+    },
+    "london_air": {
+        "domain": "london_air",
+        "name": "London Air",
+        "documentation": "https://www.home-assistant.io/integrations/london_air",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "london_underground": {
+        "domain": "london_underground",
+        "name": "London Underground",
+        "documentation": "https://www.home-assistant.io/integrations/london_underground",
+        "requirements": [
+            "london-tube-status==0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "loopenergy": {
+        "domain": "loopenergy",
+        "name": "Loop Energy",
+        "documentation": "https://www.home-assistant.io/integrations/loopenergy",
+        "requirements": [
+            "pyloopenergy==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lovelace": {
+        "domain": "lovelace",
+        "name": "Lovelace",
+        "documentation": "https://www.home-assistant.io/integrations/lovelace",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ]
+    },
+    "luci": {
+        "domain": "luci",
+        "name": "OpenWRT (luci)",
+        "documentation": "https://www.home-assistant.io/integrations/luci",
+        "requirements": [
+            "openwrt-luci-rpc==1.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fbradyirl",
+            "@mzdrale"
+        ]
+    },
+    "luftdaten": {
+        "domain": "luftdaten",
+        "name": "Luftdaten",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/luftdaten",
+        "requirements": [
+            "luftdaten==0.6.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "gold"
+    },
+    "lupusec": {
+        "domain": "lupusec",
+        "name": "Lupus Electronics LUPUSEC",
+        "documentation": "https://www.home-assistant.io/integrations/lupusec",
+        "requirements": [
+            "lupupy==0.0.18"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@majuss"
+        ]
+    },
+    "lutron": {
+        "domain": "lutron",
+        "name": "Lutron",
+        "documentation": "https://www.home-assistant.io/integrations/lutron",
+        "requirements": [
+            "pylutron==0.2.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@JonGilmore"
+        ]
+    },
+    "lutron_caseta": {
+        "domain": "lutron_caseta",
+        "name": "Lutron Caseta",
+        "documentation": "https://www.home-assistant.io/integrations/lutron_caseta",
+        "requirements": [
+            "pylutron-caseta==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lw12wifi": {
+        "domain": "lw12wifi",
+        "name": "LAGUTE LW-12",
+        "documentation": "https://www.home-assistant.io/integrations/lw12wifi",
+        "requirements": [
+            "lw12==0.9.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "lyft": {
+        "domain": "lyft",
+        "name": "Lyft",
+        "documentation": "https://www.home-assistant.io/integrations/lyft",
+        "requirements": [
+            "lyft_rides==0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "magicseaweed": {
+        "domain": "magicseaweed",
+        "name": "Magicseaweed",
+        "documentation": "https://www.home-assistant.io/integrations/magicseaweed",
+        "requirements": [
+            "magicseaweed==1.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mailbox": {
+        "domain": "mailbox",
+        "name": "Mailbox",
+        "documentation": "https://www.home-assistant.io/integrations/mailbox",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "mailgun": {
+        "domain": "mailgun",
+        "name": "Mailgun",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mailgun",
+        "requirements": [
+            "pymailgunner==1.4"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "manual": {
+        "domain": "manual",
+        "name": "Manual",
+        "documentation": "https://www.home-assistant.io/integrations/manual",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "manual_mqtt": {
+        "domain": "manual_mqtt",
+        "name": "Manual MQTT",
+        "documentation": "https://www.home-assistant.io/integrations/manual_mqtt",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "map": {
+        "domain": "map",
+        "name": "Map",
+        "documentation": "https://www.home-assistant.io/integrations/map",
+        "requirements": [],
+        "dependencies": [
+            "frontend"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "marytts": {
+        "domain": "marytts",
+        "name": "MaryTTS",
+        "documentation": "https://www.home-assistant.io/integrations/marytts",
+        "requirements": [
+            "speak2mary==1.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mastodon": {
+        "domain": "mastodon",
+        "name": "Mastodon",
+        "documentation": "https://www.home-assistant.io/integrations/mastodon",
+        "requirements": [
+            "Mastodon.py==1.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "matrix": {
+        "domain": "matrix",
+        "name": "Matrix",
+        "documentation": "https://www.home-assistant.io/integrations/matrix",
+        "requirements": [
+            "matrix-client==0.3.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@tinloaf"
+        ]
+    },
+    "maxcube": {
+        "domain": "maxcube",
+        "name": "eQ-3 MAX!",
+        "documentation": "https://www.home-assistant.io/integrations/maxcube",
+        "requirements": [
+            "maxcube-api==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mcp23017": {
+        "domain": "mcp23017",
+        "name": "MCP23017 I/O Expander",
+        "documentation": "https://www.home-assistant.io/integrations/mcp23017",
+        "requirements": [
+            "RPi.GPIO==0.7.0",
+            "adafruit-blinka==1.2.1",
+            "adafruit-circuitpython-mcp230xx==1.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jardiamj"
+        ]
+    },
+    "media_extractor": {
+        "domain": "media_extractor",
+        "name": "Media Extractor",
+        "documentation": "https://www.home-assistant.io/integrations/media_extractor",
+        "requirements": [
+            "youtube_dl==2020.01.24"
+        ],
+        "dependencies": [
+            "media_player"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "media_player": {
+        "domain": "media_player",
+        "name": "Media Player",
+        "documentation": "https://www.home-assistant.io/integrations/media_player",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "mediaroom": {
+        "domain": "mediaroom",
+        "name": "Mediaroom",
+        "documentation": "https://www.home-assistant.io/integrations/mediaroom",
+        "requirements": [
+            "pymediaroom==0.6.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dgomes"
+        ]
+    },
+    "melissa": {
+        "domain": "melissa",
+        "name": "Melissa",
+        "documentation": "https://www.home-assistant.io/integrations/melissa",
+        "requirements": [
+            "py-melissa-climate==2.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kennedyshead"
+        ]
+    },
+    "meraki": {
+        "domain": "meraki",
+        "name": "Meraki",
+        "documentation": "https://www.home-assistant.io/integrations/meraki",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "message_bird": {
+        "domain": "message_bird",
+        "name": "MessageBird",
+        "documentation": "https://www.home-assistant.io/integrations/message_bird",
+        "requirements": [
+            "messagebird==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "met": {
+        "domain": "met",
+        "name": "Meteorologisk institutt (Met.no)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/met",
+        "requirements": [
+            "pyMetno==0.4.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "meteo_france": {
+        "domain": "meteo_france",
+        "name": "M\u00e9t\u00e9o-France",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/meteo_france",
+        "requirements": [
+            "meteofrance==0.3.7",
+            "vigilancemeteo==3.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@victorcerutti",
+            "@oncleben31",
+            "@Quentame"
+        ]
+    },
+    "meteoalarm": {
+        "domain": "meteoalarm",
+        "name": "MeteoAlarm",
+        "documentation": "https://www.home-assistant.io/integrations/meteoalarm",
+        "requirements": [
+            "meteoalertapi==0.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rolfberkenbosch"
+        ]
+    },
+    "metoffice": {
+        "domain": "metoffice",
+        "name": "Met Office",
+        "documentation": "https://www.home-assistant.io/integrations/metoffice",
+        "requirements": [
+            "datapoint==0.9.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mfi": {
+        "domain": "mfi",
+        "name": "Ubiquiti mFi mPort",
+        "documentation": "https://www.home-assistant.io/integrations/mfi",
+        "requirements": [
+            "mficlient==0.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mhz19": {
+        "domain": "mhz19",
+        "name": "MH-Z19 CO2 Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/mhz19",
+        "requirements": [
+            "pmsensor==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "microsoft": {
+        "domain": "microsoft",
+        "name": "Microsoft Text-to-Speech (TTS)",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft",
+        "requirements": [
+            "pycsspeechtts==1.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "microsoft_face": {
+        "domain": "microsoft_face",
+        "name": "Microsoft Face",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face",
+        "requirements": [],
+        "dependencies": [
+            "camera"
+        ],
+        "codeowners": []
+    },
+    "microsoft_face_detect": {
+        "domain": "microsoft_face_detect",
+        "name": "Microsoft Face Detect",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_detect",
+        "requirements": [],
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "codeowners": []
+    },
+    "microsoft_face_identify": {
+        "domain": "microsoft_face_identify",
+        "name": "Microsoft Face Identify",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_identify",
+        "requirements": [],
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "codeowners": []
+    },
+    "miflora": {
+        "domain": "miflora",
+        "name": "Mi Flora",
+        "documentation": "https://www.home-assistant.io/integrations/miflora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "miflora==0.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen",
+            "@ChristianKuehnel"
+        ]
+    },
+    "mikrotik": {
+        "domain": "mikrotik",
+        "name": "Mikrotik",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mikrotik",
+        "requirements": [
+            "librouteros==3.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@engrbm87"
+        ]
+    },
+    "mill": {
+        "domain": "mill",
+        "name": "Mill",
+        "documentation": "https://www.home-assistant.io/integrations/mill",
+        "requirements": [
+            "millheater==0.3.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "min_max": {
+        "domain": "min_max",
+        "name": "Min/Max",
+        "documentation": "https://www.home-assistant.io/integrations/min_max",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "minio": {
+        "domain": "minio",
+        "name": "Minio",
+        "documentation": "https://www.home-assistant.io/integrations/minio",
+        "requirements": [
+            "minio==4.0.9"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@tkislan"
+        ]
+    },
+    "mitemp_bt": {
+        "domain": "mitemp_bt",
+        "name": "Xiaomi Mijia BLE Temperature and Humidity Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/mitemp_bt",
+        "requirements": [
+            "mitemp_bt==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mjpeg": {
+        "domain": "mjpeg",
+        "name": "MJPEG IP Camera",
+        "documentation": "https://www.home-assistant.io/integrations/mjpeg",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mobile_app": {
+        "domain": "mobile_app",
+        "name": "Home Assistant Mobile App Support",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mobile_app",
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+            "person"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ],
+        "quality_scale": "internal"
+    },
+    "mochad": {
+        "domain": "mochad",
+        "name": "Mochad",
+        "documentation": "https://www.home-assistant.io/integrations/mochad",
+        "requirements": [
+            "pymochad==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "modbus": {
+        "domain": "modbus",
+        "name": "Modbus",
+        "documentation": "https://www.home-assistant.io/integrations/modbus",
+        "requirements": [
+            "pymodbus==1.5.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@adamchengtkc"
+        ]
+    },
+    "modem_callerid": {
+        "domain": "modem_callerid",
+        "name": "Modem Caller ID",
+        "documentation": "https://www.home-assistant.io/integrations/modem_callerid",
+        "requirements": [
+            "basicmodem==0.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mold_indicator": {
+        "domain": "mold_indicator",
+        "name": "Mold Indicator",
+        "documentation": "https://www.home-assistant.io/integrations/mold_indicator",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "monoprice": {
+        "domain": "monoprice",
+        "name": "Monoprice 6-Zone Amplifier",
+        "documentation": "https://www.home-assistant.io/integrations/monoprice",
+        "requirements": [
+            "pymonoprice==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@etsinko"
+        ]
+    },
+    "moon": {
+        "domain": "moon",
+        "name": "Moon",
+        "documentation": "https://www.home-assistant.io/integrations/moon",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "mopar": {
+        "domain": "mopar",
+        "name": "Mopar",
+        "documentation": "https://www.home-assistant.io/integrations/mopar",
+        "requirements": [
+            "motorparts==1.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mpchc": {
+        "domain": "mpchc",
+        "name": "Media Player Classic Home Cinema (MPC-HC)",
+        "documentation": "https://www.home-assistant.io/integrations/mpchc",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mpd": {
+        "domain": "mpd",
+        "name": "Music Player Daemon (MPD)",
+        "documentation": "https://www.home-assistant.io/integrations/mpd",
+        "requirements": [
+            "python-mpd2==1.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "mqtt": {
+        "domain": "mqtt",
+        "name": "MQTT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mqtt",
+        "requirements": [
+            "hbmqtt==0.9.5",
+            "paho-mqtt==1.5.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "mqtt_eventstream": {
+        "domain": "mqtt_eventstream",
+        "name": "MQTT Eventstream",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_eventstream",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "mqtt_json": {
+        "domain": "mqtt_json",
+        "name": "MQTT JSON",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_json",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "mqtt_room": {
+        "domain": "mqtt_room",
+        "name": "MQTT Room Presence",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_room",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "mqtt_statestream": {
+        "domain": "mqtt_statestream",
+        "name": "MQTT Statestream",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_statestream",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "msteams": {
+        "domain": "msteams",
+        "name": "Microsoft Teams",
+        "documentation": "https://www.home-assistant.io/integrations/msteams",
+        "requirements": [
+            "pymsteams==0.1.12"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@peroyvind"
+        ]
+    },
+    "mvglive": {
+        "domain": "mvglive",
+        "name": "MVG",
+        "documentation": "https://www.home-assistant.io/integrations/mvglive",
+        "requirements": [
+            "PyMVGLive==1.1.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mychevy": {
+        "domain": "mychevy",
+        "name": "myChevrolet",
+        "documentation": "https://www.home-assistant.io/integrations/mychevy",
+        "requirements": [
+            "mychevy==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mycroft": {
+        "domain": "mycroft",
+        "name": "Mycroft",
+        "documentation": "https://www.home-assistant.io/integrations/mycroft",
+        "requirements": [
+            "mycroftapi==2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "myq": {
+        "domain": "myq",
+        "name": "MyQ",
+        "documentation": "https://www.home-assistant.io/integrations/myq",
+        "requirements": [
+            "pymyq==2.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "mysensors": {
+        "domain": "mysensors",
+        "name": "MySensors",
+        "documentation": "https://www.home-assistant.io/integrations/mysensors",
+        "requirements": [
+            "pymysensors==0.18.0"
+        ],
+        "dependencies": [],
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@MartinHjelmare"
+        ]
+    },
+    "mystrom": {
+        "domain": "mystrom",
+        "name": "myStrom",
+        "documentation": "https://www.home-assistant.io/integrations/mystrom",
+        "requirements": [
+            "python-mystrom==0.5.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "mythicbeastsdns": {
+        "domain": "mythicbeastsdns",
+        "name": "Mythic Beasts DNS",
+        "documentation": "https://www.home-assistant.io/integrations/mythicbeastsdns",
+        "requirements": [
+            "mbddns==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "n26": {
+        "domain": "n26",
+        "name": "N26",
+        "documentation": "https://www.home-assistant.io/integrations/n26",
+        "requirements": [
+            "n26==0.2.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nad": {
+        "domain": "nad",
+        "name": "NAD",
+        "documentation": "https://www.home-assistant.io/integrations/nad",
+        "requirements": [
+            "nad_receiver==0.0.11"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "namecheapdns": {
+        "domain": "namecheapdns",
+        "name": "Namecheap FreeDNS",
+        "documentation": "https://www.home-assistant.io/integrations/namecheapdns",
+        "requirements": [
+            "defusedxml==0.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nanoleaf": {
+        "domain": "nanoleaf",
+        "name": "Nanoleaf",
+        "documentation": "https://www.home-assistant.io/integrations/nanoleaf",
+        "requirements": [
+            "pynanoleaf==0.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "neato": {
+        "domain": "neato",
+        "name": "Neato Botvac",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/neato",
+        "requirements": [
+            "pybotvac==0.0.17"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dshokouhi",
+            "@Santobert"
+        ]
+    },
+    "nederlandse_spoorwegen": {
+        "domain": "nederlandse_spoorwegen",
+        "name": "Nederlandse Spoorwegen (NS)",
+        "documentation": "https://www.home-assistant.io/integrations/nederlandse_spoorwegen",
+        "requirements": [
+            "nsapi==3.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@YarmoM"
+        ]
+    },
+    "nello": {
+        "domain": "nello",
+        "name": "Nello",
+        "documentation": "https://www.home-assistant.io/integrations/nello",
+        "requirements": [
+            "pynello==2.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@pschmitt"
+        ]
+    },
+    "ness_alarm": {
+        "domain": "ness_alarm",
+        "name": "Ness Alarm",
+        "documentation": "https://www.home-assistant.io/integrations/ness_alarm",
+        "requirements": [
+            "nessclient==0.9.15"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@nickw444"
+        ]
+    },
+    "nest": {
+        "domain": "nest",
+        "name": "Nest",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nest",
+        "requirements": [
+            "python-nest==4.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@awarecan"
+        ]
+    },
+    "netatmo": {
+        "domain": "netatmo",
+        "name": "Netatmo",
+        "documentation": "https://www.home-assistant.io/integrations/netatmo",
+        "requirements": [
+            "pyatmo==3.2.2"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@cgtobi"
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "Netatmo Relay",
+                "Presence",
+                "Welcome"
+            ]
+        }
+    },
+    "netdata": {
+        "domain": "netdata",
+        "name": "Netdata",
+        "documentation": "https://www.home-assistant.io/integrations/netdata",
+        "requirements": [
+            "netdata==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "netgear": {
+        "domain": "netgear",
+        "name": "Netgear",
+        "documentation": "https://www.home-assistant.io/integrations/netgear",
+        "requirements": [
+            "pynetgear==0.6.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "netgear_lte": {
+        "domain": "netgear_lte",
+        "name": "Netgear LTE",
+        "documentation": "https://www.home-assistant.io/integrations/netgear_lte",
+        "requirements": [
+            "eternalegypt==0.0.11"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "netio": {
+        "domain": "netio",
+        "name": "Netio",
+        "documentation": "https://www.home-assistant.io/integrations/netio",
+        "requirements": [
+            "pynetio==0.1.9.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "neurio_energy": {
+        "domain": "neurio_energy",
+        "name": "Neurio energy",
+        "documentation": "https://www.home-assistant.io/integrations/neurio_energy",
+        "requirements": [
+            "neurio==0.3.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nextbus": {
+        "domain": "nextbus",
+        "name": "NextBus",
+        "documentation": "https://www.home-assistant.io/integrations/nextbus",
+        "dependencies": [],
+        "codeowners": [
+            "@vividboarder"
+        ],
+        "requirements": [
+            "py_nextbusnext==0.1.4"
+        ]
+    },
+    "nfandroidtv": {
+        "domain": "nfandroidtv",
+        "name": "Notifications for Android TV / FireTV",
+        "documentation": "https://www.home-assistant.io/integrations/nfandroidtv",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "niko_home_control": {
+        "domain": "niko_home_control",
+        "name": "Niko Home Control",
+        "documentation": "https://www.home-assistant.io/integrations/niko_home_control",
+        "requirements": [
+            "niko-home-control==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nilu": {
+        "domain": "nilu",
+        "name": "Norwegian Institute for Air Research (NILU)",
+        "documentation": "https://www.home-assistant.io/integrations/nilu",
+        "requirements": [
+            "niluclient==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@hfurubotten"
+        ]
+    },
+    "nissan_leaf": {
+        "domain": "nissan_leaf",
+        "name": "Nissan Leaf",
+        "documentation": "https://www.home-assistant.io/integrations/nissan_leaf",
+        "requirements": [
+            "pycarwings2==2.9"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@filcole"
+        ]
+    },
+    "nmap_tracker": {
+        "domain": "nmap_tracker",
+        "name": "Nmap Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/nmap_tracker",
+        "requirements": [
+            "python-nmap==0.6.1",
+            "getmac==0.8.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nmbs": {
+        "domain": "nmbs",
+        "name": "NMBS",
+        "documentation": "https://www.home-assistant.io/integrations/nmbs",
+        "requirements": [
+            "pyrail==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@thibmaek"
+        ]
+    },
+    "no_ip": {
+        "domain": "no_ip",
+        "name": "No-IP.com",
+        "documentation": "https://www.home-assistant.io/integrations/no_ip",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "noaa_tides": {
+        "domain": "noaa_tides",
+        "name": "NOAA Tides",
+        "documentation": "https://www.home-assistant.io/integrations/noaa_tides",
+        "requirements": [
+            "py_noaa==0.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "norway_air": {
+        "domain": "norway_air",
+        "name": "Om Luftkvalitet i Norge (Norway Air)",
+        "documentation": "https://www.home-assistant.io/integrations/norway_air",
+        "requirements": [
+            "pyMetno==0.4.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "notify": {
+        "domain": "notify",
+        "name": "Notifications",
+        "documentation": "https://www.home-assistant.io/integrations/notify",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "notion": {
+        "domain": "notion",
+        "name": "Notion",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/notion",
+        "requirements": [
+            "aionotion==1.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "nsw_fuel_station": {
+        "domain": "nsw_fuel_station",
+        "name": "NSW Fuel Station Price",
+        "documentation": "https://www.home-assistant.io/integrations/nsw_fuel_station",
+        "requirements": [
+            "nsw-fuel-api-client==1.0.10"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@nickw444"
+        ]
+    },
+    "nsw_rural_fire_service_feed": {
+        "domain": "nsw_rural_fire_service_feed",
+        "name": "NSW Rural Fire Service Incidents",
+        "documentation": "https://www.home-assistant.io/integrations/nsw_rural_fire_service_feed",
+        "requirements": [
+            "aio_geojson_nsw_rfs_incidents==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "nuheat": {
+        "domain": "nuheat",
+        "name": "NuHeat",
+        "documentation": "https://www.home-assistant.io/integrations/nuheat",
+        "requirements": [
+            "nuheat==0.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nuimo_controller": {
+        "domain": "nuimo_controller",
+        "name": "Nuimo controller",
+        "documentation": "https://www.home-assistant.io/integrations/nuimo_controller",
+        "requirements": [
+            "--only-binary=all nuimo==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nuki": {
+        "domain": "nuki",
+        "name": "Nuki",
+        "documentation": "https://www.home-assistant.io/integrations/nuki",
+        "requirements": [
+            "pynuki==1.3.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@pvizeli"
+        ]
+    },
+    "nut": {
+        "domain": "nut",
+        "name": "Network UPS Tools (NUT)",
+        "documentation": "https://www.home-assistant.io/integrations/nut",
+        "requirements": [
+            "pynut2==2.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nws": {
+        "domain": "nws",
+        "name": "National Weather Service (NWS)",
+        "documentation": "https://www.home-assistant.io/integrations/nws",
+        "dependencies": [],
+        "codeowners": [
+            "@MatthewFlamm"
+        ],
+        "requirements": [
+            "pynws==0.10.4"
+        ]
+    },
+    "nx584": {
+        "domain": "nx584",
+        "name": "NX584",
+        "documentation": "https://www.home-assistant.io/integrations/nx584",
+        "requirements": [
+            "pynx584==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "nzbget": {
+        "domain": "nzbget",
+        "name": "NZBGet",
+        "documentation": "https://www.home-assistant.io/integrations/nzbget",
+        "requirements": [
+            "pynzbgetapi==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@chriscla"
+        ]
+    },
+    "oasa_telematics": {
+        "domain": "oasa_telematics",
+        "name": "OASA Telematics",
+        "documentation": "https://www.home-assistant.io/integrations/oasa_telematics/",
+        "requirements": [
+            "oasatelematics==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "obihai": {
+        "domain": "obihai",
+        "name": "Obihai",
+        "documentation": "https://www.home-assistant.io/integrations/obihai",
+        "requirements": [
+            "pyobihai==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dshokouhi"
+        ]
+    },
+    "octoprint": {
+        "domain": "octoprint",
+        "name": "OctoPrint",
+        "documentation": "https://www.home-assistant.io/integrations/octoprint",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "oem": {
+        "domain": "oem",
+        "name": "OpenEnergyMonitor WiFi Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/oem",
+        "requirements": [
+            "oemthermostat==1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ohmconnect": {
+        "domain": "ohmconnect",
+        "name": "OhmConnect",
+        "documentation": "https://www.home-assistant.io/integrations/ohmconnect",
+        "requirements": [
+            "defusedxml==0.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "ombi": {
+        "domain": "ombi",
+        "name": "Ombi",
+        "documentation": "https://www.home-assistant.io/integrations/ombi/",
+        "dependencies": [],
+        "codeowners": [
+            "@larssont"
+        ],
+        "requirements": [
+            "pyombi==0.1.10"
+        ]
+    },
+    "onboarding": {
+        "domain": "onboarding",
+        "name": "Home Assistant Onboarding",
+        "documentation": "https://www.home-assistant.io/integrations/onboarding",
+        "requirements": [],
+        "dependencies": [
+            "auth",
+            "http",
+            "person"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "onewire": {
+        "domain": "onewire",
+        "name": "1-Wire",
+        "documentation": "https://www.home-assistant.io/integrations/onewire",
+        "requirements": [
+            "pyownet==0.10.0.post1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@garbled1"
+        ]
+    },
+    "onkyo": {
+        "domain": "onkyo",
+        "name": "Onkyo",
+        "documentation": "https://www.home-assistant.io/integrations/onkyo",
+        "requirements": [
+            "onkyo-eiscp==1.2.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "onvif": {
+        "domain": "onvif",
+        "name": "ONVIF",
+        "documentation": "https://www.home-assistant.io/integrations/onvif",
+        "requirements": [
+            "onvif-zeep-async==0.2.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "openalpr_cloud": {
+        "domain": "openalpr_cloud",
+        "name": "OpenALPR Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_cloud",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "openalpr_local": {
+        "domain": "openalpr_local",
+        "name": "OpenALPR Local",
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_local",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "opencv": {
+        "domain": "opencv",
+        "name": "OpenCV",
+        "documentation": "https://www.home-assistant.io/integrations/opencv",
+        "requirements": [
+            "numpy==1.18.1",
+            "opencv-python-headless==4.1.2.30"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "openevse": {
+        "domain": "openevse",
+        "name": "OpenEVSE",
+        "documentation": "https://www.home-assistant.io/integrations/openevse",
+        "requirements": [
+            "openevsewifi==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "openexchangerates": {
+        "domain": "openexchangerates",
+        "name": "Open Exchange Rates",
+        "documentation": "https://www.home-assistant.io/integrations/openexchangerates",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "opengarage": {
+        "domain": "opengarage",
+        "name": "OpenGarage",
+        "documentation": "https://www.home-assistant.io/integrations/opengarage",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "openhardwaremonitor": {
+        "domain": "openhardwaremonitor",
+        "name": "Open Hardware Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/openhardwaremonitor",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "openhome": {
+        "domain": "openhome",
+        "name": "Linn / OpenHome",
+        "documentation": "https://www.home-assistant.io/integrations/openhome",
+        "requirements": [
+            "openhomedevice==0.6.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "opensensemap": {
+        "domain": "opensensemap",
+        "name": "openSenseMap",
+        "documentation": "https://www.home-assistant.io/integrations/opensensemap",
+        "requirements": [
+            "opensensemap-api==0.1.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "opensky": {
+        "domain": "opensky",
+        "name": "OpenSky Network",
+        "documentation": "https://www.home-assistant.io/integrations/opensky",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "opentherm_gw": {
+        "domain": "opentherm_gw",
+        "name": "OpenTherm Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/opentherm_gw",
+        "requirements": [
+            "pyotgw==0.5b1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mvn23"
+        ],
+        "config_flow": True
+    },
+    "openuv": {
+        "domain": "openuv",
+        "name": "Openuv",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/openuv",
+        "requirements": [
+            "pyopenuv==1.0.9"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "openweathermap": {
+        "domain": "openweathermap",
+        "name": "Openweathermap",
+        "documentation": "https://www.home-assistant.io/integrations/openweathermap",
+        "requirements": [
+            "pyowm==2.10.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "opnsense": {
+        "domain": "opnsense",
+        "name": "OPNSense",
+        "documentation": "https://www.home-assistant.io/integrations/opnsense",
+        "requirements": [
+            "pyopnsense==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mtreinish"
+        ]
+    },
+    "opple": {
+        "domain": "opple",
+        "name": "Opple",
+        "documentation": "https://www.home-assistant.io/integrations/opple",
+        "requirements": [
+            "pyoppleio==1.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "orangepi_gpio": {
+        "domain": "orangepi_gpio",
+        "name": "Orangepi GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/orangepi_gpio",
+        "requirements": [
+            "OPi.GPIO==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@pascallj"
+        ]
+    },
+    "oru": {
+        "domain": "oru",
+        "name": "Orange and Rockland Utility (ORU)",
+        "documentation": "https://www.home-assistant.io/integrations/oru",
+        "dependencies": [],
+        "codeowners": [
+            "@bvlaicu"
+        ],
+        "requirements": [
+            "oru==0.1.11"
+        ]
+    },
+    "orvibo": {
+        "domain": "orvibo",
+        "name": "Orvibo",
+        "documentation": "https://www.home-assistant.io/integrations/orvibo",
+        "requirements": [
+            "orvibo==1.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "osramlightify": {
+        "domain": "osramlightify",
+        "name": "Osramlightify",
+        "documentation": "https://www.home-assistant.io/integrations/osramlightify",
+        "requirements": [
+            "lightify==1.0.7.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "otp": {
+        "domain": "otp",
+        "name": "One-Time Password (OTP)",
+        "documentation": "https://www.home-assistant.io/integrations/otp",
+        "requirements": [
+            "pyotp==2.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "owntracks": {
+        "domain": "owntracks",
+        "name": "OwnTracks",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/owntracks",
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "mqtt",
+            "cloud"
+        ],
+        "codeowners": []
+    },
+    "panasonic_bluray": {
+        "domain": "panasonic_bluray",
+        "name": "Panasonic Blu-Ray Player",
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_bluray",
+        "requirements": [
+            "panacotta==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "panasonic_viera": {
+        "domain": "panasonic_viera",
+        "name": "Panasonic Viera TV",
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_viera",
+        "requirements": [
+            "panasonic_viera==0.3.2",
+            "wakeonlan==1.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pandora": {
+        "domain": "pandora",
+        "name": "Pandora",
+        "documentation": "https://www.home-assistant.io/integrations/pandora",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "panel_custom": {
+        "domain": "panel_custom",
+        "name": "Custom Panel",
+        "documentation": "https://www.home-assistant.io/integrations/panel_custom",
+        "requirements": [],
+        "dependencies": [
+            "frontend"
+        ],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "quality_scale": "internal"
+    },
+    "panel_iframe": {
+        "domain": "panel_iframe",
+        "name": "iframe Panel",
+        "documentation": "https://www.home-assistant.io/integrations/panel_iframe",
+        "requirements": [],
+        "dependencies": [
+            "frontend"
+        ],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "quality_scale": "internal"
+    },
+    "pcal9535a": {
+        "domain": "pcal9535a",
+        "name": "PCAL9535A I/O Expander",
+        "documentation": "https://www.home-assistant.io/integrations/pcal9535a",
+        "requirements": [
+            "pcal9535a==0.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Shulyaka"
+        ]
+    },
+    "pencom": {
+        "domain": "pencom",
+        "name": "Pencom",
+        "documentation": "https://www.home-assistant.io/integrations/pencom",
+        "requirements": [
+            "pencompy==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "persistent_notification": {
+        "domain": "persistent_notification",
+        "name": "Persistent Notification",
+        "documentation": "https://www.home-assistant.io/integrations/persistent_notification",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "person": {
+        "domain": "person",
+        "name": "Person",
+        "documentation": "https://www.home-assistant.io/integrations/person",
+        "requirements": [],
+        "dependencies": [],
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "philips_js": {
+        "domain": "philips_js",
+        "name": "Philips TV",
+        "documentation": "https://www.home-assistant.io/integrations/philips_js",
+        "requirements": [
+            "ha-philipsjs==0.0.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@elupus"
+        ]
+    },
+    "pi_hole": {
+        "domain": "pi_hole",
+        "name": "Pi-hole",
+        "documentation": "https://www.home-assistant.io/integrations/pi_hole",
+        "requirements": [
+            "hole==0.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff",
+            "@johnluetke"
+        ]
+    },
+    "picotts": {
+        "domain": "picotts",
+        "name": "Pico TTS",
+        "documentation": "https://www.home-assistant.io/integrations/picotts",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "piglow": {
+        "domain": "piglow",
+        "name": "Piglow",
+        "documentation": "https://www.home-assistant.io/integrations/piglow",
+        "requirements": [
+            "piglow==1.2.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pilight": {
+        "domain": "pilight",
+        "name": "Pilight",
+        "documentation": "https://www.home-assistant.io/integrations/pilight",
+        "requirements": [
+            "pilight==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@trekky12"
+        ]
+    },
+    "ping": {
+        "domain": "ping",
+        "name": "Ping (ICMP)",
+        "documentation": "https://www.home-assistant.io/integrations/ping",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "pioneer": {
+        "domain": "pioneer",
+        "name": "Pioneer",
+        "documentation": "https://www.home-assistant.io/integrations/pioneer",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pjlink": {
+        "domain": "pjlink",
+        "name": "PJLink",
+        "documentation": "https://www.home-assistant.io/integrations/pjlink",
+        "requirements": [
+            "pypjlink2==1.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "plaato": {
+        "domain": "plaato",
+        "name": "Plaato Airlock",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plaato",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@JohNan"
+        ],
+        "requirements": []
+    },
+    "plant": {
+        "domain": "plant",
+        "name": "Plant Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/plant",
+        "requirements": [],
+        "dependencies": [
+            "group",
+            "zone"
+        ],
+        "after_dependencies": [
+            "recorder"
+        ],
+        "codeowners": [
+            "@ChristianKuehnel"
+        ],
+        "quality_scale": "internal"
+    },
+    "plex": {
+        "domain": "plex",
+        "name": "Plex Media Server",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plex",
+        "requirements": [
+            "plexapi==3.3.0",
+            "plexauth==0.0.5",
+            "plexwebsocket==0.0.6"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@jjlawren"
+        ]
+    },
+    "plugwise": {
+        "domain": "plugwise",
+        "name": "Plugwise Anna",
+        "documentation": "https://www.home-assistant.io/integrations/plugwise",
+        "dependencies": [],
+        "codeowners": [
+            "@laetificat",
+            "@CoMPaTech",
+            "@bouwew"
+        ],
+        "requirements": [
+            "haanna==0.14.1"
+        ]
+    },
+    "plum_lightpad": {
+        "domain": "plum_lightpad",
+        "name": "Plum Lightpad",
+        "documentation": "https://www.home-assistant.io/integrations/plum_lightpad",
+        "requirements": [
+            "plumlightpad==0.0.11"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pocketcasts": {
+        "domain": "pocketcasts",
+        "name": "Pocket Casts",
+        "documentation": "https://www.home-assistant.io/integrations/pocketcasts",
+        "requirements": [
+            "pocketcasts==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "point": {
+        "domain": "point",
+        "name": "Minut Point",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/point",
+        "requirements": [
+            "pypoint==1.1.2"
+        ],
+        "dependencies": [
+            "webhook",
+            "http"
+        ],
+        "codeowners": [
+            "@fredrike"
+        ],
+        "quality_scale": "gold"
+    },
+    "prezzibenzina": {
+        "domain": "prezzibenzina",
+        "name": "Prezzi Benzina",
+        "documentation": "https://www.home-assistant.io/integrations/prezzibenzina",
+        "requirements": [
+            "prezzibenzina-py==1.1.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "proliphix": {
+        "domain": "proliphix",
+        "name": "Proliphix",
+        "documentation": "https://www.home-assistant.io/integrations/proliphix",
+        "requirements": [
+            "proliphix==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "prometheus": {
+        "domain": "prometheus",
+        "name": "Prometheus",
+        "documentation": "https://www.home-assistant.io/integrations/prometheus",
+        "requirements": [
+            "prometheus_client==0.7.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "prowl": {
+        "domain": "prowl",
+        "name": "Prowl",
+        "documentation": "https://www.home-assistant.io/integrations/prowl",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "proximity": {
+        "domain": "proximity",
+        "name": "Proximity",
+        "documentation": "https://www.home-assistant.io/integrations/proximity",
+        "requirements": [],
+        "dependencies": [
+            "device_tracker",
+            "zone"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "proxmoxve": {
+        "domain": "proxmoxve",
+        "name": "Proxmox VE",
+        "documentation": "https://www.home-assistant.io/integrations/proxmoxve",
+        "dependencies": [],
+        "codeowners": [
+            "@k4ds3"
+        ],
+        "requirements": [
+            "proxmoxer==1.0.4"
+        ]
+    },
+    "proxy": {
+        "domain": "proxy",
+        "name": "Camera Proxy",
+        "documentation": "https://www.home-assistant.io/integrations/proxy",
+        "requirements": [
+            "pillow==6.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ps4": {
+        "domain": "ps4",
+        "name": "Sony PlayStation 4",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ps4",
+        "requirements": [
+            "pyps4-2ndscreen==1.0.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ktnrg45"
+        ]
+    },
+    "ptvsd": {
+        "domain": "ptvsd",
+        "name": "PTVSD - Python Tools for Visual Studio Debug Server",
+        "documentation": "https://www.home-assistant.io/integrations/ptvsd",
+        "requirements": [
+            "ptvsd==4.2.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@swamp-ig"
+        ]
+    },
+    "pulseaudio_loopback": {
+        "domain": "pulseaudio_loopback",
+        "name": "PulseAudio Loopback",
+        "documentation": "https://www.home-assistant.io/integrations/pulseaudio_loopback",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "push": {
+        "domain": "push",
+        "name": "Push",
+        "documentation": "https://www.home-assistant.io/integrations/push",
+        "requirements": [],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@dgomes"
+        ]
+    },
+    "pushbullet": {
+        "domain": "pushbullet",
+        "name": "Pushbullet",
+        "documentation": "https://www.home-assistant.io/integrations/pushbullet",
+        "requirements": [
+            "pushbullet.py==0.11.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pushetta": {
+        "domain": "pushetta",
+        "name": "Pushetta",
+        "documentation": "https://www.home-assistant.io/integrations/pushetta",
+        "requirements": [
+            "pushetta==1.0.15"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pushover": {
+        "domain": "pushover",
+        "name": "Pushover",
+        "documentation": "https://www.home-assistant.io/integrations/pushover",
+        "requirements": [
+            "python-pushover==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pushsafer": {
+        "domain": "pushsafer",
+        "name": "Pushsafer",
+        "documentation": "https://www.home-assistant.io/integrations/pushsafer",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "pvoutput": {
+        "domain": "pvoutput",
+        "name": "PVOutput",
+        "documentation": "https://www.home-assistant.io/integrations/pvoutput",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "pyload": {
+        "domain": "pyload",
+        "name": "pyLoad",
+        "documentation": "https://www.home-assistant.io/integrations/pyload",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "python_script": {
+        "domain": "python_script",
+        "name": "Python Scripts",
+        "documentation": "https://www.home-assistant.io/integrations/python_script",
+        "requirements": [
+            "restrictedpython==5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "qbittorrent": {
+        "domain": "qbittorrent",
+        "name": "qBittorrent",
+        "documentation": "https://www.home-assistant.io/integrations/qbittorrent",
+        "requirements": [
+            "python-qbittorrent==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "qld_bushfire": {
+        "domain": "qld_bushfire",
+        "name": "Queensland Bushfire Alert",
+        "documentation": "https://www.home-assistant.io/integrations/qld_bushfire",
+        "requirements": [
+            "georss_qld_bushfire_alert_client==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "qnap": {
+        "domain": "qnap",
+        "name": "QNAP",
+        "documentation": "https://www.home-assistant.io/integrations/qnap",
+        "requirements": [
+            "qnapstats==0.2.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@colinodell"
+        ]
+    },
+    "qrcode": {
+        "domain": "qrcode",
+        "name": "QR Code",
+        "documentation": "https://www.home-assistant.io/integrations/qrcode",
+        "requirements": [
+            "pillow==6.2.1",
+            "pyzbar==0.1.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "quantum_gateway": {
+        "domain": "quantum_gateway",
+        "name": "Quantum Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/quantum_gateway",
+        "requirements": [
+            "quantum-gateway==0.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@cisasteelersfan"
+        ]
+    },
+    "qwikswitch": {
+        "domain": "qwikswitch",
+        "name": "QwikSwitch QSUSB",
+        "documentation": "https://www.home-assistant.io/integrations/qwikswitch",
+        "requirements": [
+            "pyqwikswitch==0.93"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kellerza"
+        ]
+    },
+    "rachio": {
+        "domain": "rachio",
+        "name": "Rachio",
+        "documentation": "https://www.home-assistant.io/integrations/rachio",
+        "requirements": [
+            "rachiopy==0.1.3"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "radarr": {
+        "domain": "radarr",
+        "name": "Radarr",
+        "documentation": "https://www.home-assistant.io/integrations/radarr",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "radiotherm": {
+        "domain": "radiotherm",
+        "name": "Radio Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/radiotherm",
+        "requirements": [
+            "radiotherm==2.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rainbird": {
+        "domain": "rainbird",
+        "name": "Rain Bird",
+        "documentation": "https://www.home-assistant.io/integrations/rainbird",
+        "requirements": [
+            "pyrainbird==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@konikvranik"
+        ]
+    },
+    "raincloud": {
+        "domain": "raincloud",
+        "name": "Melnor RainCloud",
+        "documentation": "https://www.home-assistant.io/integrations/raincloud",
+        "requirements": [
+            "raincloudy==0.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@vanstinator"
+        ]
+    },
+    "rainforest_eagle": {
+        "domain": "rainforest_eagle",
+        "name": "Rainforest Eagle-200",
+        "documentation": "https://www.home-assistant.io/integrations/rainforest_eagle",
+        "requirements": [
+            "eagle200_reader==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@gtdiehl"
+        ]
+    },
+    "rainmachine": {
+        "domain": "rainmachine",
+        "name": "RainMachine",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/rainmachine",
+        "requirements": [
+            "regenmaschine==1.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "random": {
+        "domain": "random",
+        "name": "Random",
+        "documentation": "https://www.home-assistant.io/integrations/random",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "raspihats": {
+        "domain": "raspihats",
+        "name": "Raspihats",
+        "documentation": "https://www.home-assistant.io/integrations/raspihats",
+        "requirements": [
+            "raspihats==2.2.3",
+            "smbus-cffi==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "raspyrfm": {
+        "domain": "raspyrfm",
+        "name": "RaspyRFM",
+        "documentation": "https://www.home-assistant.io/integrations/raspyrfm",
+        "requirements": [
+            "raspyrfm-client==1.2.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "recollect_waste": {
+        "domain": "recollect_waste",
+        "name": "ReCollect Waste",
+        "documentation": "https://www.home-assistant.io/integrations/recollect_waste",
+        "requirements": [
+            "recollect-waste==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "recorder": {
+        "domain": "recorder",
+        "name": "Recorder",
+        "documentation": "https://www.home-assistant.io/integrations/recorder",
+        "requirements": [
+            "sqlalchemy==1.3.13"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "recswitch": {
+        "domain": "recswitch",
+        "name": "Ankuoo REC Switch",
+        "documentation": "https://www.home-assistant.io/integrations/recswitch",
+        "requirements": [
+            "pyrecswitch==1.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "reddit": {
+        "domain": "reddit",
+        "name": "Reddit",
+        "documentation": "https://www.home-assistant.io/integrations/reddit",
+        "requirements": [
+            "praw==6.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rejseplanen": {
+        "domain": "rejseplanen",
+        "name": "Rejseplanen",
+        "documentation": "https://www.home-assistant.io/integrations/rejseplanen",
+        "requirements": [
+            "rjpl==0.3.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "remember_the_milk": {
+        "domain": "remember_the_milk",
+        "name": "Remember The Milk",
+        "documentation": "https://www.home-assistant.io/integrations/remember_the_milk",
+        "requirements": [
+            "RtmAPI==0.7.2",
+            "httplib2==0.10.3"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "remote": {
+        "domain": "remote",
+        "name": "Remote",
+        "documentation": "https://www.home-assistant.io/integrations/remote",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": []
+    },
+    "remote_rpi_gpio": {
+        "domain": "remote_rpi_gpio",
+        "name": "remote_rpi_gpio",
+        "documentation": "https://www.home-assistant.io/integrations/remote_rpi_gpio",
+        "requirements": [
+            "gpiozero==1.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "repetier": {
+        "domain": "repetier",
+        "name": "Repetier-Server",
+        "documentation": "https://www.home-assistant.io/integrations/repetier",
+        "requirements": [
+            "pyrepetier==3.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@MTrab"
+        ]
+    },
+    "rest": {
+        "domain": "rest",
+        "name": "RESTful",
+        "documentation": "https://www.home-assistant.io/integrations/rest",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rest_command": {
+        "domain": "rest_command",
+        "name": "RESTful Command",
+        "documentation": "https://www.home-assistant.io/integrations/rest_command",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rflink": {
+        "domain": "rflink",
+        "name": "RFLink",
+        "documentation": "https://www.home-assistant.io/integrations/rflink",
+        "requirements": [
+            "rflink==0.0.51"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rfxtrx": {
+        "domain": "rfxtrx",
+        "name": "RFXCOM RFXtrx",
+        "documentation": "https://www.home-assistant.io/integrations/rfxtrx",
+        "requirements": [
+            "pyRFXtrx==0.25"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "ring": {
+        "domain": "ring",
+        "name": "Ring",
+        "documentation": "https://www.home-assistant.io/integrations/ring",
+        "requirements": [
+            "ring_doorbell==0.6.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@balloob"
+        ],
+        "config_flow": True
+    },
+    "ripple": {
+        "domain": "ripple",
+        "name": "Ripple",
+        "documentation": "https://www.home-assistant.io/integrations/ripple",
+        "requirements": [
+            "python-ripple-api==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rmvtransport": {
+        "domain": "rmvtransport",
+        "name": "RMV",
+        "documentation": "https://www.home-assistant.io/integrations/rmvtransport",
+        "requirements": [
+            "PyRMVtransport==0.2.9"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@cgtobi"
+        ]
+    },
+    "rocketchat": {
+        "domain": "rocketchat",
+        "name": "Rocket.Chat",
+        "documentation": "https://www.home-assistant.io/integrations/rocketchat",
+        "requirements": [
+            "rocketchat-API==0.6.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "roku": {
+        "domain": "roku",
+        "name": "Roku",
+        "documentation": "https://www.home-assistant.io/integrations/roku",
+        "requirements": [
+            "roku==4.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "roomba": {
+        "domain": "roomba",
+        "name": "iRobot Roomba",
+        "documentation": "https://www.home-assistant.io/integrations/roomba",
+        "requirements": [
+            "roombapy==1.4.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@pschmitt"
+        ]
+    },
+    "route53": {
+        "domain": "route53",
+        "name": "AWS Route53",
+        "documentation": "https://www.home-assistant.io/integrations/route53",
+        "requirements": [
+            "boto3==1.9.252",
+            "ipify==1.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rova": {
+        "domain": "rova",
+        "name": "ROVA",
+        "documentation": "https://www.home-assistant.io/integrations/rova",
+        "requirements": [
+            "rova==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rpi_camera": {
+        "domain": "rpi_camera",
+        "name": "Raspberry Pi Camera",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_camera",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rpi_gpio": {
+        "domain": "rpi_gpio",
+        "name": "Raspberry Pi GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio",
+        "requirements": [
+            "RPi.GPIO==0.7.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rpi_gpio_pwm": {
+        "domain": "rpi_gpio_pwm",
+        "name": "pigpio Daemon PWM LED",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio_pwm",
+        "requirements": [
+            "pwmled==1.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rpi_pfio": {
+        "domain": "rpi_pfio",
+        "name": "PiFace Digital I/O (PFIO)",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_pfio",
+        "requirements": [
+            "pifacecommon==4.2.2",
+            "pifacedigitalio==3.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rpi_rf": {
+        "domain": "rpi_rf",
+        "name": "Raspberry Pi RF",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_rf",
+        "requirements": [
+            "rpi-rf==0.9.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "rss_feed_template": {
+        "domain": "rss_feed_template",
+        "name": "RSS Feed Template",
+        "documentation": "https://www.home-assistant.io/integrations/rss_feed_template",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "rtorrent": {
+        "domain": "rtorrent",
+        "name": "rTorrent",
+        "documentation": "https://www.home-assistant.io/integrations/rtorrent",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "russound_rio": {
+        "domain": "russound_rio",
+        "name": "Russound RIO",
+        "documentation": "https://www.home-assistant.io/integrations/russound_rio",
+        "requirements": [
+            "russound_rio==0.1.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "russound_rnet": {
+        "domain": "russound_rnet",
+        "name": "Russound RNET",
+        "documentation": "https://www.home-assistant.io/integrations/russound_rnet",
+        "requirements": [
+            "russound==0.1.9"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sabnzbd": {
+        "domain": "sabnzbd",
+        "name": "SABnzbd",
+        "documentation": "https://www.home-assistant.io/integrations/sabnzbd",
+        "requirements": [
+            "pysabnzbd==1.1.0"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "safe_mode": {
+        "domain": "safe_mode",
+        "name": "Safe Mode",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/safe_mode",
+        "requirements": [],
+        "ssdp": [],
+        "zeroconf": [],
+        "homekit": {},
+        "dependencies": [
+            "frontend",
+            "config",
+            "persistent_notification",
+            "cloud"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "saj": {
+        "domain": "saj",
+        "name": "SAJ Solar Inverter",
+        "documentation": "https://www.home-assistant.io/integrations/saj",
+        "requirements": [
+            "pysaj==0.0.14"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fredericvl"
+        ]
+    },
+    "salt": {
+        "domain": "salt",
+        "name": "Salt Fiber Box",
+        "documentation": "https://www.home-assistant.io/integrations/salt",
+        "requirements": [
+            "saltbox==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bjornorri"
+        ]
+    },
+    "samsungtv": {
+        "domain": "samsungtv",
+        "name": "Samsung Smart TV",
+        "documentation": "https://www.home-assistant.io/integrations/samsungtv",
+        "requirements": [
+            "samsungctl[websocket]==0.7.1"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:samsung.com:device:RemoteControlReceiver:1"
+            }
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@escoand"
+        ],
+        "config_flow": True
+    },
+    "satel_integra": {
+        "domain": "satel_integra",
+        "name": "Satel Integra",
+        "documentation": "https://www.home-assistant.io/integrations/satel_integra",
+        "requirements": [
+            "satel_integra==0.3.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "scene": {
+        "domain": "scene",
+        "name": "Scenes",
+        "documentation": "https://www.home-assistant.io/integrations/scene",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "scrape": {
+        "domain": "scrape",
+        "name": "Scrape",
+        "documentation": "https://www.home-assistant.io/integrations/scrape",
+        "requirements": [
+            "beautifulsoup4==4.8.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "script": {
+        "domain": "script",
+        "name": "Scripts",
+        "documentation": "https://www.home-assistant.io/integrations/script",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "scsgate": {
+        "domain": "scsgate",
+        "name": "SCSGate",
+        "documentation": "https://www.home-assistant.io/integrations/scsgate",
+        "requirements": [
+            "scsgate==0.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "search": {
+        "domain": "search",
+        "name": "Search",
+        "documentation": "https://www.home-assistant.io/integrations/search",
+        "requirements": [],
+        "ssdp": [],
+        "zeroconf": [],
+        "homekit": {},
+        "dependencies": [
+            "websocket_api"
+        ],
+        "after_dependencies": [
+            "scene",
+            "group",
+            "automation",
+            "script"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "season": {
+        "domain": "season",
+        "name": "Season",
+        "documentation": "https://www.home-assistant.io/integrations/season",
+        "requirements": [
+            "ephem==3.7.7.0"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sendgrid": {
+        "domain": "sendgrid",
+        "name": "SendGrid",
+        "documentation": "https://www.home-assistant.io/integrations/sendgrid",
+        "requirements": [
+            "sendgrid==6.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sense": {
+        "domain": "sense",
+        "name": "Sense",
+        "documentation": "https://www.home-assistant.io/integrations/sense",
+        "requirements": [
+            "sense_energy==0.7.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kbickar"
+        ]
+    },
+    "sensehat": {
+        "domain": "sensehat",
+        "name": "Sense HAT",
+        "documentation": "https://www.home-assistant.io/integrations/sensehat",
+        "requirements": [
+            "sense-hat==2.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sensibo": {
+        "domain": "sensibo",
+        "name": "Sensibo",
+        "documentation": "https://www.home-assistant.io/integrations/sensibo",
+        "requirements": [
+            "pysensibo==1.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@andrey-git"
+        ]
+    },
+    "sensor": {
+        "domain": "sensor",
+        "name": "Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/sensor",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sentry": {
+        "domain": "sentry",
+        "name": "Sentry",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sentry",
+        "requirements": [
+            "sentry-sdk==0.13.5"
+        ],
+        "ssdp": [],
+        "zeroconf": [],
+        "homekit": {},
+        "dependencies": [],
+        "codeowners": [
+            "@dcramer"
+        ]
+    },
+    "serial": {
+        "domain": "serial",
+        "name": "Serial",
+        "documentation": "https://www.home-assistant.io/integrations/serial",
+        "requirements": [
+            "pyserial-asyncio==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "serial_pm": {
+        "domain": "serial_pm",
+        "name": "Serial Particulate Matter",
+        "documentation": "https://www.home-assistant.io/integrations/serial_pm",
+        "requirements": [
+            "pmsensor==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sesame": {
+        "domain": "sesame",
+        "name": "Sesame Smart Lock",
+        "documentation": "https://www.home-assistant.io/integrations/sesame",
+        "requirements": [
+            "pysesame2==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "seven_segments": {
+        "domain": "seven_segments",
+        "name": "Seven Segments OCR",
+        "documentation": "https://www.home-assistant.io/integrations/seven_segments",
+        "requirements": [
+            "pillow==6.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "seventeentrack": {
+        "domain": "seventeentrack",
+        "name": "17TRACK",
+        "documentation": "https://www.home-assistant.io/integrations/seventeentrack",
+        "requirements": [
+            "py17track==2.2.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "shell_command": {
+        "domain": "shell_command",
+        "name": "Shell Command",
+        "documentation": "https://www.home-assistant.io/integrations/shell_command",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "shiftr": {
+        "domain": "shiftr",
+        "name": "shiftr.io",
+        "documentation": "https://www.home-assistant.io/integrations/shiftr",
+        "requirements": [
+            "paho-mqtt==1.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "shodan": {
+        "domain": "shodan",
+        "name": "Shodan",
+        "documentation": "https://www.home-assistant.io/integrations/shodan",
+        "requirements": [
+            "shodan==1.21.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "shopping_list": {
+        "domain": "shopping_list",
+        "name": "Shopping List",
+        "documentation": "https://www.home-assistant.io/integrations/shopping_list",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sht31": {
+        "domain": "sht31",
+        "name": "Sensirion SHT31",
+        "documentation": "https://www.home-assistant.io/integrations/sht31",
+        "requirements": [
+            "Adafruit-GPIO==1.0.3",
+            "Adafruit-SHT31==1.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sigfox": {
+        "domain": "sigfox",
+        "name": "Sigfox",
+        "documentation": "https://www.home-assistant.io/integrations/sigfox",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sighthound": {
+        "domain": "sighthound",
+        "name": "Sighthound",
+        "documentation": "https://www.home-assistant.io/integrations/sighthound",
+        "requirements": [
+            "simplehound==0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robmarkcole"
+        ]
+    },
+    "signal_messenger": {
+        "domain": "signal_messenger",
+        "name": "Signal Messenger",
+        "documentation": "https://www.home-assistant.io/integrations/signal_messenger",
+        "dependencies": [],
+        "codeowners": [
+            "@bbernhard"
+        ],
+        "requirements": [
+            "pysignalclirestapi==0.2.4"
+        ]
+    },
+    "simplepush": {
+        "domain": "simplepush",
+        "name": "Simplepush",
+        "documentation": "https://www.home-assistant.io/integrations/simplepush",
+        "requirements": [
+            "simplepush==1.1.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "simplisafe": {
+        "domain": "simplisafe",
+        "name": "SimpliSafe",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/simplisafe",
+        "requirements": [
+            "simplisafe-python==6.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "simulated": {
+        "domain": "simulated",
+        "name": "Simulated",
+        "documentation": "https://www.home-assistant.io/integrations/simulated",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sinch": {
+        "domain": "sinch",
+        "name": "Sinch SMS",
+        "documentation": "https://www.home-assistant.io/integrations/sinch",
+        "dependencies": [],
+        "codeowners": [
+            "@bendikrb"
+        ],
+        "requirements": [
+            "clx-sdk-xms==1.0.0"
+        ]
+    },
+    "sisyphus": {
+        "domain": "sisyphus",
+        "name": "Sisyphus",
+        "documentation": "https://www.home-assistant.io/integrations/sisyphus",
+        "requirements": [
+            "sisyphus-control==2.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jkeljo"
+        ]
+    },
+    "sky_hub": {
+        "domain": "sky_hub",
+        "name": "Sky Hub",
+        "documentation": "https://www.home-assistant.io/integrations/sky_hub",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "skybeacon": {
+        "domain": "skybeacon",
+        "name": "Skybeacon",
+        "documentation": "https://www.home-assistant.io/integrations/skybeacon",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "skybell": {
+        "domain": "skybell",
+        "name": "SkyBell",
+        "documentation": "https://www.home-assistant.io/integrations/skybell",
+        "requirements": [
+            "skybellpy==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "slack": {
+        "domain": "slack",
+        "name": "Slack",
+        "documentation": "https://www.home-assistant.io/integrations/slack",
+        "requirements": [
+            "slacker==0.13.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sleepiq": {
+        "domain": "sleepiq",
+        "name": "SleepIQ",
+        "documentation": "https://www.home-assistant.io/integrations/sleepiq",
+        "requirements": [
+            "sleepyq==0.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "slide": {
+        "domain": "slide",
+        "name": "Slide",
+        "documentation": "https://www.home-assistant.io/integrations/slide",
+        "requirements": [
+            "goslide-api==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ualex73"
+        ]
+    },
+    "sma": {
+        "domain": "sma",
+        "name": "SMA Solar",
+        "documentation": "https://www.home-assistant.io/integrations/sma",
+        "requirements": [
+            "pysma==0.3.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kellerza"
+        ]
+    },
+    "smappee": {
+        "domain": "smappee",
+        "name": "Smappee",
+        "documentation": "https://www.home-assistant.io/integrations/smappee",
+        "requirements": [
+            "smappy==0.2.16"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "smarthab": {
+        "domain": "smarthab",
+        "name": "SmartHab",
+        "documentation": "https://www.home-assistant.io/integrations/smarthab",
+        "requirements": [
+            "smarthab==0.20"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@outadoc"
+        ]
+    },
+    "smartthings": {
+        "domain": "smartthings",
+        "name": "Smartthings",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smartthings",
+        "requirements": [
+            "pysmartapp==0.3.2",
+            "pysmartthings==0.7.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@andrewsayre"
+        ]
+    },
+    "smarty": {
+        "domain": "smarty",
+        "name": "Salda Smarty",
+        "documentation": "https://www.home-assistant.io/integrations/smarty",
+        "requirements": [
+            "pysmarty==0.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@z0mbieprocess"
+        ]
+    },
+    "smhi": {
+        "domain": "smhi",
+        "name": "SMHI",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smhi",
+        "requirements": [
+            "smhi-pkg==1.0.10"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sms": {
+        "domain": "sms",
+        "name": "SMS notifications via GSM-modem",
+        "documentation": "https://www.home-assistant.io/integrations/sms",
+        "requirements": [
+            "python-gammu==2.12"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ocalvo"
+        ]
+    },
+    "smtp": {
+        "domain": "smtp",
+        "name": "SMTP",
+        "documentation": "https://www.home-assistant.io/integrations/smtp",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "snapcast": {
+        "domain": "snapcast",
+        "name": "Snapcast",
+        "documentation": "https://www.home-assistant.io/integrations/snapcast",
+        "requirements": [
+            "snapcast==2.0.10"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "snips": {
+        "domain": "snips",
+        "name": "Snips",
+        "documentation": "https://www.home-assistant.io/integrations/snips",
+        "requirements": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "snmp": {
+        "domain": "snmp",
+        "name": "SNMP",
+        "documentation": "https://www.home-assistant.io/integrations/snmp",
+        "requirements": [
+            "pysnmp==4.4.12"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sochain": {
+        "domain": "sochain",
+        "name": "SoChain",
+        "documentation": "https://www.home-assistant.io/integrations/sochain",
+        "requirements": [
+            "python-sochain-api==0.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "socialblade": {
+        "domain": "socialblade",
+        "name": "Social Blade",
+        "documentation": "https://www.home-assistant.io/integrations/socialblade",
+        "requirements": [
+            "socialbladeclient==0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "solaredge": {
+        "domain": "solaredge",
+        "name": "SolarEdge",
+        "documentation": "https://www.home-assistant.io/integrations/solaredge",
+        "requirements": [
+            "solaredge==0.0.2",
+            "stringcase==1.2.0"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "codeowners": []
+    },
+    "solaredge_local": {
+        "domain": "solaredge_local",
+        "name": "SolarEdge Local",
+        "documentation": "https://www.home-assistant.io/integrations/solaredge_local",
+        "requirements": [
+            "solaredge-local==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@drobtravels",
+            "@scheric"
+        ]
+    },
+    "solarlog": {
+        "domain": "solarlog",
+        "name": "Solar-Log",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/solarlog",
+        "dependencies": [],
+        "codeowners": [
+            "@Ernst79"
+        ],
+        "requirements": [
+            "sunwatcher==0.2.1"
+        ]
+    },
+    "solax": {
+        "domain": "solax",
+        "name": "SolaX Power",
+        "documentation": "https://www.home-assistant.io/integrations/solax",
+        "requirements": [
+            "solax==0.2.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@squishykid"
+        ]
+    },
+    "soma": {
+        "domain": "soma",
+        "name": "Soma Connect",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/soma",
+        "dependencies": [],
+        "codeowners": [
+            "@ratsept"
+        ],
+        "requirements": [
+            "pysoma==0.0.10"
+        ]
+    },
+    "somfy": {
+        "domain": "somfy",
+        "name": "Somfy Open API",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/somfy",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@tetienne"
+        ],
+        "requirements": [
+            "pymfy==0.7.1"
+        ]
+    },
+    "somfy_mylink": {
+        "domain": "somfy_mylink",
+        "name": "Somfy MyLink",
+        "documentation": "https://www.home-assistant.io/integrations/somfy_mylink",
+        "requirements": [
+            "somfy-mylink-synergy==1.0.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "sonarr": {
+        "domain": "sonarr",
+        "name": "Sonarr",
+        "documentation": "https://www.home-assistant.io/integrations/sonarr",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "songpal": {
+        "domain": "songpal",
+        "name": "Sony Songpal",
+        "documentation": "https://www.home-assistant.io/integrations/songpal",
+        "requirements": [
+            "python-songpal==0.11.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rytilahti"
+        ]
+    },
+    "sonos": {
+        "domain": "sonos",
+        "name": "Sonos",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sonos",
+        "requirements": [
+            "pysonos==0.0.24"
+        ],
+        "dependencies": [],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:ZonePlayer:1"
+            }
+        ],
+        "codeowners": []
+    },
+    "sony_projector": {
+        "domain": "sony_projector",
+        "name": "Sony Projector",
+        "documentation": "https://www.home-assistant.io/integrations/sony_projector",
+        "requirements": [
+            "pysdcp==1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "soundtouch": {
+        "domain": "soundtouch",
+        "name": "Bose Soundtouch",
+        "documentation": "https://www.home-assistant.io/integrations/soundtouch",
+        "requirements": [
+            "libsoundtouch==0.7.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "spaceapi": {
+        "domain": "spaceapi",
+        "name": "Space API",
+        "documentation": "https://www.home-assistant.io/integrations/spaceapi",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "spc": {
+        "domain": "spc",
+        "name": "Vanderbilt SPC",
+        "documentation": "https://www.home-assistant.io/integrations/spc",
+        "requirements": [
+            "pyspcwebgw==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "speedtestdotnet": {
+        "domain": "speedtestdotnet",
+        "name": "Speedtest.net",
+        "documentation": "https://www.home-assistant.io/integrations/speedtestdotnet",
+        "requirements": [
+            "speedtest-cli==2.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "spider": {
+        "domain": "spider",
+        "name": "Itho Daalderop Spider",
+        "documentation": "https://www.home-assistant.io/integrations/spider",
+        "requirements": [
+            "spiderpy==1.3.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@peternijssen"
+        ]
+    },
+    "splunk": {
+        "domain": "splunk",
+        "name": "Splunk",
+        "documentation": "https://www.home-assistant.io/integrations/splunk",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "spotcrime": {
+        "domain": "spotcrime",
+        "name": "Spot Crime",
+        "documentation": "https://www.home-assistant.io/integrations/spotcrime",
+        "requirements": [
+            "spotcrime==1.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "spotify": {
+        "domain": "spotify",
+        "name": "Spotify",
+        "documentation": "https://www.home-assistant.io/integrations/spotify",
+        "requirements": [
+            "spotipy==2.7.1"
+        ],
+        "zeroconf": [
+            "_spotify-connect._tcp.local."
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "quality_scale": "silver"
+    },
+    "sql": {
+        "domain": "sql",
+        "name": "SQL",
+        "documentation": "https://www.home-assistant.io/integrations/sql",
+        "requirements": [
+            "sqlalchemy==1.3.13"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dgomes"
+        ]
+    },
+    "squeezebox": {
+        "domain": "squeezebox",
+        "name": "Logitech Squeezebox",
+        "documentation": "https://www.home-assistant.io/integrations/squeezebox",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ssdp": {
+        "domain": "ssdp",
+        "name": "Simple Service Discovery Protocol (SSDP)",
+        "documentation": "https://www.home-assistant.io/integrations/ssdp",
+        "requirements": [
+            "defusedxml==0.6.0",
+            "netdisco==2.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "starline": {
+        "domain": "starline",
+        "name": "StarLine",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/starline",
+        "requirements": [
+            "starline==0.1.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@anonym-tsk"
+        ]
+    },
+    "starlingbank": {
+        "domain": "starlingbank",
+        "name": "Starling Bank",
+        "documentation": "https://www.home-assistant.io/integrations/starlingbank",
+        "requirements": [
+            "starlingbank==3.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "startca": {
+        "domain": "startca",
+        "name": "Start.ca",
+        "documentation": "https://www.home-assistant.io/integrations/startca",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "statistics": {
+        "domain": "statistics",
+        "name": "Statistics",
+        "documentation": "https://www.home-assistant.io/integrations/statistics",
+        "requirements": [],
+        "dependencies": [],
+        "after_dependencies": [
+            "recorder"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "statsd": {
+        "domain": "statsd",
+        "name": "StatsD",
+        "documentation": "https://www.home-assistant.io/integrations/statsd",
+        "requirements": [
+            "statsd==3.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "steam_online": {
+        "domain": "steam_online",
+        "name": "Steam",
+        "documentation": "https://www.home-assistant.io/integrations/steam_online",
+        "requirements": [
+            "steamodd==4.21"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "stiebel_eltron": {
+        "domain": "stiebel_eltron",
+        "name": "STIEBEL ELTRON",
+        "documentation": "https://www.home-assistant.io/integrations/stiebel_eltron",
+        "requirements": [
+            "pystiebeleltron==0.0.1.dev2"
+        ],
+        "dependencies": [
+            "modbus"
+        ],
+        "codeowners": [
+            "@fucm"
+        ]
+    },
+    "stookalert": {
+        "domain": "stookalert",
+        "name": "RIVM Stookalert",
+        "documentation": "https://www.home-assistant.io/integrations/stookalert",
+        "dependencies": [],
+        "codeowners": [
+            "@fwestenberg"
+        ],
+        "requirements": [
+            "stookalert==0.1.4"
+        ]
+    },
+    "stream": {
+        "domain": "stream",
+        "name": "Stream",
+        "documentation": "https://www.home-assistant.io/integrations/stream",
+        "requirements": [
+            "av==6.1.2"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@hunterjm"
+        ],
+        "quality_scale": "internal"
+    },
+    "streamlabswater": {
+        "domain": "streamlabswater",
+        "name": "StreamLabs",
+        "documentation": "https://www.home-assistant.io/integrations/streamlabswater",
+        "requirements": [
+            "streamlabswater==1.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "stt": {
+        "domain": "stt",
+        "name": "Speech-to-Text (STT)",
+        "documentation": "https://www.home-assistant.io/integrations/stt",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@pvizeli"
+        ]
+    },
+    "suez_water": {
+        "domain": "suez_water",
+        "name": "Suez Water",
+        "documentation": "https://www.home-assistant.io/integrations/suez_water",
+        "dependencies": [],
+        "codeowners": [
+            "@ooii"
+        ],
+        "requirements": [
+            "pysuez==0.1.17"
+        ]
+    },
+    "sun": {
+        "domain": "sun",
+        "name": "Sun",
+        "documentation": "https://www.home-assistant.io/integrations/sun",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@Swamp-Ig"
+        ],
+        "quality_scale": "internal"
+    },
+    "supervisord": {
+        "domain": "supervisord",
+        "name": "Supervisord",
+        "documentation": "https://www.home-assistant.io/integrations/supervisord",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "supla": {
+        "domain": "supla",
+        "name": "Supla",
+        "documentation": "https://www.home-assistant.io/integrations/supla",
+        "requirements": [
+            "pysupla==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mwegrzynek"
+        ]
+    },
+    "surepetcare": {
+        "domain": "surepetcare",
+        "name": "Sure Petcare",
+        "documentation": "https://www.home-assistant.io/integrations/surepetcare",
+        "dependencies": [],
+        "codeowners": [
+            "@benleb"
+        ],
+        "requirements": [
+            "surepy==0.1.10"
+        ]
+    },
+    "swiss_hydrological_data": {
+        "domain": "swiss_hydrological_data",
+        "name": "Swiss Hydrological Data",
+        "documentation": "https://www.home-assistant.io/integrations/swiss_hydrological_data",
+        "requirements": [
+            "swisshydrodata==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "swiss_public_transport": {
+        "domain": "swiss_public_transport",
+        "name": "Swiss public transport",
+        "documentation": "https://www.home-assistant.io/integrations/swiss_public_transport",
+        "requirements": [
+            "python_opendata_transport==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "swisscom": {
+        "domain": "swisscom",
+        "name": "Swisscom Internet-Box",
+        "documentation": "https://www.home-assistant.io/integrations/swisscom",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "switch": {
+        "domain": "switch",
+        "name": "Switch",
+        "documentation": "https://www.home-assistant.io/integrations/switch",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "switchbot": {
+        "domain": "switchbot",
+        "name": "SwitchBot",
+        "documentation": "https://www.home-assistant.io/integrations/switchbot",
+        "requirements": [
+            "PySwitchbot==0.6.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "switcher_kis": {
+        "domain": "switcher_kis",
+        "name": "Switcher",
+        "documentation": "https://www.home-assistant.io/integrations/switcher_kis/",
+        "codeowners": [
+            "@tomerfi"
+        ],
+        "requirements": [
+            "aioswitcher==2019.4.26"
+        ],
+        "dependencies": []
+    },
+    "switchmate": {
+        "domain": "switchmate",
+        "name": "Switchmate SimplySmart Home",
+        "documentation": "https://www.home-assistant.io/integrations/switchmate",
+        "requirements": [
+            "pySwitchmate==0.4.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "syncthru": {
+        "domain": "syncthru",
+        "name": "Samsung SyncThru Printer",
+        "documentation": "https://www.home-assistant.io/integrations/syncthru",
+        "requirements": [
+            "pysyncthru==0.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@nielstron"
+        ]
+    },
+    "synology": {
+        "domain": "synology",
+        "name": "Synology",
+        "documentation": "https://www.home-assistant.io/integrations/synology",
+        "requirements": [
+            "py-synology==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "synology_chat": {
+        "domain": "synology_chat",
+        "name": "Synology Chat",
+        "documentation": "https://www.home-assistant.io/integrations/synology_chat",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "synology_srm": {
+        "domain": "synology_srm",
+        "name": "Synology SRM",
+        "documentation": "https://www.home-assistant.io/integrations/synology_srm",
+        "requirements": [
+            "synology-srm==0.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@aerialls"
+        ]
+    },
+    "synologydsm": {
+        "domain": "synologydsm",
+        "name": "SynologyDSM",
+        "documentation": "https://www.home-assistant.io/integrations/synologydsm",
+        "requirements": [
+            "python-synology==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "syslog": {
+        "domain": "syslog",
+        "name": "Syslog",
+        "documentation": "https://www.home-assistant.io/integrations/syslog",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "system_health": {
+        "domain": "system_health",
+        "name": "System Health",
+        "documentation": "https://www.home-assistant.io/integrations/system_health",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "system_log": {
+        "domain": "system_log",
+        "name": "System Log",
+        "documentation": "https://www.home-assistant.io/integrations/system_log",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "systemmonitor": {
+        "domain": "systemmonitor",
+        "name": "System Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/systemmonitor",
+        "requirements": [
+            "psutil==5.6.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tado": {
+        "domain": "tado",
+        "name": "Tado",
+        "documentation": "https://www.home-assistant.io/integrations/tado",
+        "requirements": [
+            "python-tado==0.2.9"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@michaelarnauts"
+        ]
+    },
+    "tahoma": {
+        "domain": "tahoma",
+        "name": "Tahoma",
+        "documentation": "https://www.home-assistant.io/integrations/tahoma",
+        "requirements": [
+            "tahoma-api==0.0.16"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@philklei"
+        ]
+    },
+    "tank_utility": {
+        "domain": "tank_utility",
+        "name": "Tank Utility",
+        "documentation": "https://www.home-assistant.io/integrations/tank_utility",
+        "requirements": [
+            "tank_utility==1.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tapsaff": {
+        "domain": "tapsaff",
+        "name": "Taps Aff",
+        "documentation": "https://www.home-assistant.io/integrations/tapsaff",
+        "requirements": [
+            "tapsaff==0.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tautulli": {
+        "domain": "tautulli",
+        "name": "Tautulli",
+        "documentation": "https://www.home-assistant.io/integrations/tautulli",
+        "requirements": [
+            "pytautulli==0.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "tcp": {
+        "domain": "tcp",
+        "name": "TCP",
+        "documentation": "https://www.home-assistant.io/integrations/tcp",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ted5000": {
+        "domain": "ted5000",
+        "name": "The Energy Detective TED5000",
+        "documentation": "https://www.home-assistant.io/integrations/ted5000",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "teksavvy": {
+        "domain": "teksavvy",
+        "name": "TekSavvy",
+        "documentation": "https://www.home-assistant.io/integrations/teksavvy",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "telegram": {
+        "domain": "telegram",
+        "name": "Telegram",
+        "documentation": "https://www.home-assistant.io/integrations/telegram",
+        "requirements": [],
+        "dependencies": [
+            "telegram_bot"
+        ],
+        "codeowners": []
+    },
+    "telegram_bot": {
+        "domain": "telegram_bot",
+        "name": "Telegram bot",
+        "documentation": "https://www.home-assistant.io/integrations/telegram_bot",
+        "requirements": [
+            "python-telegram-bot==11.1.0",
+            "PySocks==1.7.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "tellduslive": {
+        "domain": "tellduslive",
+        "name": "Telldus Live",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tellduslive",
+        "requirements": [
+            "tellduslive==0.10.10"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fredrike"
+        ],
+        "quality_scale": "gold"
+    },
+    "tellstick": {
+        "domain": "tellstick",
+        "name": "TellStick",
+        "documentation": "https://www.home-assistant.io/integrations/tellstick",
+        "requirements": [
+            "tellcore-net==0.4",
+            "tellcore-py==1.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "telnet": {
+        "domain": "telnet",
+        "name": "Telnet",
+        "documentation": "https://www.home-assistant.io/integrations/telnet",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "temper": {
+        "domain": "temper",
+        "name": "TEMPer",
+        "documentation": "https://www.home-assistant.io/integrations/temper",
+        "requirements": [
+            "temperusb==1.5.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "template": {
+        "domain": "template",
+        "name": "Template",
+        "documentation": "https://www.home-assistant.io/integrations/template",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@PhracturedBlue",
+            "@tetienne"
+        ],
+        "quality_scale": "internal"
+    },
+    "tensorflow": {
+        "domain": "tensorflow",
+        "name": "TensorFlow",
+        "documentation": "https://www.home-assistant.io/integrations/tensorflow",
+        "requirements": [
+            "tensorflow==1.13.2",
+            "numpy==1.18.1",
+            "protobuf==3.6.1",
+            "pillow==6.2.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tesla": {
+        "domain": "tesla",
+        "name": "Tesla",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tesla",
+        "requirements": [
+            "teslajsonpy==0.3.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@zabuldon",
+            "@alandtse"
+        ]
+    },
+    "tfiac": {
+        "domain": "tfiac",
+        "name": "Tfiac",
+        "documentation": "https://www.home-assistant.io/integrations/tfiac",
+        "requirements": [
+            "pytfiac==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fredrike",
+            "@mellado"
+        ]
+    },
+    "thermoworks_smoke": {
+        "domain": "thermoworks_smoke",
+        "name": "ThermoWorks Smoke",
+        "documentation": "https://www.home-assistant.io/integrations/thermoworks_smoke",
+        "requirements": [
+            "stringcase==1.2.0",
+            "thermoworks_smoke==0.1.8"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "thethingsnetwork": {
+        "domain": "thethingsnetwork",
+        "name": "The Things Network",
+        "documentation": "https://www.home-assistant.io/integrations/thethingsnetwork",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "thingspeak": {
+        "domain": "thingspeak",
+        "name": "ThingSpeak",
+        "documentation": "https://www.home-assistant.io/integrations/thingspeak",
+        "requirements": [
+            "thingspeak==1.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "thinkingcleaner": {
+        "domain": "thinkingcleaner",
+        "name": "Thinking Cleaner",
+        "documentation": "https://www.home-assistant.io/integrations/thinkingcleaner",
+        "requirements": [
+            "pythinkingcleaner==0.0.3"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "thomson": {
+        "domain": "thomson",
+        "name": "Thomson",
+        "documentation": "https://www.home-assistant.io/integrations/thomson",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "threshold": {
+        "domain": "threshold",
+        "name": "Threshold",
+        "documentation": "https://www.home-assistant.io/integrations/threshold",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "tibber": {
+        "domain": "tibber",
+        "name": "Tibber",
+        "documentation": "https://www.home-assistant.io/integrations/tibber",
+        "requirements": [
+            "pyTibber==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "quality_scale": "silver"
+    },
+    "tikteck": {
+        "domain": "tikteck",
+        "name": "Tikteck",
+        "documentation": "https://www.home-assistant.io/integrations/tikteck",
+        "requirements": [
+            "tikteck==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tile": {
+        "domain": "tile",
+        "name": "Tile",
+        "documentation": "https://www.home-assistant.io/integrations/tile",
+        "requirements": [
+            "pytile==3.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "time_date": {
+        "domain": "time_date",
+        "name": "Time & Date",
+        "documentation": "https://www.home-assistant.io/integrations/time_date",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "timer": {
+        "domain": "timer",
+        "name": "Timer",
+        "documentation": "https://www.home-assistant.io/integrations/timer",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "tmb": {
+        "domain": "tmb",
+        "name": "Transports Metropolitans de Barcelona",
+        "documentation": "https://www.home-assistant.io/integrations/tmb",
+        "requirements": [
+            "tmb==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@alemuro"
+        ]
+    },
+    "tod": {
+        "domain": "tod",
+        "name": "Times of the Day",
+        "documentation": "https://www.home-assistant.io/integrations/tod",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "todoist": {
+        "domain": "todoist",
+        "name": "Todoist",
+        "documentation": "https://www.home-assistant.io/integrations/todoist",
+        "requirements": [
+            "todoist-python==8.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@boralyl"
+        ]
+    },
+    "tof": {
+        "domain": "tof",
+        "name": "Time of Flight",
+        "documentation": "https://www.home-assistant.io/integrations/tof",
+        "requirements": [
+            "VL53L1X2==0.1.5"
+        ],
+        "dependencies": [
+            "rpi_gpio"
+        ],
+        "codeowners": []
+    },
+    "tomato": {
+        "domain": "tomato",
+        "name": "Tomato",
+        "documentation": "https://www.home-assistant.io/integrations/tomato",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "toon": {
+        "domain": "toon",
+        "name": "Toon",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/toon",
+        "requirements": [
+            "toonapilib==3.2.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@frenck"
+        ]
+    },
+    "torque": {
+        "domain": "torque",
+        "name": "Torque",
+        "documentation": "https://www.home-assistant.io/integrations/torque",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "totalconnect": {
+        "domain": "totalconnect",
+        "name": "Honeywell Total Connect Alarm",
+        "documentation": "https://www.home-assistant.io/integrations/totalconnect",
+        "requirements": [
+            "total_connect_client==0.50"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@austinmroczek"
+        ]
+    },
+    "touchline": {
+        "domain": "touchline",
+        "name": "Roth Touchline",
+        "documentation": "https://www.home-assistant.io/integrations/touchline",
+        "requirements": [
+            "pytouchline==0.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tplink": {
+        "domain": "tplink",
+        "name": "TP-Link Kasa Smart",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tplink",
+        "requirements": [
+            "pyHS100==0.3.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rytilahti"
+        ]
+    },
+    "tplink_lte": {
+        "domain": "tplink_lte",
+        "name": "TP-Link LTE",
+        "documentation": "https://www.home-assistant.io/integrations/tplink_lte",
+        "requirements": [
+            "tp-connected==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "traccar": {
+        "domain": "traccar",
+        "name": "Traccar",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/traccar",
+        "requirements": [
+            "pytraccar==0.9.0",
+            "stringcase==1.2.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "trackr": {
+        "domain": "trackr",
+        "name": "TrackR",
+        "documentation": "https://www.home-assistant.io/integrations/trackr",
+        "requirements": [
+            "pytrackr==0.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "tradfri": {
+        "domain": "tradfri",
+        "name": "IKEA TR\u00c5DFRI (TRADFRI)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tradfri",
+        "requirements": [
+            "pytradfri[async]==6.4.0"
+        ],
+        "homekit": {
+            "models": [
+                "TRADFRI"
+            ]
+        },
+        "dependencies": [],
+        "zeroconf": [
+            "_coap._udp.local."
+        ],
+        "codeowners": [
+            "@ggravlingen"
+        ]
+    },
+    "trafikverket_train": {
+        "domain": "trafikverket_train",
+        "name": "Trafikverket Train",
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_train",
+        "requirements": [
+            "pytrafikverket==0.1.6.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@endor-force"
+        ]
+    },
+    "trafikverket_weatherstation": {
+        "domain": "trafikverket_weatherstation",
+        "name": "Trafikverket Weather Station",
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_weatherstation",
+        "requirements": [
+            "pytrafikverket==0.1.6.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "transmission": {
+        "domain": "transmission",
+        "name": "Transmission",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/transmission",
+        "requirements": [
+            "transmissionrpc==0.11"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@engrbm87",
+            "@JPHutchins"
+        ]
+    },
+    "transport_nsw": {
+        "domain": "transport_nsw",
+        "name": "Transport NSW",
+        "documentation": "https://www.home-assistant.io/integrations/transport_nsw",
+        "requirements": [
+            "PyTransportNSW==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "travisci": {
+        "domain": "travisci",
+        "name": "Travis-CI",
+        "documentation": "https://www.home-assistant.io/integrations/travisci",
+        "requirements": [
+            "TravisPy==0.3.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "trend": {
+        "domain": "trend",
+        "name": "Trend",
+        "documentation": "https://www.home-assistant.io/integrations/trend",
+        "requirements": [
+            "numpy==1.18.1"
+        ],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "tts": {
+        "domain": "tts",
+        "name": "Text-to-Speech (TTS)",
+        "documentation": "https://www.home-assistant.io/integrations/tts",
+        "requirements": [
+            "mutagen==1.43.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "media_player"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "tuya": {
+        "domain": "tuya",
+        "name": "Tuya",
+        "documentation": "https://www.home-assistant.io/integrations/tuya",
+        "requirements": [
+            "tuyaha==0.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "twentemilieu": {
+        "domain": "twentemilieu",
+        "name": "Twente Milieu",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twentemilieu",
+        "requirements": [
+            "twentemilieu==0.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@frenck"
+        ]
+    },
+    "twilio": {
+        "domain": "twilio",
+        "name": "Twilio",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twilio",
+        "requirements": [
+            "twilio==6.32.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "twilio_call": {
+        "domain": "twilio_call",
+        "name": "Twilio Call",
+        "documentation": "https://www.home-assistant.io/integrations/twilio_call",
+        "requirements": [],
+        "dependencies": [
+            "twilio"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "twilio_sms": {
+        "domain": "twilio_sms",
+        "name": "Twilio SMS",
+        "documentation": "https://www.home-assistant.io/integrations/twilio_sms",
+        "requirements": [],
+        "dependencies": [
+            "twilio"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "twitch": {
+        "domain": "twitch",
+        "name": "Twitch",
+        "documentation": "https://www.home-assistant.io/integrations/twitch",
+        "requirements": [
+            "python-twitch-client==0.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "twitter": {
+        "domain": "twitter",
+        "name": "Twitter",
+        "documentation": "https://www.home-assistant.io/integrations/twitter",
+        "requirements": [
+            "TwitterAPI==2.5.10"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ubee": {
+        "domain": "ubee",
+        "name": "Ubee Router",
+        "documentation": "https://www.home-assistant.io/integrations/ubee",
+        "requirements": [
+            "pyubee==0.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@mzdrale"
+        ]
+    },
+    "ubus": {
+        "domain": "ubus",
+        "name": "OpenWrt (ubus)",
+        "documentation": "https://www.home-assistant.io/integrations/ubus",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ue_smart_radio": {
+        "domain": "ue_smart_radio",
+        "name": "Logitech UE Smart Radio",
+        "documentation": "https://www.home-assistant.io/integrations/ue_smart_radio",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "uk_transport": {
+        "domain": "uk_transport",
+        "name": "UK Transport",
+        "documentation": "https://www.home-assistant.io/integrations/uk_transport",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "unifi": {
+        "domain": "unifi",
+        "name": "Ubiquiti UniFi",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/unifi",
+        "requirements": [
+            "aiounifi==12"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@kane610"
+        ],
+        "quality_scale": "platinum"
+    },
+    "unifi_direct": {
+        "domain": "unifi_direct",
+        "name": "Ubiquiti UniFi AP",
+        "documentation": "https://www.home-assistant.io/integrations/unifi_direct",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "unifiled": {
+        "domain": "unifiled",
+        "name": "Ubiquiti UniFi LED",
+        "documentation": "https://www.home-assistant.io/integrations/unifiled",
+        "dependencies": [],
+        "codeowners": [
+            "@florisvdk"
+        ],
+        "requirements": [
+            "unifiled==0.11"
+        ]
+    },
+    "universal": {
+        "domain": "universal",
+        "name": "Universal Media Player",
+        "documentation": "https://www.home-assistant.io/integrations/universal",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "upc_connect": {
+        "domain": "upc_connect",
+        "name": "UPC Connect Box",
+        "documentation": "https://www.home-assistant.io/integrations/upc_connect",
+        "requirements": [
+            "connect-box==0.2.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@pvizeli"
+        ]
+    },
+    "upcloud": {
+        "domain": "upcloud",
+        "name": "UpCloud",
+        "documentation": "https://www.home-assistant.io/integrations/upcloud",
+        "requirements": [
+            "upcloud-api==0.4.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@scop"
+        ]
+    },
+    "updater": {
+        "domain": "updater",
+        "name": "Updater",
+        "documentation": "https://www.home-assistant.io/integrations/updater",
+        "requirements": [
+            "distro==1.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "upnp": {
+        "domain": "upnp",
+        "name": "UPnP",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/upnp",
+        "requirements": [
+            "async-upnp-client==0.14.12"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "uptime": {
+        "domain": "uptime",
+        "name": "Uptime",
+        "documentation": "https://www.home-assistant.io/integrations/uptime",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "uptimerobot": {
+        "domain": "uptimerobot",
+        "name": "Uptime Robot",
+        "documentation": "https://www.home-assistant.io/integrations/uptimerobot",
+        "requirements": [
+            "pyuptimerobot==0.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "uscis": {
+        "domain": "uscis",
+        "name": "U.S. Citizenship and Immigration Services (USCIS)",
+        "documentation": "https://www.home-assistant.io/integrations/uscis",
+        "requirements": [
+            "uscisstatus==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "usgs_earthquakes_feed": {
+        "domain": "usgs_earthquakes_feed",
+        "name": "U.S. Geological Survey Earthquake Hazards (USGS)",
+        "documentation": "https://www.home-assistant.io/integrations/usgs_earthquakes_feed",
+        "requirements": [
+            "geojson_client==0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "utility_meter": {
+        "domain": "utility_meter",
+        "name": "Utility Meter",
+        "documentation": "https://www.home-assistant.io/integrations/utility_meter",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@dgomes"
+        ],
+        "quality_scale": "internal"
+    },
+    "uvc": {
+        "domain": "uvc",
+        "name": "Ubiquiti UniFi Video",
+        "documentation": "https://www.home-assistant.io/integrations/uvc",
+        "requirements": [
+            "uvcclient==0.11.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "vacuum": {
+        "domain": "vacuum",
+        "name": "Vacuum",
+        "documentation": "https://www.home-assistant.io/integrations/vacuum",
+        "requirements": [],
+        "dependencies": [
+            "group"
+        ],
+        "codeowners": []
+    },
+    "vallox": {
+        "domain": "vallox",
+        "name": "Valloxs",
+        "documentation": "https://www.home-assistant.io/integrations/vallox",
+        "requirements": [
+            "vallox-websocket-api==2.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "vasttrafik": {
+        "domain": "vasttrafik",
+        "name": "V\u00e4sttrafik",
+        "documentation": "https://www.home-assistant.io/integrations/vasttrafik",
+        "requirements": [
+            "vtjp==0.1.14"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "velbus": {
+        "domain": "velbus",
+        "name": "Velbus",
+        "documentation": "https://www.home-assistant.io/integrations/velbus",
+        "requirements": [
+            "python-velbus==2.0.36"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "codeowners": [
+            "@Cereal2nd",
+            "@brefra"
+        ]
+    },
+    "velux": {
+        "domain": "velux",
+        "name": "Velux",
+        "documentation": "https://www.home-assistant.io/integrations/velux",
+        "requirements": [
+            "pyvlx==0.2.12"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@Julius2342"
+        ]
+    },
+    "venstar": {
+        "domain": "venstar",
+        "name": "Venstar",
+        "documentation": "https://www.home-assistant.io/integrations/venstar",
+        "requirements": [
+            "venstarcolortouch==0.12"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "vera": {
+        "domain": "vera",
+        "name": "Vera",
+        "documentation": "https://www.home-assistant.io/integrations/vera",
+        "requirements": [
+            "pyvera==0.3.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "verisure": {
+        "domain": "verisure",
+        "name": "Verisure",
+        "documentation": "https://www.home-assistant.io/integrations/verisure",
+        "requirements": [
+            "jsonpath==0.82",
+            "vsure==1.5.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "versasense": {
+        "domain": "versasense",
+        "name": "VersaSense",
+        "documentation": "https://www.home-assistant.io/integrations/versasense",
+        "dependencies": [],
+        "codeowners": [
+            "@flamm3blemuff1n"
+        ],
+        "requirements": [
+            "pyversasense==0.0.6"
+        ]
+    },
+    "version": {
+        "domain": "version",
+        "name": "Version",
+        "documentation": "https://www.home-assistant.io/integrations/version",
+        "requirements": [
+            "pyhaversion==3.2.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "vesync": {
+        "domain": "vesync",
+        "name": "Etekcity VeSync",
+        "documentation": "https://www.home-assistant.io/integrations/vesync",
+        "dependencies": [],
+        "codeowners": [
+            "@markperdue",
+            "@webdjoe"
+        ],
+        "requirements": [
+            "pyvesync==1.1.0"
+        ],
+        "config_flow": True
+    },
+    "viaggiatreno": {
+        "domain": "viaggiatreno",
+        "name": "Trenitalia ViaggiaTreno",
+        "documentation": "https://www.home-assistant.io/integrations/viaggiatreno",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "vicare": {
+        "domain": "vicare",
+        "name": "Viessmann ViCare",
+        "documentation": "https://www.home-assistant.io/integrations/vicare",
+        "dependencies": [],
+        "codeowners": [
+            "@oischinger"
+        ],
+        "requirements": [
+            "PyViCare==0.1.2"
+        ]
+    },
+    "vivotek": {
+        "domain": "vivotek",
+        "name": "Vivotek",
+        "documentation": "https://www.home-assistant.io/integrations/vivotek",
+        "requirements": [
+            "libpyvivotek==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@HarlemSquirrel"
+        ]
+    },
+    "vizio": {
+        "domain": "vizio",
+        "name": "Vizio SmartCast TV",
+        "documentation": "https://www.home-assistant.io/integrations/vizio",
+        "requirements": [
+            "pyvizio==0.1.21"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@raman325"
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_viziocast._tcp.local."
+        ],
+        "quality_scale": "platinum"
+    },
+    "vlc": {
+        "domain": "vlc",
+        "name": "VLC media player",
+        "documentation": "https://www.home-assistant.io/integrations/vlc",
+        "requirements": [
+            "python-vlc==1.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "vlc_telnet": {
+        "domain": "vlc_telnet",
+        "name": "VLC media player Telnet",
+        "documentation": "https://www.home-assistant.io/integrations/vlc-telnet",
+        "requirements": [
+            "python-telnet-vlc==1.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rodripf"
+        ]
+    },
+    "voicerss": {
+        "domain": "voicerss",
+        "name": "VoiceRSS",
+        "documentation": "https://www.home-assistant.io/integrations/voicerss",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "volkszaehler": {
+        "domain": "volkszaehler",
+        "name": "Volkszaehler",
+        "documentation": "https://www.home-assistant.io/integrations/volkszaehler",
+        "requirements": [
+            "volkszaehler==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "volumio": {
+        "domain": "volumio",
+        "name": "Volumio",
+        "documentation": "https://www.home-assistant.io/integrations/volumio",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "volvooncall": {
+        "domain": "volvooncall",
+        "name": "Volvo On Call",
+        "documentation": "https://www.home-assistant.io/integrations/volvooncall",
+        "requirements": [
+            "volvooncall==0.8.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "vultr": {
+        "domain": "vultr",
+        "name": "Vultr",
+        "documentation": "https://www.home-assistant.io/integrations/vultr",
+        "requirements": [
+            "vultr==0.1.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "w800rf32": {
+        "domain": "w800rf32",
+        "name": "WGL Designs W800RF32",
+        "documentation": "https://www.home-assistant.io/integrations/w800rf32",
+        "requirements": [
+            "pyW800rf32==0.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "wake_on_lan": {
+        "domain": "wake_on_lan",
+        "name": "Wake on LAN",
+        "documentation": "https://www.home-assistant.io/integrations/wake_on_lan",
+        "requirements": [
+            "wakeonlan==1.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "waqi": {
+        "domain": "waqi",
+        "name": "World Air Quality Index (WAQI)",
+        "documentation": "https://www.home-assistant.io/integrations/waqi",
+        "requirements": [
+            "waqiasync==1.0.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@andrey-git"
+        ]
+    },
+    "water_heater": {
+        "domain": "water_heater",
+        "name": "Water Heater",
+        "documentation": "https://www.home-assistant.io/integrations/water_heater",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "waterfurnace": {
+        "domain": "waterfurnace",
+        "name": "WaterFurnace",
+        "documentation": "https://www.home-assistant.io/integrations/waterfurnace",
+        "requirements": [
+            "waterfurnace==1.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "watson_iot": {
+        "domain": "watson_iot",
+        "name": "IBM Watson IoT Platform",
+        "documentation": "https://www.home-assistant.io/integrations/watson_iot",
+        "requirements": [
+            "ibmiotf==0.3.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "watson_tts": {
+        "domain": "watson_tts",
+        "name": "IBM Watson TTS",
+        "documentation": "https://www.home-assistant.io/integrations/watson_tts",
+        "requirements": [
+            "ibm-watson==4.0.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rutkai"
+        ]
+    },
+    "waze_travel_time": {
+        "domain": "waze_travel_time",
+        "name": "Waze Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/waze_travel_time",
+        "requirements": [
+            "WazeRouteCalculator==0.12"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "weather": {
+        "domain": "weather",
+        "name": "Weather",
+        "documentation": "https://www.home-assistant.io/integrations/weather",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "webhook": {
+        "domain": "webhook",
+        "name": "Webhook",
+        "documentation": "https://www.home-assistant.io/integrations/webhook",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "weblink": {
+        "domain": "weblink",
+        "name": "Weblink",
+        "documentation": "https://www.home-assistant.io/integrations/weblink",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "webostv": {
+        "domain": "webostv",
+        "name": "LG webOS Smart TV",
+        "documentation": "https://www.home-assistant.io/integrations/webostv",
+        "requirements": [
+            "aiopylgtv==0.3.3"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": [
+            "@bendavid"
+        ]
+    },
+    "websocket_api": {
+        "domain": "websocket_api",
+        "name": "Home Asssitant WebSocket API",
+        "documentation": "https://www.home-assistant.io/integrations/websocket_api",
+        "requirements": [],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "wemo": {
+        "domain": "wemo",
+        "name": "Belkin WeMo",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wemo",
+        "requirements": [
+            "pywemo==0.4.34"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Belkin International Inc."
+            }
+        ],
+        "homekit": {
+            "models": [
+                "Wemo"
+            ]
+        },
+        "dependencies": [],
+        "codeowners": [
+            "@sqldiablo"
+        ]
+    },
+    "whois": {
+        "domain": "whois",
+        "name": "Whois",
+        "documentation": "https://www.home-assistant.io/integrations/whois",
+        "requirements": [
+            "python-whois==0.7.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "wink": {
+        "domain": "wink",
+        "name": "Wink",
+        "documentation": "https://www.home-assistant.io/integrations/wink",
+        "requirements": [
+            "pubnubsub-handler==1.0.8",
+            "python-wink==1.10.5"
+        ],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "codeowners": []
+    },
+    "wirelesstag": {
+        "domain": "wirelesstag",
+        "name": "Wireless Sensor Tags",
+        "documentation": "https://www.home-assistant.io/integrations/wirelesstag",
+        "requirements": [
+            "wirelesstagpy==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "withings": {
+        "domain": "withings",
+        "name": "Withings",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/withings",
+        "requirements": [
+            "withings-api==2.1.3"
+        ],
+        "dependencies": [
+            "api",
+            "http",
+            "webhook"
+        ],
+        "codeowners": [
+            "@vangorra"
+        ]
+    },
+    "wled": {
+        "domain": "wled",
+        "name": "WLED",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wled",
+        "requirements": [
+            "wled==0.2.1"
+        ],
+        "dependencies": [],
+        "zeroconf": [
+            "_wled._tcp.local."
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "quality_scale": "platinum"
+    },
+    "workday": {
+        "domain": "workday",
+        "name": "Workday",
+        "documentation": "https://www.home-assistant.io/integrations/workday",
+        "requirements": [
+            "holidays==0.10.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "worldclock": {
+        "domain": "worldclock",
+        "name": "Worldclock",
+        "documentation": "https://www.home-assistant.io/integrations/worldclock",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "worldtidesinfo": {
+        "domain": "worldtidesinfo",
+        "name": "World Tides",
+        "documentation": "https://www.home-assistant.io/integrations/worldtidesinfo",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "worxlandroid": {
+        "domain": "worxlandroid",
+        "name": "Worx Landroid",
+        "documentation": "https://www.home-assistant.io/integrations/worxlandroid",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "wsdot": {
+        "domain": "wsdot",
+        "name": "Washington State Department of Transportation (WSDOT)",
+        "documentation": "https://www.home-assistant.io/integrations/wsdot",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "wunderground": {
+        "domain": "wunderground",
+        "name": "Weather Underground (WUnderground)",
+        "documentation": "https://www.home-assistant.io/integrations/wunderground",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "wunderlist": {
+        "domain": "wunderlist",
+        "name": "Wunderlist",
+        "documentation": "https://www.home-assistant.io/integrations/wunderlist",
+        "requirements": [
+            "wunderpy2==0.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "wwlln": {
+        "domain": "wwlln",
+        "name": "World Wide Lightning Location Network (WWLLN)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wwlln",
+        "requirements": [
+            "aiowwlln==2.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "x10": {
+        "domain": "x10",
+        "name": "Heyu X10",
+        "documentation": "https://www.home-assistant.io/integrations/x10",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "xbox_live": {
+        "domain": "xbox_live",
+        "name": "Xbox Live",
+        "documentation": "https://www.home-assistant.io/integrations/xbox_live",
+        "requirements": [
+            "xboxapi==0.1.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@MartinHjelmare"
+        ]
+    },
+    "xeoma": {
+        "domain": "xeoma",
+        "name": "Xeoma",
+        "documentation": "https://www.home-assistant.io/integrations/xeoma",
+        "requirements": [
+            "pyxeoma==1.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "xfinity": {
+        "domain": "xfinity",
+        "name": "Xfinity Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/xfinity",
+        "requirements": [
+            "xfinity-gateway==0.0.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@cisasteelersfan"
+        ]
+    },
+    "xiaomi": {
+        "domain": "xiaomi",
+        "name": "Xiaomi",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi",
+        "requirements": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "xiaomi_aqara": {
+        "domain": "xiaomi_aqara",
+        "name": "Xiaomi Gateway (Aqara)",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_aqara",
+        "requirements": [
+            "PyXiaomiGateway==0.12.4"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen",
+            "@syssi"
+        ]
+    },
+    "xiaomi_miio": {
+        "domain": "xiaomi_miio",
+        "name": "Xiaomi miio",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_miio",
+        "requirements": [
+            "construct==2.9.45",
+            "python-miio==0.4.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rytilahti",
+            "@syssi"
+        ]
+    },
+    "xiaomi_tv": {
+        "domain": "xiaomi_tv",
+        "name": "Xiaomi TV",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_tv",
+        "requirements": [
+            "pymitv==1.4.3"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@simse"
+        ]
+    },
+    "xmpp": {
+        "domain": "xmpp",
+        "name": "Jabber (XMPP)",
+        "documentation": "https://www.home-assistant.io/integrations/xmpp",
+        "requirements": [
+            "slixmpp==1.4.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@fabaff",
+            "@flowolf"
+        ]
+    },
+    "xs1": {
+        "domain": "xs1",
+        "name": "EZcontrol XS1",
+        "documentation": "https://www.home-assistant.io/integrations/xs1",
+        "requirements": [
+            "xs1-api-client==2.3.5"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "yale_smart_alarm": {
+        "domain": "yale_smart_alarm",
+        "name": "Yale Smart Living",
+        "documentation": "https://www.home-assistant.io/integrations/yale_smart_alarm",
+        "requirements": [
+            "yalesmartalarmclient==0.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "yamaha": {
+        "domain": "yamaha",
+        "name": "Yamaha Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/yamaha",
+        "requirements": [
+            "rxv==0.6.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "yamaha_musiccast": {
+        "domain": "yamaha_musiccast",
+        "name": "Yamaha MusicCast",
+        "documentation": "https://www.home-assistant.io/integrations/yamaha_musiccast",
+        "requirements": [
+            "pymusiccast==0.1.6"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@jalmeroth"
+        ]
+    },
+    "yandex_transport": {
+        "domain": "yandex_transport",
+        "name": "Yandex Transport",
+        "documentation": "https://www.home-assistant.io/integrations/yandex_transport",
+        "requirements": [
+            "ya_ma==0.3.8"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rishatik92"
+        ]
+    },
+    "yandextts": {
+        "domain": "yandextts",
+        "name": "Yandex TTS",
+        "documentation": "https://www.home-assistant.io/integrations/yandextts",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "yeelight": {
+        "domain": "yeelight",
+        "name": "Yeelight",
+        "documentation": "https://www.home-assistant.io/integrations/yeelight",
+        "requirements": [
+            "yeelight==0.5.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rytilahti",
+            "@zewelor"
+        ]
+    },
+    "yeelightsunflower": {
+        "domain": "yeelightsunflower",
+        "name": "Yeelight Sunflower",
+        "documentation": "https://www.home-assistant.io/integrations/yeelightsunflower",
+        "requirements": [
+            "yeelightsunflower==0.0.10"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@lindsaymarkward"
+        ]
+    },
+    "yessssms": {
+        "domain": "yessssms",
+        "name": "yesss! SMS",
+        "documentation": "https://www.home-assistant.io/integrations/yessssms",
+        "requirements": [
+            "YesssSMS==0.4.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@flowolf"
+        ]
+    },
+    "yi": {
+        "domain": "yi",
+        "name": "Yi Home Cameras",
+        "documentation": "https://www.home-assistant.io/integrations/yi",
+        "requirements": [
+            "aioftp==0.12.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "yr": {
+        "domain": "yr",
+        "name": "Yr",
+        "documentation": "https://www.home-assistant.io/integrations/yr",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "yweather": {
+        "domain": "yweather",
+        "name": "Yahoo Weather",
+        "documentation": "https://www.home-assistant.io/integrations/yweather",
+        "requirements": [
+            "yahooweather==0.10"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zabbix": {
+        "domain": "zabbix",
+        "name": "Zabbix",
+        "documentation": "https://www.home-assistant.io/integrations/zabbix",
+        "requirements": [
+            "pyzabbix==0.7.4"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zamg": {
+        "domain": "zamg",
+        "name": "Zentralanstalt f\u00fcr Meteorologie und Geodynamik (ZAMG)",
+        "documentation": "https://www.home-assistant.io/integrations/zamg",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zengge": {
+        "domain": "zengge",
+        "name": "Zengge",
+        "documentation": "https://www.home-assistant.io/integrations/zengge",
+        "requirements": [
+            "zengge==0.2"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zeroconf": {
+        "domain": "zeroconf",
+        "name": "Zero-configuration networking (zeroconf)",
+        "documentation": "https://www.home-assistant.io/integrations/zeroconf",
+        "requirements": [
+            "zeroconf==0.24.4"
+        ],
+        "dependencies": [
+            "api"
+        ],
+        "codeowners": [
+            "@robbiet480",
+            "@Kane610"
+        ],
+        "quality_scale": "internal"
+    },
+    "zestimate": {
+        "domain": "zestimate",
+        "name": "Zestimate",
+        "documentation": "https://www.home-assistant.io/integrations/zestimate",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zha": {
+        "domain": "zha",
+        "name": "Zigbee Home Automation",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zha",
+        "requirements": [
+            "bellows-homeassistant==0.13.2",
+            "zha-quirks==0.0.32",
+            "zigpy-deconz==0.7.0",
+            "zigpy-homeassistant==0.13.1",
+            "zigpy-xbee-homeassistant==0.9.0",
+            "zigpy-zigate==0.5.1"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dmulcahey",
+            "@adminiuga"
+        ]
+    },
+    "zhong_hong": {
+        "domain": "zhong_hong",
+        "name": "ZhongHong",
+        "documentation": "https://www.home-assistant.io/integrations/zhong_hong",
+        "requirements": [
+            "zhong_hong_hvac==1.0.9"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zigbee": {
+        "domain": "zigbee",
+        "name": "Zigbee",
+        "documentation": "https://www.home-assistant.io/integrations/zigbee",
+        "requirements": [
+            "xbee-helper==0.0.7"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "ziggo_mediabox_xl": {
+        "domain": "ziggo_mediabox_xl",
+        "name": "Ziggo Mediabox XL",
+        "documentation": "https://www.home-assistant.io/integrations/ziggo_mediabox_xl",
+        "requirements": [
+            "ziggo-mediabox-xl==1.1.0"
+        ],
+        "dependencies": [],
+        "codeowners": []
+    },
+    "zone": {
+        "domain": "zone",
+        "name": "Zone",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/zone",
+        "requirements": [],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "zoneminder": {
+        "domain": "zoneminder",
+        "name": "ZoneMinder",
+        "documentation": "https://www.home-assistant.io/integrations/zoneminder",
+        "requirements": [
+            "zm-py==0.4.0"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "zwave": {
+        "domain": "zwave",
+        "name": "Z-Wave",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zwave",
+        "requirements": [
+            "homeassistant-pyozw==0.1.8",
+            "pydispatcher==2.0.5"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@home-assistant/z-wave"
+        ]
+    }
+}
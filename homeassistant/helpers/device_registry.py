@@ -1,8 +1,8 @@
 """Provide a way to connect entities belonging to one device."""
 from asyncio import Event
-from collections import OrderedDict
+from collections import UserDict
 import logging
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 import uuid
 
 import attr
@@ -40,7 +40,7 @@ class DeviceEntry:
     name = attr.ib(type=str, default=None)
     sw_version = attr.ib(type=str, default=None)
     via_device_id = attr.ib(type=str, default=None)
-    area_id = attr.ib(type=str, default=None)
+    area_id = attr.ib(type=Optional[str], default=None)
     name_by_user = attr.ib(type=str, default=None)
     id = attr.ib(type=str, default=attr.Factory(lambda: uuid.uuid4().hex))
     # This value is not stored, just used to keep track of events to fire.
@@ -67,15 +67,115 @@ def format_mac(mac: str) -> str:
     return mac
 
 
+class DeviceRegistryItems(UserDict):
+    """Container of the device entries, keyed by device id.
+
+    Keeps indexes of the devices by identifier, connection, config entry and
+    area up to date as devices are added, replaced and removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        # Device ids of each identifier, connection, config entry and area
+        self._identifiers: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._connections: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._config_entry_ids: Dict[str, Dict[str, None]] = {}
+        self._area_ids: Dict[str, Dict[str, None]] = {}
+        super().__init__()
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add or replace a device."""
+        old = self.data.get(key)
+        if old is not None:
+            self._unindex(key, old, entry)
+        self.data[key] = entry
+        self._index(key, entry, old)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a device."""
+        entry = self.data.pop(key)
+        self._unindex(key, entry, None)
+
+    def _index(self, key: str, entry: DeviceEntry, old: Optional[DeviceEntry]) -> None:
+        """Add the device to the indexes it was not in yet."""
+        for identifier in entry.identifiers:
+            if old is None or identifier not in old.identifiers:
+                self._identifiers.setdefault(identifier, {})[key] = None
+        for connection in entry.connections:
+            if old is None or connection not in old.connections:
+                self._connections.setdefault(connection, {})[key] = None
+        for config_entry_id in entry.config_entries:
+            if old is None or config_entry_id not in old.config_entries:
+                self._config_entry_ids.setdefault(config_entry_id, {})[key] = None
+        if entry.area_id is not None and (old is None or old.area_id != entry.area_id):
+            self._area_ids.setdefault(entry.area_id, {})[key] = None
+
+    def _unindex(
+        self, key: str, entry: DeviceEntry, new: Optional[DeviceEntry]
+    ) -> None:
+        """Remove the device from the indexes the new device is not in."""
+        for identifier in entry.identifiers:
+            if new is None or identifier not in new.identifiers:
+                _remove_from_index(self._identifiers, identifier, key)
+        for connection in entry.connections:
+            if new is None or connection not in new.connections:
+                _remove_from_index(self._connections, connection, key)
+        for config_entry_id in entry.config_entries:
+            if new is None or config_entry_id not in new.config_entries:
+                _remove_from_index(self._config_entry_ids, config_entry_id, key)
+        if entry.area_id is not None and (new is None or new.area_id != entry.area_id):
+            _remove_from_index(self._area_ids, entry.area_id, key)
+
+    def get_device_id(self, identifiers: set, connections: set) -> Optional[str]:
+        """Return the id of the first device with any of the identifiers or connections."""
+        device_ids: Set[str] = set()
+        for identifier in identifiers:
+            device_ids.update(self._identifiers.get(identifier, ()))
+        for connection in connections:
+            device_ids.update(self._connections.get(connection, ()))
+
+        if len(device_ids) < 2:
+            return next(iter(device_ids), None)
+
+        # Return the device that was registered first, like scanning does
+        key: str
+        for key in self.data:
+            if key in device_ids:
+                return key
+        return None
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> List[DeviceEntry]:
+        """Return the devices of a config entry."""
+        return [
+            self.data[key] for key in self._config_entry_ids.get(config_entry_id, ())
+        ]
+
+    def get_devices_for_area_id(self, area_id: str) -> List[DeviceEntry]:
+        """Return the devices in an area."""
+        return [self.data[key] for key in self._area_ids.get(area_id, ())]
+
+
+def _remove_from_index(index: Dict[Any, Dict[str, None]], value: Any, key: str) -> None:
+    """Remove a key from the keys indexed by value."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: Dict[str, DeviceEntry]
+    devices: DeviceRegistryItems
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True, min_write_interval=SAVE_DELAY
+        )
 
     @callback
     def async_get(self, device_id: str) -> Optional[DeviceEntry]:
@@ -87,12 +187,10 @@ class DeviceRegistry:
         self, identifiers: set, connections: set
     ) -> Optional[DeviceEntry]:
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        device_id = self.devices.get_device_id(identifiers, connections)
+        if device_id is None:
+            return None
+        return cast(DeviceEntry, self.devices[device_id])
 
     @callback
     def async_get_or_create(
@@ -273,7 +371,7 @@ class DeviceRegistry:
         """Load the device registry."""
         data = await self._store.async_load()
 
-        devices = OrderedDict()
+        devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
@@ -344,9 +442,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for device in async_entries_for_area(self, area_id):
+            self._async_update_device(device.id, area_id=None)
 
 
 @bind_hass
@@ -375,7 +472,7 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -383,8 +480,4 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
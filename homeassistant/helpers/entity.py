@@ -32,6 +32,7 @@ from homeassistant.helpers.entity_registry import (
     EVENT_ENTITY_REGISTRY_UPDATED,
     RegistryEntry,
 )
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
 from homeassistant.util.async_ import run_callback_threadsafe
 
@@ -119,6 +120,10 @@ class Entity(ABC):
     _context: Optional[Context] = None
     _context_set: Optional[datetime] = None
 
+    # Coalesced state writes
+    _coalesce_unsub: Optional[CALLBACK_TYPE] = None
+    _coalesce_pending = False
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -223,6 +228,16 @@ class Entity(ABC):
         """
         return False
 
+    @property
+    def coalesce_interval(self) -> Optional[float]:
+        """Return the number of seconds to coalesce state writes over.
+
+        State writes within this interval after a write are merged into a
+        single write of the latest state at the end of the interval.
+        Overridden by the entity registry.
+        """
+        return None
+
     @property
     def supported_features(self) -> Optional[int]:
         """Flag supported features."""
@@ -294,14 +309,17 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
-        self._async_write_ha_state()  # type: ignore
+        self._async_write_ha_state()
 
     @callback
-    def _async_write_ha_state(self):
+    def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        assert self.hass is not None
+
         if self.registry_entry and self.registry_entry.disabled_by:
             if not self._disabled_reported:
                 self._disabled_reported = True
+                assert self.platform is not None
                 _LOGGER.warning(
                     "Entity %s is incorrectly being triggered for updates while it is disabled. This is a bug in the %s integration.",
                     self.entity_id,
@@ -309,6 +327,22 @@ class Entity(ABC):
                 )
             return
 
+        entry = self.registry_entry
+        coalesce_interval: Optional[float]
+        if entry is not None and entry.coalesce_interval is not None:
+            coalesce_interval = entry.coalesce_interval
+        else:
+            coalesce_interval = self.coalesce_interval
+
+        if coalesce_interval:
+            if self._coalesce_unsub is not None:
+                self._coalesce_pending = True
+                return
+
+            self._coalesce_unsub = async_call_later(
+                self.hass, coalesce_interval, self._async_write_coalesced_ha_state
+            )
+
         start = timer()
 
         attr = self.capability_attributes
@@ -317,12 +351,12 @@ class Entity(ABC):
         if not self.available:
             state = STATE_UNAVAILABLE
         else:
-            state = self.state
+            value = self.state
 
-            if state is None:
+            if value is None:
                 state = STATE_UNKNOWN
             else:
-                state = str(state)
+                state = str(value)
 
             attr.update(self.state_attributes or {})
             attr.update(self.device_state_attributes or {})
@@ -331,7 +365,6 @@ class Entity(ABC):
         if unit_of_measurement is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        entry = self.registry_entry
         # pylint: disable=consider-using-ternary
         name = (entry and entry.name) or self.name
         if name is not None:
@@ -399,7 +432,7 @@ class Entity(ABC):
             pass
 
         if (
-            self._context is not None
+            self._context_set is not None
             and dt_util.utcnow() - self._context_set > self.context_recent_time
         ):
             self._context = None
@@ -409,6 +442,19 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_write_coalesced_ha_state(self, now: datetime) -> None:
+        """Write the latest state if writes were coalesced.
+
+        With force_update the merged writes still result in a state changed
+        event, even if the latest state equals the written one.
+        """
+        self._coalesce_unsub = None
+
+        if self._coalesce_pending:
+            self._coalesce_pending = False
+            self._async_write_ha_state()
+
     def schedule_update_ha_state(self, force_refresh=False):
         """Schedule an update ha state change task.
 
@@ -487,6 +533,11 @@ class Entity(ABC):
             while self._on_remove:
                 self._on_remove.pop()()
 
+        if self._coalesce_unsub is not None:
+            self._coalesce_unsub()
+            self._coalesce_unsub = None
+            self._coalesce_pending = False
+
         self.hass.states.async_remove(self.entity_id)
 
     async def async_added_to_hass(self) -> None:
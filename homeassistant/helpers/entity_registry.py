@@ -8,10 +8,10 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 import asyncio
-from collections import OrderedDict
+from collections import UserDict
 from itertools import chain
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import attr
 
@@ -79,6 +79,8 @@ class RegistryEntry:
     supported_features: int = attr.ib(default=0)
     device_class: Optional[str] = attr.ib(default=None)
     unit_of_measurement: Optional[str] = attr.ib(default=None)
+    # Seconds over which state writes are coalesced, None to use the default
+    coalesce_interval: Optional[float] = attr.ib(default=None)
     domain = attr.ib(type=str, init=False, repr=False)
 
     @domain.default
@@ -92,14 +94,104 @@ class RegistryEntry:
         return self.disabled_by is not None
 
 
+class EntityRegistryItems(UserDict):
+    """Container of the registry entries, keyed by entity id.
+
+    Keeps indexes of the entries by unique id, device id and config entry id
+    up to date as entries are added, replaced and removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        self._entity_ids: Dict[Tuple[str, str, str], str] = {}
+        # Entity ids of each device and config entry, in insertion order
+        self._device_ids: Dict[str, Dict[str, None]] = {}
+        self._config_entry_ids: Dict[str, Dict[str, None]] = {}
+        super().__init__()
+
+    def __setitem__(self, key: str, entry: RegistryEntry) -> None:
+        """Add or replace an entry."""
+        old = self.data.get(key)
+        if old is not None:
+            self._unindex(key, old, entry)
+        self.data[key] = entry
+        self._index(key, entry, old)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry."""
+        entry = self.data.pop(key)
+        self._unindex(key, entry, None)
+
+    def _index(
+        self, key: str, entry: RegistryEntry, old: Optional[RegistryEntry]
+    ) -> None:
+        """Add the entry to the indexes it was not in yet."""
+        self._entity_ids[(entry.domain, entry.platform, entry.unique_id)] = key
+
+        if entry.device_id is not None and (
+            old is None or old.device_id != entry.device_id
+        ):
+            self._device_ids.setdefault(entry.device_id, {})[key] = None
+
+        if entry.config_entry_id is not None and (
+            old is None or old.config_entry_id != entry.config_entry_id
+        ):
+            self._config_entry_ids.setdefault(entry.config_entry_id, {})[key] = None
+
+    def _unindex(
+        self, key: str, entry: RegistryEntry, new: Optional[RegistryEntry]
+    ) -> None:
+        """Remove the entry from the indexes the new entry is not in."""
+        if self._entity_ids.get((entry.domain, entry.platform, entry.unique_id)) == key:
+            del self._entity_ids[(entry.domain, entry.platform, entry.unique_id)]
+
+        if entry.device_id is not None and (
+            new is None or new.device_id != entry.device_id
+        ):
+            _remove_from_index(self._device_ids, entry.device_id, key)
+
+        if entry.config_entry_id is not None and (
+            new is None or new.config_entry_id != entry.config_entry_id
+        ):
+            _remove_from_index(self._config_entry_ids, entry.config_entry_id, key)
+
+    def get_entity_id(
+        self, domain: str, platform: str, unique_id: str
+    ) -> Optional[str]:
+        """Return the entity id of a unique id."""
+        return self._entity_ids.get((domain, platform, unique_id))
+
+    def get_entries_for_device_id(self, device_id: str) -> List[RegistryEntry]:
+        """Return the entries of a device."""
+        return [self.data[key] for key in self._device_ids.get(device_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> List[RegistryEntry]:
+        """Return the entries of a config entry."""
+        return [
+            self.data[key] for key in self._config_entry_ids.get(config_entry_id, ())
+        ]
+
+
+def _remove_from_index(index: Dict[str, Dict[str, None]], value: str, key: str) -> None:
+    """Remove a key from the keys indexed by value."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
     def __init__(self, hass: HomeAssistantType):
         """Initialize the registry."""
         self.hass = hass
-        self.entities: Dict[str, RegistryEntry]
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self.entities: EntityRegistryItems
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True, min_write_interval=SAVE_DELAY
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
         )
@@ -119,14 +211,7 @@ class EntityRegistry:
         self, domain: str, platform: str, unique_id: str
     ) -> Optional[str]:
         """Check if an entity_id is currently registered."""
-        for entity in self.entities.values():
-            if (
-                entity.domain == domain
-                and entity.platform == platform
-                and entity.unique_id == unique_id
-            ):
-                return entity.entity_id
-        return None
+        return self.entities.get_entity_id(domain, platform, unique_id)
 
     @callback
     def async_generate_entity_id(
@@ -257,6 +342,7 @@ class EntityRegistry:
         new_entity_id=_UNDEF,
         new_unique_id=_UNDEF,
         disabled_by=_UNDEF,
+        coalesce_interval=_UNDEF,
     ):
         """Update properties of an entity."""
         return cast(  # cast until we have _async_update_entity type hinted
@@ -267,6 +353,7 @@ class EntityRegistry:
                 new_entity_id=new_entity_id,
                 new_unique_id=new_unique_id,
                 disabled_by=disabled_by,
+                coalesce_interval=coalesce_interval,
             ),
         )
 
@@ -285,6 +372,7 @@ class EntityRegistry:
         supported_features=_UNDEF,
         device_class=_UNDEF,
         unit_of_measurement=_UNDEF,
+        coalesce_interval=_UNDEF,
     ):
         """Private facing update properties method."""
         old = self.entities[entity_id]
@@ -300,6 +388,7 @@ class EntityRegistry:
             ("supported_features", supported_features),
             ("device_class", device_class),
             ("unit_of_measurement", unit_of_measurement),
+            ("coalesce_interval", coalesce_interval),
         ):
             if value is not _UNDEF and value != getattr(old, attr_name):
                 changes[attr_name] = value
@@ -318,20 +407,13 @@ class EntityRegistry:
             entity_id = changes["entity_id"] = new_entity_id
 
         if new_unique_id is not _UNDEF:
-            conflict = next(
-                (
-                    entity
-                    for entity in self.entities.values()
-                    if entity.unique_id == new_unique_id
-                    and entity.domain == old.domain
-                    and entity.platform == old.platform
-                ),
-                None,
+            conflict_entity_id = self.async_get_entity_id(
+                old.domain, old.platform, new_unique_id
             )
-            if conflict:
+            if conflict_entity_id:
                 raise ValueError(
                     f"Unique id '{new_unique_id}' is already in use by "
-                    f"'{conflict.entity_id}'"
+                    f"'{conflict_entity_id}'"
                 )
             changes["unique_id"] = new_unique_id
 
@@ -361,7 +443,7 @@ class EntityRegistry:
             old_conf_load_func=load_yaml,
             old_conf_migrate_func=_async_migrate,
         )
-        entities: Dict[str, RegistryEntry] = OrderedDict()
+        entities = EntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -377,6 +459,7 @@ class EntityRegistry:
                     supported_features=entity.get("supported_features", 0),
                     device_class=entity.get("device_class"),
                     unit_of_measurement=entity.get("unit_of_measurement"),
+                    coalesce_interval=entity.get("coalesce_interval"),
                 )
 
         self.entities = entities
@@ -404,6 +487,7 @@ class EntityRegistry:
                 "supported_features": entry.supported_features,
                 "device_class": entry.device_class,
                 "unit_of_measurement": entry.unit_of_measurement,
+                "coalesce_interval": entry.coalesce_interval,
             }
             for entry in self.entities.values()
         ]
@@ -449,9 +533,7 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
-    ]
+    return registry.entities.get_entries_for_device_id(device_id)
 
 
 @callback
@@ -459,11 +541,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
@@ -1,7 +1,20 @@
 """Helpers for listening to events."""
 from datetime import datetime, timedelta
 import functools as ft
-from typing import Any, Callable, Dict, Iterable, Optional, Union, cast
+import heapq
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import attr
 
@@ -15,12 +28,17 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.sun import get_astral_event_next
 from homeassistant.helpers.template import Template
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
+DATA_TIME_SCHEDULER = "time_scheduler"
+
+_LOGGER = logging.getLogger(__name__)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -79,14 +97,8 @@ def async_track_state_change(
         entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
 
     @callback
-    def state_change_listener(event: Event) -> None:
-        """Handle specific state changes."""
-        if (
-            entity_ids != MATCH_ALL
-            and cast(str, event.data.get("entity_id")) not in entity_ids
-        ):
-            return
-
+    def state_change_filter(event: Event) -> bool:
+        """Return if the state change matches from and to state."""
         old_state = event.data.get("old_state")
         if old_state is not None:
             old_state = old_state.state
@@ -95,15 +107,28 @@ def async_track_state_change(
         if new_state is not None:
             new_state = new_state.state
 
-        if match_from_state(old_state) and match_to_state(new_state):
-            hass.async_run_job(
-                action,
-                event.data.get("entity_id"),
-                event.data.get("old_state"),
-                event.data.get("new_state"),
-            )
+        return match_from_state(old_state) and match_to_state(new_state)
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    @callback
+    def state_change_listener(event: Event) -> None:
+        """Handle specific state changes."""
+        hass.async_run_job(
+            action,
+            event.data.get("entity_id"),
+            event.data.get("old_state"),
+            event.data.get("new_state"),
+        )
+
+    if entity_ids == MATCH_ALL:
+        return hass.bus.async_listen(
+            EVENT_STATE_CHANGED, state_change_listener, state_change_filter
+        )
+
+    # Only get called for the entities we track instead of filtering
+    # every state change in the system.
+    return hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, entity_ids, state_change_listener, state_change_filter
+    )
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
@@ -117,28 +142,108 @@ def async_track_template(
     action: Callable[[str, State, State], None],
     variables: Optional[Dict[str, Any]] = None,
 ) -> CALLBACK_TYPE:
-    """Add a listener that track state changes with template condition."""
-    from . import condition
+    """Add a listener that track state changes with template condition.
 
+    The template is only re-rendered for state changes of the entities it
+    read during its last render, or for entities that are added or removed
+    in the domains it iterated over.
+    """
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
+    removed = False
+
+    info = template.async_render_to_info(variables)
+    # Entities and domains the listener is subscribed to, None for all states
+    subscribed_keys: Optional[FrozenSet[str]]
+    unsub: CALLBACK_TYPE
+
+    @callback
+    def state_change_filter(event: Event) -> bool:
+        """Only re-render for state changes that affect the template."""
+        entity_id = event.data["entity_id"]
+
+        if info.filter(entity_id):
+            return True
+
+        # Entities that are added or removed change the iterated domains
+        return (
+            event.data.get("old_state") is None or event.data.get("new_state") is None
+        ) and info.filter_lifecycle(entity_id)
+
+    def subscription_keys() -> Optional[FrozenSet[str]]:
+        """Return the entities and domains the last render depends on.
+
+        None means the template depends on all states.
+        """
+        if info.exception is not None:
+            # The failed render may not have read all states it depends on
+            return frozenset()
+        if info.all_states:
+            return None
+        return frozenset(info.entities).union(info.domains)
+
+    @callback
+    def async_subscribe(keys: Optional[FrozenSet[str]]) -> CALLBACK_TYPE:
+        """Subscribe to the state changes of keys."""
+        # A template without markup never changes, it needs no state changes
+        if keys or (keys is not None and template.is_static):
+            return hass.bus.async_listen_keyed(
+                EVENT_STATE_CHANGED,
+                keys,
+                template_condition_listener,
+                state_change_filter,
+            )
+        if keys is None:
+            return hass.bus.async_listen(
+                EVENT_STATE_CHANGED, template_condition_listener, state_change_filter
+            )
+        # Like before render info was used, a template that does not
+        # depend on states is re-rendered for every state change
+        return hass.bus.async_listen(EVENT_STATE_CHANGED, template_condition_listener)
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def template_condition_listener(event: Event) -> None:
         """Check if condition is correct and run action."""
-        nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+        nonlocal already_triggered, info, subscribed_keys, unsub
+
+        info = template.async_render_to_info(variables)
+        keys = subscription_keys()
+
+        # The listener may have been scheduled before it was removed
+        if not removed and keys != subscribed_keys:
+            unsub()
+            subscribed_keys = keys
+            unsub = async_subscribe(keys)
+
+        try:
+            template_result = info.result.lower() == "true"
+        except TemplateError as ex:
+            _LOGGER.error("Error during template condition: %s", ex)
+            template_result = False
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data["entity_id"],
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
-    )
+    subscribed_keys = subscription_keys()
+    unsub = async_subscribe(subscribed_keys)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the state change listener."""
+        nonlocal removed
+        removed = True
+        unsub()
+
+    return remove_listener
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -231,27 +336,9 @@ def async_track_point_in_utc_time(
     # Ensure point_in_time is UTC
     point_in_time = dt_util.as_utc(point_in_time)
 
-    @callback
-    def point_in_time_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        now = event.data[ATTR_NOW]
-
-        if now < point_in_time or hasattr(point_in_time_listener, "run"):
-            return
-
-        # Set variable so that we will never run twice.
-        # Because the event bus might have to wait till a thread comes
-        # available to execute this listener it might occur that the
-        # listener gets lined up twice to be executed. This will make
-        # sure the second time it does nothing.
-        setattr(point_in_time_listener, "run", True)
-        async_unsub()
-
-        hass.async_run_job(action, now)
-
-    async_unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, point_in_time_listener)
-
-    return async_unsub
+    return _async_get_time_scheduler(hass).async_add(
+        _TimeListener(action, point_in_time=point_in_time)
+    )
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -416,42 +503,13 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
-
-    def calculate_next(now: datetime) -> None:
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
-
-        localized_now = dt_util.as_local(now) if local else now
-        next_time = dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
+    return _async_get_time_scheduler(hass).async_add(
+        _TimeListener(
+            action,
+            matching=(matching_seconds, matching_minutes, matching_hours),
+            local=local,
         )
-
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now: Optional[datetime] = None
-
-    @callback
-    def pattern_time_change_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
-
-        now = event.data[ATTR_NOW]
-
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
-
-        last_now = now
-
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
-
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+    )
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -473,6 +531,144 @@ def async_track_time_change(
 track_time_change = threaded_listener_factory(async_track_time_change)
 
 
+@attr.s(slots=True)
+class _TimeListener:
+    """Listener for a point in time or a time pattern."""
+
+    action: Callable[..., Any] = attr.ib()
+    point_in_time: Optional[datetime] = attr.ib(default=None)
+    matching: Optional[Tuple[List[int], List[int], List[int]]] = attr.ib(default=None)
+    local: bool = attr.ib(default=False)
+    removed: bool = attr.ib(default=False)
+
+    def next_time(self, now: datetime) -> datetime:
+        """Return the next time the listener is due, starting at now."""
+        if self.matching is None:
+            return cast(datetime, self.point_in_time)
+
+        localized_now = dt_util.as_local(now) if self.local else now
+        return dt_util.find_next_time_expression_time(localized_now, *self.matching)
+
+
+class _TimeScheduler:
+    """Call time listeners once they are due.
+
+    The listeners are kept in a heap ordered by the next time they are due,
+    so a time changed event only has to look at the listeners that are due
+    instead of calling each of them to compare the time.
+
+    The next time of a time pattern is calculated on the first time changed
+    event after it is added and again if the time rolls back.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: List[Tuple[datetime, int, _TimeListener]] = []
+        # Listeners added since the last time changed event
+        self._pending: List[_TimeListener] = []
+        self._count = 0
+        self._seq = 0
+        self._last_now: Optional[datetime] = None
+        self._unsub: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_add(self, listener: _TimeListener) -> CALLBACK_TYPE:
+        """Add a time listener."""
+        self._pending.append(listener)
+        self._count += 1
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_time_changed
+            )
+
+        @callback
+        def async_remove() -> None:
+            """Remove the time listener."""
+            if not listener.removed:
+                self._async_remove(listener)
+
+        return async_remove
+
+    @callback
+    def _async_remove(self, listener: _TimeListener) -> None:
+        """Remove a listener, it is dropped from the heap once it is due."""
+        listener.removed = True
+        self._count -= 1
+
+        if self._count == 0 and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._heap.clear()
+            self._pending.clear()
+            self._last_now = None
+
+        elif len(self._heap) > 2 * self._count:
+            # Removed listeners that are due far in the future outnumber the
+            # live ones, drop them instead of waiting until they are due
+            self._heap = [entry for entry in self._heap if not entry[2].removed]
+            heapq.heapify(self._heap)
+
+    @callback
+    def _async_push(self, listener: _TimeListener, now: datetime) -> None:
+        """Schedule the next time a listener is due."""
+        self._seq += 1
+        heapq.heappush(self._heap, (listener.next_time(now), self._seq, listener))
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Call the listeners that are due."""
+        now = event.data[ATTR_NOW]
+
+        if self._last_now is not None and now < self._last_now:
+            # Time rolled back, reschedule the time patterns
+            heap = self._heap
+            self._heap = []
+            for _, _, listener in heap:
+                if not listener.removed:
+                    self._async_push(listener, now)
+
+        self._last_now = now
+
+        # Listeners added while calling the listeners are due from the next
+        # time changed event, like listeners added to the event bus
+        pending = self._pending
+        self._pending = []
+        for listener in pending:
+            if not listener.removed:
+                self._async_push(listener, now)
+
+        while self._heap and self._heap[0][0] <= now:
+            listener = heapq.heappop(self._heap)[2]
+
+            if listener.removed:
+                continue
+
+            if listener.matching is None:
+                self._async_remove(listener)
+                args = now
+            else:
+                self._async_push(listener, now + timedelta(seconds=1))
+                args = dt_util.as_local(now) if listener.local else now
+
+            try:
+                self.hass.async_run_job(listener.action, args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running time listener %s", listener.action)
+
+
+@callback
+def _async_get_time_scheduler(hass: HomeAssistant) -> _TimeScheduler:
+    """Return the time scheduler of a Home Assistant instance."""
+    scheduler: Optional[_TimeScheduler] = hass.data.get(DATA_TIME_SCHEDULER)
+
+    if scheduler is None:
+        scheduler = hass.data[DATA_TIME_SCHEDULER] = _TimeScheduler(hass)
+
+    return scheduler
+
+
 def _process_state_match(
     parameter: Union[None, str, Iterable[str]]
 ) -> Callable[[str], bool]:
@@ -2,7 +2,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import (
@@ -30,12 +30,23 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
+# States that changed since the states were last written to STORAGE_KEY
+JOURNAL_STORAGE_KEY = "core.restore_state_journal"
+
+# Write all states again instead of the journal once the journal holds more
+# than this share of the states
+JOURNAL_MAX_RATIO = 0.5
+
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long unchanged states are kept on disk before all states are written
+# again to refresh when they were last seen
+STATE_REFRESH_INTERVAL = timedelta(days=1)
+
 
 class StoredState:
     """Object to represent a stored state."""
@@ -76,19 +87,20 @@ class RestoreStateData:
 
                 try:
                     stored_states = await data.store.async_load()
+                    journal = await data.journal.async_load()
                 except HomeAssistantError as exc:
                     _LOGGER.error("Error loading last states", exc_info=exc)
-                    stored_states = None
+                    stored_states = journal = None
 
                 if stored_states is None:
                     _LOGGER.debug("Not creating cache - no saved states found")
                     data.last_states = {}
                 else:
-                    data.last_states = {
-                        item["state"]["entity_id"]: StoredState.from_dict(item)
-                        for item in stored_states
-                        if valid_entity_id(item["state"]["entity_id"])
-                    }
+                    data.last_states = _load_stored_states(stored_states, journal)
+                    # Cleared once all states are written again
+                    data.journal_written = isinstance(journal, dict) and bool(
+                        journal["states"] or journal["removed"]
+                    )
                     _LOGGER.debug("Created cache with %s", list(data.last_states))
 
                 if hass.state == CoreState.running:
@@ -110,10 +122,24 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
+        )
+        self.journal: Store = Store(
+            hass,
+            STORAGE_VERSION,
+            JOURNAL_STORAGE_KEY,
+            encoder=JSONEncoder,
+            compact=True,
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # The states on disk and when all states were last written
+        self._dumped_states: Dict[str, State] = {}
+        self._last_full_dump: Optional[datetime] = None
+        # The changes in the journal, stored states and removal times
+        self._journal_states: Dict[str, Dict] = {}
+        self._journal_removed: Dict[str, datetime] = {}
+        self.journal_written = False
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -158,17 +184,93 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states that changed since all states were last written are
+        saved, in a journal. All states are written again once the journal
+        grows too large or when their last seen time needs to be refreshed.
+        """
+        stored_states = self.async_get_stored_states()
+        now = dt_util.utcnow()
+
+        if (
+            self._last_full_dump is None
+            or now - self._last_full_dump >= STATE_REFRESH_INTERVAL
+        ):
+            await self._async_dump_all_states(stored_states, now)
+            return
+
+        dumped_states = self._dumped_states
+        changed = [
+            stored_state
+            for stored_state in stored_states
+            if dumped_states.get(stored_state.state.entity_id) is not stored_state.state
+        ]
+        entity_ids = {stored_state.state.entity_id for stored_state in stored_states}
+        removed = [
+            entity_id for entity_id in dumped_states if entity_id not in entity_ids
+        ]
+
+        if not changed and not removed:
+            _LOGGER.debug("Not dumping states, no states changed")
+            return
+
+        journal_states = dict(self._journal_states)
+        journal_removed = dict(self._journal_removed)
+        for stored_state in changed:
+            entity_id = stored_state.state.entity_id
+            journal_states[entity_id] = stored_state.as_dict()
+            journal_removed.pop(entity_id, None)
+        for entity_id in removed:
+            journal_states.pop(entity_id, None)
+            journal_removed[entity_id] = now
+
+        if len(journal_states) + len(journal_removed) > JOURNAL_MAX_RATIO * len(
+            stored_states
+        ):
+            await self._async_dump_all_states(stored_states, now)
+            return
+
+        _LOGGER.debug("Dumping %d changed states", len(changed) + len(removed))
+        try:
+            await self.journal.async_save(
+                {"states": list(journal_states.values()), "removed": journal_removed}
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            return
+
+        self._journal_states = journal_states
+        self._journal_removed = journal_removed
+        self.journal_written = True
+        for stored_state in changed:
+            dumped_states[stored_state.state.entity_id] = stored_state.state
+        for entity_id in removed:
+            del dumped_states[entity_id]
+
+    async def _async_dump_all_states(
+        self, stored_states: List[StoredState], now: datetime
+    ) -> None:
+        """Save all stored states and clear the journal."""
         _LOGGER.debug("Dumping states")
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
+            if self.journal_written:
+                await self.journal.async_save({"states": [], "removed": {}})
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped_states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._last_full_dump = now
+        self._journal_states = {}
+        self._journal_removed = {}
+        self.journal_written = False
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -210,6 +312,40 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _load_stored_states(
+    stored_states: Union[Dict, List], journal: Union[Dict, List, None]
+) -> Dict[str, StoredState]:
+    """Return the stored states with the changes of the journal applied.
+
+    A change only applies if it is more recent than the stored state, the
+    journal may predate the stored states if writing it failed.
+    """
+    last_states = {
+        item["state"]["entity_id"]: StoredState.from_dict(item)
+        for item in stored_states
+        if valid_entity_id(item["state"]["entity_id"])
+    }
+
+    if isinstance(journal, dict):
+        for item in journal["states"]:
+            entity_id = item["state"]["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = StoredState.from_dict(item)
+            current = last_states.get(entity_id)
+            if current is None or current.last_seen <= stored_state.last_seen:
+                last_states[entity_id] = stored_state
+
+        for entity_id, removed in journal["removed"].items():
+            if isinstance(removed, str):
+                removed = dt_util.parse_datetime(removed)
+            current = last_states.get(entity_id)
+            if current is not None and current.last_seen <= removed:
+                del last_states[entity_id]
+
+    return last_states
+
+
 def _encode(value):
     """Little helper to JSON encode a value."""
     try:
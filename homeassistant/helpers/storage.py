@@ -3,6 +3,7 @@ import asyncio
 from json import JSONEncoder
 import logging
 import os
+from timeit import default_timer as timer
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -54,7 +55,12 @@ async def async_migrator(
 
 @bind_hass
 class Store:
-    """Class to help storing data."""
+    """Class to help storing data.
+
+    With compact the data is written without indentation. With a minimum
+    write interval, delayed saves are merged into the pending write instead
+    of postponing it, and writes are at least that many seconds apart.
+    """
 
     def __init__(
         self,
@@ -64,6 +70,8 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
+        min_write_interval: float = 0,
     ):
         """Initialize storage class."""
         self.version = version
@@ -76,6 +84,13 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._compact = compact
+        self._min_write_interval = min_write_interval
+        self._last_write: Optional[float] = None
+        # Metrics of the last write to disk
+        self.last_write_size: Optional[int] = None
+        self.last_serialize_duration: Optional[float] = None
+        self.last_write_duration: Optional[float] = None
 
     @property
     def path(self):
@@ -140,6 +155,17 @@ class Store:
         """Save data with an optional delay."""
         self._data = {"version": self.version, "key": self.key, "data_func": data_func}
 
+        if self._min_write_interval:
+            if self._unsub_delay_listener is not None:
+                # The pending write will pick up the new data
+                return
+
+            if self._last_write is not None:
+                delay = max(
+                    delay,
+                    self._last_write + self._min_write_interval - self.hass.loop.time(),
+                )
+
         self._async_cleanup_delay_listener()
 
         self._unsub_delay_listener = async_call_later(
@@ -190,6 +216,7 @@ class Store:
             data["data"] = data.pop("data_func")()
 
         self._data = None
+        self._last_write = self.hass.loop.time()
 
         async with self._write_lock:
             try:
@@ -205,7 +232,23 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        start = timer()
+        json_data = json_util.dump_json(
+            data, encoder=self._encoder, compact=self._compact
+        )
+        serialized = timer()
+        json_util.write_json_data(path, json_data, self._private)
+
+        self.last_write_size = len(json_data)
+        self.last_serialize_duration = serialized - start
+        self.last_write_duration = timer() - serialized
+        _LOGGER.debug(
+            "Wrote %d bytes for %s, serialized in %.3fs and written in %.3fs",
+            self.last_write_size,
+            self.key,
+            self.last_serialize_duration,
+            self.last_write_duration,
+        )
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -1,16 +1,27 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import base64
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 import json
 import logging
+import marshal
 import math
+import os
 import random
 import re
-from typing import Any, Dict, Iterable, List, Optional, Union
+import sys
+import tempfile
+import threading
+from types import CodeType
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
 import jinja2
-from jinja2 import contextfilter, contextfunction
+from jinja2 import (  # type: ignore
+    __version__ as jinja2_version,
+    contextfilter,
+    contextfunction,
+)
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace  # type: ignore
 
@@ -19,10 +30,12 @@ from homeassistant.const import (
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
     STATE_UNKNOWN,
 )
-from homeassistant.core import State, callback, split_entity_id, valid_entity_id
+from homeassistant.core import Event, State, callback, split_entity_id, valid_entity_id
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import location as loc_helper
 from homeassistant.helpers.typing import HomeAssistantType, TemplateVarsType
@@ -39,6 +52,14 @@ DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+# Bytecode is only valid for the Python and Jinja versions that compiled it
+BYTECODE_CACHE_FILE = (
+    f"core.template_bytecode.py{sys.version_info[0]}{sys.version_info[1]}"
+    f"-jinja{jinja2_version}"
+)
+COMPILED_CACHE_SIZE = 4096
 
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
@@ -47,6 +68,7 @@ _RE_GET_ENTITIES = re.compile(
     re.I | re.M,
 )
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{")
+_RE_JINJA_MARKUP = re.compile(r"\{%|\{\{|\{#")
 
 
 @bind_hass
@@ -146,13 +168,33 @@ class RenderInfo:
             raise self._exception
         return self._result
 
+    @property
+    def exception(self) -> Optional[TemplateError]:
+        """Exception raised by the template computation, if any."""
+        return self._exception
+
+    @property
+    def all_states(self) -> bool:
+        """Return if the template iterated over all states."""
+        return self._all_states
+
+    @property
+    def entities(self) -> Iterable[str]:
+        """Entities whose state the template read."""
+        return self._entities
+
+    @property
+    def domains(self) -> Iterable[str]:
+        """Domains whose states the template iterated over."""
+        return self._domains
+
     def _freeze(self) -> None:
         self._entities = frozenset(self._entities)
         if self._all_states:
             # Leave lifecycle_filter as True
-            del self._domains
+            self._domains = frozenset()
         elif not self._domains:
-            del self._domains
+            self._domains = frozenset()
             self.filter_lifecycle = self.filter
         else:
             self._domains = frozenset(self._domains)
@@ -168,6 +210,8 @@ class Template:
             raise TypeError("Expected template to be a string")
 
         self.template: str = template
+        # Templates without Jinja markup render to themselves
+        self.is_static = _RE_JINJA_MARKUP.search(template) is None
         self._compiled_code = None
         self._compiled = None
         self.hass = hass
@@ -183,11 +227,11 @@ class Template:
 
     def ensure_valid(self):
         """Return if template is valid."""
-        if self._compiled_code is not None:
+        if self.is_static or self._compiled_code is not None:
             return
 
         try:
-            self._compiled_code = self._env.compile(self.template)
+            self._compiled_code = self._env.compile_cached(self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
@@ -199,6 +243,9 @@ class Template:
 
     def render(self, variables: TemplateVarsType = None, **kwargs: Any) -> str:
         """Render given template."""
+        if self.is_static:
+            return self.template.strip()
+
         if variables is not None:
             kwargs.update(variables)
 
@@ -212,6 +259,9 @@ class Template:
 
         This method must be run in the event loop.
         """
+        if self.is_static:
+            return self.template.strip()
+
         compiled = self._compiled or self._ensure_compiled()
 
         if variables is not None:
@@ -261,6 +311,9 @@ class Template:
 
         This method must be run in the event loop.
         """
+        if self.is_static:
+            return self.template.strip()
+
         if self._compiled is None:
             self._ensure_compiled()
 
@@ -315,6 +368,135 @@ class Template:
         return 'Template("' + self.template + '")'
 
 
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """Bytecode cache that is kept in memory and persisted to a single file.
+
+    Only the bytecode of templates compiled since the file was loaded is
+    saved, so templates removed from the configuration are dropped.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the bytecode cache."""
+        self.path = path
+        self._bytecode: Dict[str, bytes] = {}
+        self._used: Set[str] = set()
+        self._dirty = False
+        # Templates are compiled in the event loop and in executor threads
+        self._lock = threading.Lock()
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode of a bucket from memory."""
+        with self._lock:
+            bytecode = self._bytecode.get(bucket.key)
+            if bytecode is None:
+                return
+            self._used.add(bucket.key)
+        bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Store the bytecode of a bucket in memory."""
+        bytecode = bucket.bytecode_to_string()
+        with self._lock:
+            self._bytecode[bucket.key] = bytecode
+            self._used.add(bucket.key)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._bytecode.clear()
+            self._used.clear()
+            self._dirty = True
+
+    def load(self) -> None:
+        """Load the cache file.
+
+        This method is blocking and should be run in the executor.
+        """
+        try:
+            with open(self.path, "rb") as fdesc:
+                bytecode = marshal.load(fdesc)
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.warning("Unable to load template cache %s: %s", self.path, err)
+            return
+        except (EOFError, ValueError, TypeError) as err:
+            _LOGGER.warning("Removing corrupt template cache %s: %s", self.path, err)
+            self._remove()
+            return
+
+        if not isinstance(bytecode, dict):
+            _LOGGER.warning("Removing corrupt template cache %s", self.path)
+            self._remove()
+            return
+
+        with self._lock:
+            self._bytecode = bytecode
+
+    def _remove(self) -> None:
+        """Remove the cache file."""
+        try:
+            os.remove(self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to remove template cache %s: %s", self.path, err)
+
+    def save(self) -> None:
+        """Save the bytecode of the used templates to the cache file.
+
+        This method is blocking and should be run in the executor.
+        """
+        with self._lock:
+            if not self._dirty and len(self._used) == len(self._bytecode):
+                return
+            bytecode = {key: self._bytecode[key] for key in self._used}
+            self._dirty = False
+
+        tmp_filename = ""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(self.path), delete=False
+            ) as fdesc:
+                tmp_filename = fdesc.name
+                marshal.dump(bytecode, fdesc)
+            os.replace(tmp_filename, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to save template cache %s: %s", self.path, err)
+            with self._lock:
+                self._dirty = True
+        finally:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistantType) -> None:
+    """Load the persistent bytecode cache of compiled templates.
+
+    The cache is saved once Home Assistant has started and when it stops.
+    """
+    # Storage imports the event helpers, which import this module
+    from homeassistant.helpers.storage import STORAGE_DIR
+
+    bytecode_cache = TemplateBytecodeCache(
+        hass.config.path(STORAGE_DIR, BYTECODE_CACHE_FILE)
+    )
+    await hass.async_add_executor_job(bytecode_cache.load)
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    # Compile the templates again so they are saved in the cache
+    env = hass.data.get(_ENVIRONMENT)
+    if env is not None:
+        env.clear_compiled_cache()
+
+    async def async_save(_: Event) -> None:
+        """Save the bytecode cache."""
+        await hass.async_add_executor_job(bytecode_cache.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_save)
+
+
 class AllStates:
     """Class to expose all HA states as attributes."""
 
@@ -919,6 +1101,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
+        # Compiled code by template source, shared by all templates
+        self._compiled_cache: "OrderedDict[str, CodeType]" = OrderedDict()
+        self._compiled_cache_lock = threading.Lock()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -994,6 +1179,39 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["state_attr"] = hassfunction(state_attr)
         self.globals["states"] = AllStates(hass)
 
+    def compile_cached(self, source: str) -> CodeType:
+        """Compile a template source once for all templates using it."""
+        with self._compiled_cache_lock:
+            code = self._compiled_cache.get(source)
+            if code is not None:
+                self._compiled_cache.move_to_end(source)
+                return code
+
+        bytecode_cache = None
+        if self.hass is not None:
+            bytecode_cache = self.hass.data.get(_BYTECODE_CACHE)
+
+        if bytecode_cache is None:
+            code = self.compile(source)
+        else:
+            bucket = bytecode_cache.get_bucket(self, source, None, source)
+            if bucket.code is None:
+                bucket.code = self.compile(source)
+                bytecode_cache.set_bucket(bucket)
+            code = bucket.code
+
+        with self._compiled_cache_lock:
+            self._compiled_cache[source] = code
+            if len(self._compiled_cache) > COMPILED_CACHE_SIZE:
+                self._compiled_cache.popitem(last=False)
+
+        return code
+
+    def clear_compiled_cache(self) -> None:
+        """Clear the compiled code of the templates."""
+        with self._compiled_cache_lock:
+            self._compiled_cache.clear()
+
     def is_safe_callable(self, obj):
         """Test if callback is safe."""
         return isinstance(obj, AllStates) or super().is_safe_callable(obj)
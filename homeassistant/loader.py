@@ -39,6 +39,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_CUSTOM_COMPONENTS_STORE = "custom_components_store"
+STORAGE_KEY_CUSTOM_COMPONENTS = "core.custom_components"
+STORAGE_VERSION_CUSTOM_COMPONENTS = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 LOOKUP_PATHS = [PACKAGE_CUSTOM_COMPONENTS, PACKAGE_BUILTIN]
@@ -63,42 +66,94 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     }
 
 
+def _get_custom_manifests(paths: List[str], cached: Dict[str, Dict]) -> Dict:
+    """Return the manifests of the custom integrations in a set of paths.
+
+    The result maps the manifest paths to their modification time and content.
+    Manifests that were not modified since they were cached are not read.
+    """
+    manifests: Dict[str, Dict] = {}
+    seen: Set[str] = set()
+
+    for path in paths:
+        for entry in pathlib.Path(path).iterdir():
+            # Integrations in earlier paths take precedence
+            if entry.name in seen:
+                continue
+
+            manifest_path = entry / "manifest.json"
+
+            try:
+                mtime = manifest_path.stat().st_mtime
+            except OSError:
+                continue
+
+            key = str(manifest_path)
+            cached_manifest = cached.get(key)
+
+            if cached_manifest is None or cached_manifest["mtime"] != mtime:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+                cached_manifest = {"mtime": mtime, "manifest": manifest}
+
+            manifests[key] = cached_manifest
+            seen.add(entry.name)
+
+    return manifests
+
+
 async def _async_get_custom_components(
     hass: "HomeAssistant",
 ) -> Dict[str, "Integration"]:
-    """Return list of custom integrations."""
+    """Return list of custom integrations.
+
+    The manifests are cached in storage, only the manifests that were
+    modified since the last run are read. The store can be replaced by
+    setting hass.data[DATA_CUSTOM_COMPONENTS_STORE].
+    """
     try:
         import custom_components
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List) -> List:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    from homeassistant.exceptions import HomeAssistantError
+    from homeassistant.helpers.storage import Store
+
+    store = hass.data.get(DATA_CUSTOM_COMPONENTS_STORE)
+    if store is None:
+        store = Store(
+            hass, STORAGE_VERSION_CUSTOM_COMPONENTS, STORAGE_KEY_CUSTOM_COMPONENTS
+        )
+
+    try:
+        cached = await store.async_load() or {}
+    except HomeAssistantError as err:
+        _LOGGER.error("Error loading cached custom integrations: %s", err)
+        cached = {}
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    manifests = await hass.async_add_executor_job(
+        _get_custom_manifests, list(custom_components.__path__), cached
     )
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
+    if manifests != cached:
+        hass.async_create_task(store.async_save(manifests))
+
+    integrations = (
+        Integration(
+            hass,
+            f"{custom_components.__name__}.{pathlib.Path(path).parent.name}",
+            pathlib.Path(path).parent,
+            cached_manifest["manifest"],
         )
+        for path, cached_manifest in manifests.items()
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    return {integration.domain: integration for integration in integrations}
 
 
 async def async_get_custom_components(
@@ -145,6 +200,28 @@ async def async_get_config_flows(hass: "HomeAssistant") -> Set[str]:
 class Integration:
     """An integration in Home Assistant."""
 
+    @classmethod
+    def resolve_from_index(
+        cls, hass: "HomeAssistant", domain: str
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index.
+
+        Does not do any I/O.
+        """
+        from homeassistant.generated.manifests import MANIFESTS
+
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        return cls(
+            hass,
+            f"{PACKAGE_BUILTIN}.{domain}",
+            pathlib.Path(__file__).parent / "components" / domain,
+            dict(manifest),
+        )
+
     @classmethod
     def resolve_from_root(
         cls, hass: "HomeAssistant", root_module: ModuleType, domain: str
@@ -317,9 +394,13 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    integration = Integration.resolve_from_index(hass, domain)
+
+    if integration is None:
+        # Integrations that were added after the index was generated
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
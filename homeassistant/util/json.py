@@ -1,15 +1,35 @@
 """JSON utility functions."""
+from datetime import datetime
 import json
 import logging
 import os
 import tempfile
-from typing import Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 from homeassistant.exceptions import HomeAssistantError
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    # pylint: disable=method-hidden
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+
+        return json.JSONEncoder.default(self, o)
+
+
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
 
@@ -46,15 +66,42 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
 ) -> None:
-    """Save JSON data to a file.
+    """Save JSON data to a file."""
+    try:
+        json_data = dump_json(data, encoder=encoder, compact=compact)
+    except SerializationError:
+        _LOGGER.exception("Failed to serialize to JSON: %s", filename)
+        raise
+
+    write_json_data(filename, json_data, private)
+
 
-    Returns True on success.
+def dump_json(
+    data: Union[List, Dict],
+    *,
+    encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
+) -> str:
+    """Serialize data to JSON, without indentation and whitespace if compact."""
+    try:
+        if compact:
+            return json.dumps(data, separators=(",", ":"), cls=encoder)
+        return json.dumps(data, sort_keys=True, indent=4, cls=encoder)
+    except TypeError as error:
+        raise SerializationError(error)
+
+
+def write_json_data(filename: str, json_data: str, private: bool = False) -> None:
+    """Write serialized JSON data to a file.
+
+    The data is written to a temporary file that replaces the file, so the
+    file is never left partially written.
     """
     tmp_filename = ""
     tmp_path = os.path.split(filename)[0]
     try:
-        json_data = json.dumps(data, sort_keys=True, indent=4, cls=encoder)
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", dir=tmp_path, delete=False
@@ -64,9 +111,6 @@ def save_json(
         if not private:
             os.chmod(tmp_filename, 0o644)
         os.replace(tmp_filename, filename)
-    except TypeError as error:
-        _LOGGER.exception("Failed to serialize to JSON: %s", filename)
-        raise SerializationError(error)
     except OSError as error:
         _LOGGER.exception("Saving JSON file failed: %s", filename)
         raise WriteError(error)
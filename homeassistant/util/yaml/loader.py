@@ -1,10 +1,25 @@
 """Custom loader."""
 from collections import OrderedDict
 import fnmatch
+import hashlib
+import io
 import logging
 import os
+import pickle
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
@@ -31,6 +46,11 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
+# Content hashes of the secret files in the secret cache
+_SECRET_DIGESTS: Dict[str, Optional[str]] = {}
+
+# Dependency key marking that a parsed file can not be cached
+_UNCACHEABLE = ("uncacheable",)
 
 
 def clear_secret_cache() -> None:
@@ -39,6 +59,26 @@ def clear_secret_cache() -> None:
     Async friendly.
     """
     __SECRET_CACHE.clear()
+    _SECRET_DIGESTS.clear()
+
+
+class _TrackingState(threading.local):
+    """Cache and dependencies of the YAML files being loaded by a thread."""
+
+    def __init__(self) -> None:
+        """Initialize the tracking state."""
+        super().__init__()
+        self.cache: Optional["YamlCache"] = None
+        self.dependencies: List[Dict[Tuple, Any]] = []
+
+
+_TRACKING = _TrackingState()
+
+
+def _track_dependency(key: Tuple, value: Any) -> None:
+    """Record something the YAML file being cached depends on."""
+    if _TRACKING.dependencies:
+        _TRACKING.dependencies[-1][key] = value
 
 
 # pylint: disable=too-many-ancestors
@@ -53,21 +93,162 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
-def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+_LOADER: Type = SafeLineLoader
+
+if hasattr(yaml, "CSafeLoader"):
+
+    class FastSafeLineLoader(yaml.CSafeLoader):
+        """Loader class using libyaml.
+
+        The line numbers are tracked by the marks of the nodes.
+        """
+
+        def __init__(self, stream: io.StringIO) -> None:
+            """Initialize the loader."""
+            super().__init__(stream)
+            self.name = getattr(stream, "name", "<file>")
+
+    _LOADER = FastSafeLineLoader
+
+
+class YamlCache:
+    """Cache of parsed YAML files, validated by the hash of their content.
+
+    A cached file is only used if everything it was built from is unchanged:
+    the included files and secret files, the files found in included
+    directories and the environment variables. Files using secrets from the
+    keyring or credstash are not cached. The cache is only kept in memory,
+    as it contains the values of secrets.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.entries: Dict[str, Tuple[str, Dict[Tuple, Any], bytes]] = {}
+
+    def load_yaml(self, fname: str) -> JSON_TYPE:
+        """Load a YAML file, parsing it only if it changed."""
+        content = _read_yaml(fname)
+        digest = _digest(content)
+        entry = self.entries.get(fname)
+
+        if entry is not None and entry[0] == digest:
+            dependencies = entry[1]
+            result = _get_cached(fname, entry)
+        else:
+            result = None
+
+        if result is None:
+            dependencies = {}
+            previous_cache = _TRACKING.cache
+            _TRACKING.cache = self
+            _TRACKING.dependencies.append(dependencies)
+            try:
+                result = _parse_yaml(fname, content)
+            finally:
+                _TRACKING.dependencies.pop()
+                _TRACKING.cache = previous_cache
+
+            self._set(fname, digest, dependencies, result)
+
+        # Files including this file depend on it and on all it depends on
+        _track_dependency(("file", fname), digest)
+        for key, value in dependencies.items():
+            _track_dependency(key, value)
+
+        return result
+
+    def _set(
+        self, fname: str, digest: str, dependencies: Dict[Tuple, Any], result: Any
+    ) -> None:
+        """Cache a parsed file, unless it uses secrets that can't be stored."""
+        if _UNCACHEABLE in dependencies:
+            self.entries.pop(fname, None)
+            return
+
+        # Stored pickled so each load returns new objects
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self.entries.pop(fname, None)
+            return
+
+        self.entries[fname] = (digest, dependencies, data)
+
+
+def _get_cached(
+    fname: str, entry: Tuple[str, Dict[Tuple, Any], bytes]
+) -> Optional[JSON_TYPE]:
+    """Return the cached result if all its dependencies are unchanged."""
+    if any(_dependency_value(key) != value for key, value in entry[1].items()):
+        return None
+
+    result: JSON_TYPE = pickle.loads(entry[2])
+    return result
+
+
+def _digest(content: str) -> str:
+    """Return the hash of the content of a file."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _file_digest(fname: str) -> Optional[str]:
+    """Return the hash of the content of a file, None if it can't be read."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            # If configuration file is empty YAML returns None
-            # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
-    except yaml.YAMLError as exc:
-        _LOGGER.error(str(exc))
-        raise HomeAssistantError(exc)
+            return _digest(conf_file.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _dependency_value(key: Tuple) -> Any:
+    """Return the current value of a dependency of a cached file."""
+    kind = key[0]
+    if kind == "file":
+        return _file_digest(key[1])
+    if kind == "dir":
+        return _list_yaml_files(key[1])
+    if kind == "env":
+        return os.getenv(key[1])
+    return None
+
+
+def _read_yaml(fname: str) -> str:
+    """Read a YAML file."""
+    try:
+        with open(fname, encoding="utf-8") as conf_file:
+            return conf_file.read()
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc)
 
 
+def _parse_yaml(fname: str, content: str) -> JSON_TYPE:
+    """Parse the content of a YAML file."""
+    stream = io.StringIO(content)
+    setattr(stream, "name", fname)
+    try:
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        return yaml.load(stream, Loader=_LOADER) or OrderedDict()
+    except yaml.YAMLError as exc:
+        _LOGGER.error(str(exc))
+        raise HomeAssistantError(exc)
+
+
+def load_yaml(fname: str, cache: Optional[YamlCache] = None) -> JSON_TYPE:
+    """Load a YAML file.
+
+    Files included while loading a file with a cache use the same cache.
+    """
+    if cache is None:
+        cache = _TRACKING.cache
+
+    if cache is not None:
+        return cache.load_yaml(fname)
+
+    return _parse_yaml(fname, _read_yaml(fname))
+
+
 @overload
 def _add_reference(
     obj: Union[list, NodeListClass], loader: yaml.SafeLoader, node: yaml.nodes.Node
@@ -134,16 +315,30 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _list_yaml_files(directory: str) -> List[str]:
+    """Return the YAML files in a directory, except secret files."""
+    return [
+        fname
+        for fname in _find_files(directory, "*.yaml")
+        if os.path.basename(fname) != SECRET_YAML
+    ]
+
+
+def _find_yaml_files(directory: str) -> List[str]:
+    """Find the YAML files to include from a directory."""
+    files = _list_yaml_files(directory)
+    _track_dependency(("dir", directory), files)
+    return files
+
+
 def _include_dir_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
         mapping[filename] = load_yaml(fname)
     return _add_reference(mapping, loader, node)
 
@@ -154,9 +349,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
+    for fname in _find_yaml_files(loc):
         loaded_yaml = load_yaml(fname)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
@@ -168,11 +361,7 @@ def _include_dir_list_yaml(
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    return [
-        load_yaml(f)
-        for f in _find_files(loc, "*.yaml")
-        if os.path.basename(f) != SECRET_YAML
-    ]
+    return [load_yaml(f) for f in _find_yaml_files(loc)]
 
 
 def _include_dir_merge_list_yaml(
@@ -181,9 +370,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
+    for fname in _find_yaml_files(loc):
         loaded_yaml = load_yaml(fname)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
@@ -202,14 +389,14 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
         try:
             hash(key)
         except TypeError:
-            fname = getattr(loader.stream, "name", "")
+            fname = loader.name
             raise yaml.MarkedYAMLError(
                 context=f'invalid key: "{key}"',
                 context_mark=yaml.Mark(fname, 0, line, -1, None, None),
             )
 
         if key in seen:
-            fname = getattr(loader.stream, "name", "")
+            fname = loader.name
             _LOGGER.warning(
                 'YAML file %s contains duplicate key "%s". ' "Check lines %d and %d.",
                 fname,
@@ -231,6 +418,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _track_dependency(("env", args[0]), os.getenv(args[0]))
 
     # Check for a default value
     if len(args) > 1:
@@ -245,6 +433,7 @@ def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     """Load the secrets yaml from path."""
     secret_path = os.path.join(secret_path, SECRET_YAML)
     if secret_path in __SECRET_CACHE:
+        _track_dependency(("file", secret_path), _SECRET_DIGESTS[secret_path])
         return __SECRET_CACHE[secret_path]
 
     _LOGGER.debug("Loading %s", secret_path)
@@ -265,6 +454,8 @@ def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     except FileNotFoundError:
         secrets = {}
     __SECRET_CACHE[secret_path] = secrets
+    _SECRET_DIGESTS[secret_path] = _file_digest(secret_path)
+    _track_dependency(("file", secret_path), _SECRET_DIGESTS[secret_path])
     return secrets
 
 
@@ -294,6 +485,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
         if pwd:
             _LOGGER.debug("Secret %s retrieved from keyring", node.value)
+            _track_dependency(_UNCACHEABLE, True)
             return pwd
 
     global credstash  # pylint: disable=invalid-name
@@ -304,6 +496,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
             pwd = credstash.getSecret(node.value, table=_SECRET_NAMESPACE)
             if pwd:
                 _LOGGER.debug("Secret %s retrieved from credstash", node.value)
+                _track_dependency(_UNCACHEABLE, True)
                 return pwd
         except credstash.ItemNotFound:
             pass
@@ -314,18 +507,19 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
+def add_constructor(tag: str, constructor: Any) -> None:
+    """Add a constructor to the loaders used to load YAML."""
+    yaml.SafeLoader.add_constructor(tag, constructor)
+    if _LOADER is not SafeLineLoader:
+        _LOADER.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
@@ -10,6 +10,7 @@ from . import (
     dependencies,
     json,
     manifest,
+    manifest_index,
     services,
     ssdp,
     zeroconf,
@@ -23,6 +24,7 @@ PLUGINS = [
     coverage,
     dependencies,
     manifest,
+    manifest_index,
     services,
     ssdp,
     zeroconf,
@@ -0,0 +1,75 @@
+"""Generate manifest index file."""
+import json
+from typing import Any, Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+
+def format_value(value: Any, indent: int = 0) -> str:
+    """Format a manifest value as a Python literal, indented like JSON."""
+    if isinstance(value, (dict, list)) and value:
+        pad = " " * (indent + 4)
+        if isinstance(value, dict):
+            items = [
+                f"{pad}{json.dumps(key)}: {format_value(val, indent + 4)}"
+                for key, val in value.items()
+            ]
+            start, end = "{", "}"
+        else:
+            items = [f"{pad}{format_value(val, indent + 4)}" for val in value]
+            start, end = "[", "]"
+        return "{}\n{}\n{}{}".format(start, ",\n".join(items), " " * indent, end)
+
+    if isinstance(value, str):
+        return json.dumps(value)
+
+    return repr(value)
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifest index data."""
+    manifests = {}
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        manifests[domain] = integration.manifest
+
+    return BASE.format(format_value(manifests))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    with open(str(index_path), "r") as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.py is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(index_path), "w") as fp:
+        fp.write(config.cache["manifest_index"] + "\n")
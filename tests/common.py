@@ -114,6 +114,8 @@ def get_test_home_assistant():
 
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
+    # Don't write the custom integrations cache to the test config dir
+    hass.data[loader.DATA_CUSTOM_COMPONENTS_STORE] = MockCustomComponentsStore()
 
     stop_event = threading.Event()
 
@@ -355,7 +357,8 @@ def mock_component(hass, component):
 def mock_registry(hass, mock_entries=None):
     """Mock the Entity Registry."""
     registry = entity_registry.EntityRegistry(hass)
-    registry.entities = mock_entries or OrderedDict()
+    registry.entities = entity_registry.EntityRegistryItems()
+    registry.entities.update(mock_entries or {})
 
     hass.data[entity_registry.DATA_REGISTRY] = registry
     return registry
@@ -373,7 +376,8 @@ def mock_area_registry(hass, mock_entries=None):
 def mock_device_registry(hass, mock_entries=None):
     """Mock the Device Registry."""
     registry = device_registry.DeviceRegistry(hass)
-    registry.devices = mock_entries or OrderedDict()
+    registry.devices = device_registry.DeviceRegistryItems()
+    registry.devices.update(mock_entries or {})
 
     hass.data[device_registry.DATA_REGISTRY] = registry
     return registry
@@ -798,6 +802,7 @@ def init_recorder_component(hass, add_config=None):
     """Initialize the recorder."""
     config = dict(add_config) if add_config else {}
     config[recorder.CONF_DB_URL] = "sqlite://"  # In memory DB
+    config.setdefault(recorder.CONF_COMMIT_INTERVAL, 0)
 
     with patch("homeassistant.components.recorder.migration.migrate_schema"):
         assert setup_component(hass, recorder.DOMAIN, {recorder.DOMAIN: config})
@@ -949,6 +954,22 @@ class MockEntity(entity.Entity):
         return getattr(super(), attr)
 
 
+class MockCustomComponentsStore:
+    """Store for the custom integrations cache that is kept in memory."""
+
+    def __init__(self):
+        """Initialize the store."""
+        self.data = None
+
+    async def async_load(self):
+        """Return the saved data."""
+        return self.data
+
+    async def async_save(self, data):
+        """Save the data."""
+        self.data = data
+
+
 @contextmanager
 def mock_storage(data=None):
     """Mock storage.
@@ -1,7 +1,9 @@
 """The tests for generic camera component."""
 import asyncio
+from unittest.mock import patch
 
 from aiohttp.client_exceptions import ClientResponseError
+import pytest
 
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -10,6 +12,13 @@ from homeassistant.util import dt as dt_util
 EPSILON_DELTA = 0.0000000001
 
 
+@pytest.fixture(autouse=True)
+def no_shared_image():
+    """Fetch an image for every request to test the caching of the platform."""
+    with patch("homeassistant.components.camera.STILL_IMAGE_MAX_AGE", 0):
+        yield
+
+
 def radar_map_url(dim: int = 512, country_code: str = "NL") -> str:
     """Build map url, defaulting to 512 wide (as in component)."""
     return f"https://api.buienradar.nl/image/1.0/RadarMap{country_code}?w={dim}&h={dim}"
@@ -7,6 +7,7 @@ from unittest.mock import PropertyMock, mock_open, patch
 import pytest
 
 from homeassistant.components import camera
+from homeassistant.components.camera.broadcaster import FrameBroadcaster
 from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
@@ -95,6 +96,46 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_shared(hass, image_mock_url):
+    """Test requests for an image share a single fetch."""
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.camera_image",
+        autospec=True,
+        return_value=b"Test",
+    ) as mock_camera:
+        images = await asyncio.gather(
+            *(camera.async_get_image(hass, "camera.demo_camera") for _ in range(3))
+        )
+        images.append(await camera.async_get_image(hass, "camera.demo_camera"))
+
+    assert mock_camera.call_count == 1
+    assert [image.content for image in images] == [b"Test"] * 4
+
+
+async def test_frame_broadcaster(hass):
+    """Test streams share the frames fetched by the broadcaster."""
+    frames = iter([b"frame", b"next frame"])
+    calls = []
+
+    async def image_cb():
+        """Return the next frame."""
+        calls.append(None)
+        return next(frames)
+
+    broadcaster = FrameBroadcaster(hass, image_cb)
+    unsub_1 = broadcaster.async_subscribe(10)
+    unsub_2 = broadcaster.async_subscribe(20)
+
+    assert await broadcaster.async_get_frame() == b"frame"
+    assert await broadcaster.async_get_frame() == b"frame"
+    assert len(calls) == 1
+
+    unsub_1()
+    unsub_2()
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
@@ -2,9 +2,18 @@
 import asyncio
 from unittest import mock
 
+import pytest
+
 from homeassistant.setup import async_setup_component
 
 
+@pytest.fixture(autouse=True)
+def no_shared_image():
+    """Fetch an image for every request to test the caching of the platform."""
+    with mock.patch("homeassistant.components.camera.STILL_IMAGE_MAX_AGE", 0):
+        yield
+
+
 async def test_fetching_url(aioclient_mock, hass, hass_client):
     """Test that it fetches the given url."""
     aioclient_mock.get("http://example.com", text="hello world")
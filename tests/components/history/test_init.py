@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import patch, sentinel
 
 from homeassistant.components import history, recorder
+from homeassistant.components.history.cache import HistoryCache
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
@@ -526,6 +527,38 @@ class TestComponentHistory(unittest.TestCase):
         )
         assert list(hist.keys()) == entity_ids
 
+    def test_iter_significant_states_are_ordered(self):
+        """Test iter_significant_states keeps the order with a single query."""
+        zero, four, states = self.record_states()
+        entity_ids = ["thermostat.test", "media_player.test2", "media_player.test"]
+        with patch(
+            "homeassistant.components.history.get_states", wraps=history.get_states
+        ) as mock_get_states:
+            hist = list(
+                history.iter_significant_states(
+                    self.hass, zero, four, entity_ids, filters=history.Filters()
+                )
+            )
+        assert len(mock_get_states.mock_calls) == 1
+        assert [entity_states[0].entity_id for entity_states in hist] == entity_ids
+        assert hist == [states[ent_id] for ent_id in entity_ids]
+
+        # Entities only having a state at the start time keep their place
+        after_two = zero + timedelta(seconds=2, microseconds=1)
+        entity_ids = [
+            "media_player.test2",
+            "thermostat.test",
+            "script.can_cancel_this_one",
+            "media_player.test",
+        ]
+        hist = list(
+            history.iter_significant_states(
+                self.hass, after_two, four, entity_ids, filters=history.Filters()
+            )
+        )
+        assert [entity_states[0].entity_id for entity_states in hist] == entity_ids
+        assert [len(entity_states) for entity_states in hist] == [1, 2, 1, 2]
+
     def check_significant_states(self, zero, four, states, config):
         """Check if significant states are retrieved."""
         filters = history.Filters()
@@ -650,3 +683,96 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_history_cache(hass):
+    """Test significant states are served from the history cache."""
+    hass.states.async_set("light.kitchen", "off")
+    cache = HistoryCache(hass, timedelta(hours=1), 3)
+    cache.async_start(lambda entity_id: entity_id != "light.excluded")
+    start = cache.covered_since
+    assert cache.async_covers(start)
+    assert not cache.async_covers(start - timedelta(seconds=1))
+
+    # Each state counts as a byte
+    with patch("homeassistant.components.history.cache._state_size", return_value=1):
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+        hass.states.async_set("light.excluded", "on")
+        await hass.async_block_till_done()
+
+        result = history.async_get_cached_significant_states(
+            cache, start, None, None, history.Filters(), True
+        )
+        assert list(result) == ["light.kitchen"]
+        initial, changed = result["light.kitchen"]
+        assert initial.state == "off"
+        assert initial.last_updated == start
+        assert changed.state == "on"
+        assert changed.attributes == {}
+
+        # Exceeding max size evicts the oldest state and the covered period
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+
+    assert not cache.async_covers(start)
+    assert cache.async_state_at("light.kitchen", cache.covered_since).state == "on"
+    assert cache.size == 3
+
+    cache.async_stop()
+    assert not cache.async_covers(dt_util.utcnow())
+    assert cache.size == 0
+
+
+async def test_history_cache_shares_attributes(hass):
+    """Test equal attributes of consecutive states are stored once."""
+    attributes = {"friendly_name": "Temperature " * 100}
+    cache = HistoryCache(hass, timedelta(hours=1), 10 ** 6)
+    cache.async_start(lambda entity_id: True)
+    start = cache.covered_since
+
+    hass.states.async_set("sensor.temperature", "20", attributes)
+    await hass.async_block_till_done()
+    first_size = cache.size
+
+    hass.states.async_set("sensor.temperature", "21", attributes)
+    await hass.async_block_till_done()
+    assert cache.size - first_size < first_size
+
+    first, second = cache.async_states_between("sensor.temperature", start, None)
+    assert first.attributes == second.attributes == attributes
+    assert second.state == "21"
+
+    cache.async_stop()
+
+
+async def test_history_cache_removed_entity(hass):
+    """Test the history cache keeps removed entities like the recorder."""
+    hass.states.async_set("light.kitchen", "on")
+    cache = HistoryCache(hass, timedelta(hours=1), 2)
+    cache.async_start(lambda entity_id: True)
+    start = cache.covered_since
+
+    # Each state counts as a byte
+    with patch("homeassistant.components.history.cache._state_size", return_value=1):
+        hass.states.async_remove("light.kitchen")
+        await hass.async_block_till_done()
+
+        result = history.async_get_cached_significant_states(
+            cache, start, None, None, history.Filters(), True
+        )
+        initial, removed = result["light.kitchen"]
+        assert initial.state == "on"
+        assert removed.state == ""
+        assert removed.attributes == {}
+
+        # The removal stays the state of the entity once it is evicted
+        hass.states.async_set("light.other", "on")
+        hass.states.async_set("light.other", "off")
+        await hass.async_block_till_done()
+
+    state = cache.async_state_at("light.kitchen", cache.covered_since)
+    assert state.state == ""
+
+    cache.async_stop()
@@ -1,6 +1,9 @@
 """Tests for Home Assistant View."""
-from unittest.mock import Mock
+import json
+import threading
+from unittest.mock import Mock, patch
 
+from aiohttp import web
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -11,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components.http.view import (
     HomeAssistantView,
+    _json_array_chunks,
     request_handler_factory,
 )
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
@@ -34,6 +38,54 @@ async def test_invalid_json(caplog):
     assert str(float("NaN")) in caplog.text
 
 
+def test_json_array_chunks():
+    """Test serializing items into JSON array chunks."""
+    assert list(_json_array_chunks([])) == [b"[]"]
+
+    items = [{"value": idx} for idx in range(10)]
+    with patch("homeassistant.components.http.view.JSON_STREAM_CHUNK_SIZE", 30):
+        chunks = list(_json_array_chunks(iter(items)))
+
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == items
+
+
+async def test_json_stream(hass, aiohttp_client):
+    """Test streaming a JSON array from a thread of the response."""
+    threads = set()
+
+    def job(count):
+        for idx in range(count):
+            threads.add(threading.current_thread().name)
+            yield {"value": idx}
+
+    class StreamView(HomeAssistantView):
+        async def get(self, request):
+            return await self.json_stream(request, job, 3)
+
+    def failing_job():
+        raise ValueError("Invalid")
+
+    class FailingView(HomeAssistantView):
+        async def get(self, request):
+            return await self.json_stream(request, failing_job)
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/stream", StreamView().get)
+    app.router.add_get("/failing", FailingView().get)
+    client = await aiohttp_client(app)
+
+    resp = await client.get("/stream")
+    assert resp.status == 200
+    assert await resp.json() == [{"value": 0}, {"value": 1}, {"value": 2}]
+    assert len(threads) == 1
+    assert threads.pop().startswith("JSONStream")
+
+    resp = await client.get("/failing")
+    assert resp.status == 500
+
+
 async def test_handling_unauthorized(mock_request):
     """Test handling unauth exceptions."""
     with pytest.raises(HTTPUnauthorized):
@@ -1333,6 +1333,47 @@ async def test_logbook_view_period_entity(hass, hass_client):
     assert json[0]["entity_id"] == entity_id_test
 
 
+async def test_logbook_view_include_exclude_filter(hass, hass_client):
+    """Test the logbook view filters recorded states in the query."""
+    await hass.async_add_job(init_recorder_component, hass)
+    config = logbook.CONFIG_SCHEMA(
+        {
+            logbook.DOMAIN: {
+                logbook.CONF_INCLUDE: {
+                    logbook.CONF_DOMAINS: ["switch"],
+                    logbook.CONF_ENTITIES: ["light.included"],
+                },
+                logbook.CONF_EXCLUDE: {logbook.CONF_ENTITIES: ["switch.excluded"]},
+            }
+        }
+    )
+    await async_setup_component(hass, "logbook", config)
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    for entity_id in (
+        "switch.included",
+        "switch.excluded",
+        "light.included",
+        "light.excluded",
+    ):
+        hass.states.async_set(entity_id, STATE_OFF)
+        hass.states.async_set(entity_id, STATE_ON)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get("/api/logbook/{}".format(start_date.isoformat()))
+    assert response.status == 200
+    json = await response.json()
+    assert [entry["entity_id"] for entry in json] == [
+        "switch.included",
+        "light.included",
+    ]
+
+
 async def test_humanify_alexa_event(hass):
     """Test humanifying Alexa event."""
     hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen Light"})
@@ -338,6 +338,73 @@ class TestMQTTCallbacks(unittest.TestCase):
         self.hass.block_till_done()
         assert len(self.calls) == 1
 
+    def test_subscribe_overlapping_topics(self):
+        """Test a message is delivered to every matching subscription once."""
+        unsub_exact = mqtt.subscribe(self.hass, "test-topic/bier/on", self.record_calls)
+        mqtt.subscribe(self.hass, "test-topic/+/on", self.record_calls)
+        mqtt.subscribe(self.hass, "test-topic/#", self.record_calls)
+
+        fire_mqtt_message(self.hass, "test-topic/bier/on", "test-payload")
+
+        self.hass.block_till_done()
+        assert len(self.calls) == 3
+        # The payload is decoded once and shared by the subscriptions
+        assert all(call[0] is self.calls[0][0] for call in self.calls)
+
+        unsub_exact()
+
+        fire_mqtt_message(self.hass, "test-topic/bier/on", "test-payload")
+
+        self.hass.block_till_done()
+        assert len(self.calls) == 5
+
+    def test_received_messages_handled_in_batch(self):
+        """Test messages received by the paho thread are handled in a batch."""
+        mqtt.subscribe(self.hass, "test-topic", self.record_calls)
+        self.hass.block_till_done()
+
+        with mock.patch.object(
+            self.hass.loop,
+            "call_soon_threadsafe",
+            wraps=self.hass.loop.call_soon_threadsafe,
+        ) as mock_call_soon:
+            for payload in (b"1", b"2", b"3"):
+                self.hass.data["mqtt"]._mqtt_on_message(
+                    None, None, mqtt.Message("test-topic", payload, 0, False)
+                )
+
+        assert mock_call_soon.call_count == 1
+
+        self.hass.block_till_done()
+        assert [call[0].payload for call in self.calls] == ["1", "2", "3"]
+
+    def test_received_message_error_does_not_stop_batch(self):
+        """Test an error handling a message does not drop the rest of the batch."""
+        mqtt.subscribe(self.hass, "test-topic", self.record_calls)
+        self.hass.block_till_done()
+
+        mqtt_data = self.hass.data["mqtt"]
+        handle_message = mqtt_data._mqtt_handle_message
+
+        def handle_or_raise(msg):
+            """Raise on the second message."""
+            if msg.payload == b"2":
+                raise ValueError("Invalid payload")
+            handle_message(msg)
+
+        with mock.patch.object(
+            mqtt_data, "_mqtt_handle_message", side_effect=handle_or_raise
+        ), self.assertLogs(level="ERROR") as test_handle:
+            for payload in (b"1", b"2", b"3"):
+                mqtt_data._mqtt_on_message(
+                    None, None, mqtt.Message("test-topic", payload, 0, False)
+                )
+
+            self.hass.block_till_done()
+
+        assert "Error handling message on test-topic" in test_handle.output[0]
+        assert [call[0].payload for call in self.calls] == ["1", "3"]
+
     def test_subscribe_topic_not_match(self):
         """Test if subscribed topic is not a match."""
         mqtt.subscribe(self.hass, "test-topic", self.record_calls)
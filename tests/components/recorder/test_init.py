@@ -7,7 +7,7 @@ import pytest
 
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, States
+from homeassistant.components.recorder.models import Events, StateAttributes, States
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import callback
@@ -189,6 +189,61 @@ def test_saving_state_include_domain_exclude_entity(hass_recorder):
     assert hass.states.get("test.ok").state == "state2"
 
 
+def test_saving_states_in_batch(hass_recorder):
+    """Test states written in one batch are linked to their events."""
+    hass = hass_recorder({"commit_interval": 0.5})
+    for idx in range(20):
+        hass.states.set("test.recorder", f"state{idx}")
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 20
+        for idx, db_state in enumerate(db_states):
+            assert db_state.state == f"state{idx}"
+            db_event = session.query(Events).get(db_state.event_id)
+            assert db_event.event_type == "state_changed"
+
+
+def test_shutdown_while_collecting_batch(hass_recorder):
+    """Test the recorder stops when shut down before the batch is committed."""
+    hass = hass_recorder({"commit_interval": 1})
+    instance = hass.data[DATA_INSTANCE]
+    hass.states.set("test.recorder", "on")
+    hass.block_till_done()
+
+    instance.queue.put(None)
+    instance.join(5)
+
+    assert not instance.is_alive()
+    assert instance.queue.unfinished_tasks == 0
+
+
+def test_saving_state_deduplicates_attributes(hass_recorder):
+    """Test identical attributes are stored once."""
+    hass = hass_recorder()
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.set("test.recorder", "on", attributes)
+    hass.states.set("test.recorder", "off", attributes)
+    hass.states.set("test.other", "on", attributes)
+    hass.states.set("test.other", "off", {"test_attr": 6})
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 4
+        assert all(db_state.attributes is None for db_state in db_states)
+        assert db_states[0].attributes_id == db_states[2].attributes_id
+        states = [db_state.to_native() for db_state in db_states]
+
+    assert states[0].attributes == attributes
+    assert states[2].attributes == attributes
+    assert states[3] == hass.states.get("test.other")
+
+
 def test_recorder_setup_failure():
     """Test some exceptions."""
     hass = get_test_home_assistant()
@@ -222,3 +277,4 @@ async def test_defaults_set(hass):
     assert recorder_config is not None
     assert recorder_config["purge_keep_days"] == 10
     assert recorder_config["purge_interval"] == 1
+    assert recorder_config["commit_interval"] == 1
@@ -121,6 +121,26 @@ class TestRecorderPurge(unittest.TestCase):
             # we should only have 2 events left
             assert events.count() == 2
 
+    def test_purge_old_states_in_batches(self):
+        """Test deleting old states in multiple batches."""
+        self._add_test_states()
+
+        with patch(
+            "homeassistant.components.recorder.purge.PURGE_BATCH_SIZE", 3
+        ), session_scope(hass=self.hass) as session:
+            states = session.query(States)
+            assert states.count() == 6
+
+            instance = self.hass.data[DATA_INSTANCE]
+            assert not purge_old_data(instance, 4, repack=False)
+            assert states.count() == 3
+
+            assert not purge_old_data(instance, 4, repack=False)
+            assert states.count() == 2
+
+            assert purge_old_data(instance, 4, repack=False)
+            assert states.count() == 2
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -173,7 +193,7 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.services.call("recorder", "purge", service_data=service_data)
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
-                assert (
-                    mock_logger.debug.mock_calls[3][1][0]
-                    == "Vacuuming SQL DB to free space"
+                assert mock_logger.debug.mock_calls[-1][1][0] in (
+                    "Vacuuming SQL DB to free space",
+                    "Incrementally vacuuming SQL DB to free space",
                 )
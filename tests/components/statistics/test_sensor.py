@@ -1,4 +1,5 @@
 """The test for the statistics sensor platform."""
+from collections import deque
 from datetime import datetime, timedelta
 import statistics
 import unittest
@@ -7,7 +8,10 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    RunningStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNKNOWN, TEMP_CELSIUS
 from homeassistant.setup import setup_component
 from homeassistant.util import dt as dt_util
@@ -419,3 +423,34 @@ class TestStatisticsSensor(unittest.TestCase):
         assert mock_data["return_time"] == state.attributes.get("max_age") + timedelta(
             hours=1
         )
+
+
+def test_running_statistics():
+    """Test running statistics match the statistics of the whole window."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 5, 5, 20, 0.1, 0.2, 0.3] * 20
+    stats = RunningStatistics()
+    window = deque()
+
+    for value in values:
+        if len(window) == 7:
+            stats.popleft(window.popleft())
+        window.append(value)
+        stats.append(value)
+
+        assert stats.count == len(window)
+        assert stats.mean == statistics.mean(window)
+        assert stats.median == statistics.median(window)
+        assert stats.min == min(window)
+        assert stats.max == max(window)
+        assert round(stats.total, 2) == round(sum(window), 2)
+        if len(window) > 1:
+            assert round(stats.variance, 10) == round(statistics.variance(window), 10)
+            assert round(stats.stdev, 10) == round(statistics.stdev(window), 10)
+
+    while window:
+        stats.popleft(window.popleft())
+        assert stats.count == len(window)
+        if window:
+            assert stats.median == statistics.median(window)
+            assert stats.min == min(window)
+            assert stats.max == max(window)
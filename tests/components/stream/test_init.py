@@ -3,13 +3,17 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from homeassistant.components.stream import Stream
 from homeassistant.components.stream.const import (
     ATTR_STREAMS,
     CONF_LOOKBACK,
+    CONF_MAX_BUFFER_SIZE,
+    CONF_MAX_SEGMENTS,
     CONF_STREAM_SOURCE,
     DOMAIN,
     SERVICE_RECORD,
 )
+from homeassistant.components.stream.core import Segment
 from homeassistant.const import CONF_FILENAME
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
@@ -85,3 +89,25 @@ async def test_record_service_lookback(hass):
         assert stream_mock.called
         stream_mock.return_value.add_provider.assert_called_once_with("recorder")
         assert hls_mock.recv.called
+
+
+async def test_output_ring_buffer(hass):
+    """Test stream outputs keep the latest segments that fit the buffer."""
+    await async_setup_component(
+        hass, "stream", {"stream": {CONF_MAX_SEGMENTS: 3, CONF_MAX_BUFFER_SIZE: 1}}
+    )
+    track = Stream(hass, "rtsp://my.video").add_provider("hls")
+
+    data = memoryview(bytes(300 * 1024))
+    for sequence in range(1, 5):
+        track.put(Segment(sequence, data, 2))
+
+    assert track.segments == [2, 3, 4]
+    assert track.buffer_size == 3 * data.nbytes
+
+    # Too large to keep the two oldest segments
+    track.put(Segment(5, memoryview(bytes(600 * 1024)), 2))
+
+    assert track.segments == [4, 5]
+    assert track.buffer_size == 900 * 1024
+    assert track.get_segment(5).segment.nbytes == 600 * 1024
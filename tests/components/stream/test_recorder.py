@@ -76,7 +76,7 @@ async def test_recorder_save():
     output.name = "test.mp4"
 
     # Run
-    recorder_save_worker(output, [Segment(1, source, 4)])
+    recorder_save_worker(output, [Segment(1, memoryview(source.getvalue()), 4)])
 
     # Assert
     assert output.getvalue()
@@ -387,6 +387,51 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_events_filtered_batched(hass, websocket_client):
+    """Test subscribing to filtered state_changed events in batches."""
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "entity_id": "light.kitchen",
+            "domain": "switch",
+            "batch_interval": 10,
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("switch.fan", "on")
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert [event["data"]["entity_id"] for event in msg["events"]] == [
+        "light.kitchen",
+        "switch.fan",
+    ]
+
+
+async def test_subscribe_events_filter_requires_event_type(hass, websocket_client):
+    """Test filtering events requires an event type."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "domain": "light"}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
 async def test_render_template_renders_template(
     hass, websocket_client, hass_admin_user
 ):
@@ -480,3 +480,54 @@ async def test_loading_race_condition(hass):
 
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_indexes_follow_updates(registry):
+    """Test the lookups stay consistent through updates and removal."""
+    entry = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    registry.async_update_device(entry.id, area_id="kitchen")
+
+    assert registry.async_get_device({("bridgeid", "0123")}, set()).id == entry.id
+    assert (
+        registry.async_get_device(
+            set(), {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")}
+        ).id
+        == entry.id
+    )
+    assert [
+        device.id
+        for device in device_registry.async_entries_for_config_entry(registry, "1234")
+    ] == [entry.id]
+    assert [
+        device.id
+        for device in device_registry.async_entries_for_area(registry, "kitchen")
+    ] == [entry.id]
+
+    registry.async_update_device(entry.id, area_id=None)
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_remove_device(entry.id)
+
+    assert registry.async_get_device({("bridgeid", "0123")}, set()) is None
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+
+
+async def test_get_device_matches_first_registered(hass):
+    """Test the first registered matching device is returned."""
+    first = device_registry.DeviceEntry(
+        id="first", identifiers={("bridgeid", "0123")}, connections={("mac", "1")}
+    )
+    second = device_registry.DeviceEntry(
+        id="second", identifiers={("bridgeid", "0123"), ("bridgeid", "4567")}
+    )
+    registry = mock_device_registry(hass, {"first": first, "second": second})
+
+    assert registry.async_get_device({("bridgeid", "4567")}, {("mac", "1")}) == first
+    assert registry.async_get_device({("bridgeid", "0123")}, set()) == first
+
+    registry.async_remove_device("first")
+    assert registry.async_get_device({("bridgeid", "0123")}, set()) == second
@@ -12,8 +12,9 @@ from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_HIDDEN, STATE_UNAVAILABL
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
 from homeassistant.helpers.entity_values import EntityValues
+import homeassistant.util.dt as dt_util
 
-from tests.common import get_test_home_assistant, mock_registry
+from tests.common import async_fire_time_changed, get_test_home_assistant, mock_registry
 
 
 def test_generate_entity_id_requires_hass_or_ids():
@@ -680,3 +681,53 @@ async def test_warn_slow_write_state(hass, caplog):
         "https://github.com/home-assistant/home-assistant/issues?"
         "q=is%3Aopen+is%3Aissue+label%3A%22integration%3A+hue%22"
     ) in caplog.text
+
+
+async def test_coalesce_state_writes(hass):
+    """Test state writes within the coalesce interval are merged."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+        coalesce_interval=1,
+    )
+    mock_registry(hass, {"hello.world": entry})
+
+    events = []
+    hass.bus.async_listen("state_changed", events.append)
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.registry_entry = entry
+
+    for value in range(5):
+        with patch.object(entity.Entity, "state", PropertyMock(return_value=value)):
+            ent.async_write_ha_state()
+
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert hass.states.get("hello.world").state == "0"
+
+    with patch.object(entity.Entity, "state", PropertyMock(return_value=4)):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+        await hass.async_block_till_done()
+    assert len(events) == 2
+    assert hass.states.get("hello.world").state == "4"
+
+    # Merged writes of an unchanged state only fire with force_update
+    with patch.object(entity.Entity, "state", PropertyMock(return_value=4)):
+        ent.async_write_ha_state()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+        await hass.async_block_till_done()
+        ent.async_write_ha_state()
+        ent.async_write_ha_state()
+        with patch.object(
+            entity.Entity, "force_update", PropertyMock(return_value=True)
+        ):
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+            await hass.async_block_till_done()
+    assert len(events) == 3
+
+    await ent.async_remove()
+    assert ent._coalesce_unsub is None
@@ -435,6 +435,7 @@ async def test_update_entity(registry):
     for attr_name, new_value in (
         ("name", "new name"),
         ("disabled_by", entity_registry.DISABLED_USER),
+        ("coalesce_interval", 0.5),
     ):
         changes = {attr_name: new_value}
         updated_entry = registry.async_update_entity(entry.entity_id, **changes)
@@ -535,3 +536,31 @@ async def test_restore_states(hass):
     assert hass.states.get("light.simple") is None
     assert hass.states.get("light.disabled") is None
     assert hass.states.get("light.all_info_set") is None
+
+
+async def test_indexes_follow_updates(registry):
+    """Test the lookups stay consistent through updates and removal."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="mock-dev-1"
+    )
+
+    assert registry.async_get_entity_id("light", "hue", "5678") == entry.entity_id
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-1") == [entry]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry
+    ]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", new_unique_id="1234"
+    )
+
+    assert registry.async_get_entity_id("light", "hue", "5678") is None
+    assert registry.async_get_entity_id("light", "hue", "1234") == "light.renamed"
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-1") == [entry]
+
+    registry.async_remove("light.renamed")
+
+    assert registry.async_get_entity_id("light", "hue", "1234") is None
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-1") == []
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == []
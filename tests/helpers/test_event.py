@@ -12,6 +12,7 @@ from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.helpers.event import (
+    DATA_TIME_SCHEDULER,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -233,6 +234,74 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_template_render_info(hass):
+    """Test tracking a template subscribes to the states it reads."""
+    runs = []
+    domain_runs = []
+
+    hass.states.async_set("switch.first", "off")
+    hass.states.async_set("switch.second", "on")
+
+    template_condition = Template(
+        "{{ is_state('switch.first', 'on') and is_state('switch.second', 'on') }}",
+        hass,
+    )
+    template_domain = Template("{{ states.light | list | count > 1 }}", hass)
+
+    async_track_template(
+        hass, template_condition, ha.callback(lambda *args: runs.append(args))
+    )
+    async_track_template(
+        hass, template_domain, ha.callback(lambda *args: domain_runs.append(args))
+    )
+
+    hass.states.async_set("switch.first", "on")
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert runs[0][0] == "switch.first"
+
+    # switch.second was read during the last render
+    hass.states.async_set("switch.second", "off")
+    await hass.async_block_till_done()
+    hass.states.async_set("switch.second", "on")
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert runs[1][0] == "switch.second"
+
+    hass.states.async_set("light.first", "on")
+    await hass.async_block_till_done()
+    assert len(domain_runs) == 0
+
+    hass.states.async_set("light.second", "on")
+    await hass.async_block_till_done()
+    assert len(domain_runs) == 1
+    assert domain_runs[0][0] == "light.second"
+
+
+async def test_track_template_remove_while_scheduled(hass, caplog):
+    """Test removing a template listener whose call is already scheduled."""
+    hass.states.async_set("switch.first", "off")
+    hass.states.async_set("switch.second", "on")
+    template_condition = Template(
+        "{{ is_state('switch.first', 'on') and is_state('switch.second', 'on') }}",
+        hass,
+    )
+    listeners = hass.bus.async_listeners().get(ha.EVENT_STATE_CHANGED, 0)
+
+    unsub = async_track_template(
+        hass, template_condition, ha.callback(lambda *args: None)
+    )
+    assert hass.bus.async_listeners()[ha.EVENT_STATE_CHANGED] == listeners + 1
+
+    # The render reads switch.second as well, changing the subscription
+    hass.states.async_set("switch.first", "on")
+    unsub()
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_listeners().get(ha.EVENT_STATE_CHANGED, 0) == listeners
+    assert "Unable to remove unknown listener" not in caplog.text
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -835,3 +904,55 @@ async def test_async_call_later(hass):
     assert p_action is action
     assert p_point == now + timedelta(seconds=3)
     assert remove is mock()
+
+
+async def test_time_listeners_share_time_changed_listener(hass):
+    """Test time listeners only call the listeners that are due."""
+    runs = []
+    unsubs = [
+        async_track_utc_time_change(
+            hass, callback(lambda x, i=i: runs.append(i)), minute=i, second=0
+        )
+        for i in range(10)
+    ]
+    unsubs.append(
+        async_track_point_in_utc_time(
+            hass,
+            callback(lambda x: runs.append("point")),
+            datetime(2014, 5, 24, 12, 5, 30, tzinfo=dt_util.UTC),
+        )
+    )
+
+    assert hass.bus.async_listeners()[ha.EVENT_TIME_CHANGED] == 1
+
+    _send_time_changed(hass, datetime(2014, 5, 24, 12, 2, 0, tzinfo=dt_util.UTC))
+    await hass.async_block_till_done()
+    assert runs == [2]
+
+    _send_time_changed(hass, datetime(2014, 5, 24, 12, 6, 0, tzinfo=dt_util.UTC))
+    await hass.async_block_till_done()
+    assert runs == [2, 3, 4, 5, "point", 6]
+
+    for unsub in unsubs:
+        unsub()
+
+    assert ha.EVENT_TIME_CHANGED not in hass.bus.async_listeners()
+
+
+async def test_time_listeners_removed_far_in_future(hass):
+    """Test removed listeners that are due far in the future are dropped."""
+    now = datetime(2014, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC)
+    runs = []
+    async_track_utc_time_change(hass, callback(lambda x: runs.append(x)), second=0)
+
+    for idx in range(100):
+        unsub = async_track_point_in_utc_time(
+            hass, callback(lambda x: runs.append(x)), now + timedelta(days=365)
+        )
+        # Move the listener into the heap
+        _send_time_changed(hass, now + timedelta(seconds=idx + 1))
+        await hass.async_block_till_done()
+        unsub()
+
+    assert len(hass.data[DATA_TIME_SCHEDULER]._heap) <= 2
+    assert runs == [now + timedelta(seconds=60)]
@@ -1,5 +1,5 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from asynctest import patch
 
@@ -9,6 +9,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    JOURNAL_STORAGE_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -117,6 +118,8 @@ async def test_dump_data(hass):
     await entity.async_internal_added_to_hass()
 
     data = await RestoreStateData.async_get_instance(hass)
+    # Let the dump on startup finish
+    await hass.async_block_till_done()
     now = dt_util.utcnow()
     data.last_states = {
         "input_boolean.b0": StoredState(State("input_boolean.b0", "off"), now),
@@ -156,19 +159,131 @@ async def test_dump_data(hass):
     # Test that removed entities are not persisted
     await entity.async_remove()
 
+    with patch.object(data.store, "async_save") as mock_write_data, patch.object(
+        data.journal, "async_save"
+    ) as mock_write_journal, patch.object(
+        hass.states, "async_all", return_value=states
+    ):
+        await data.async_dump_states()
+
+    assert not mock_write_data.called
+    journal = mock_write_journal.mock_calls[0][1][0]
+    assert journal["states"] == []
+    assert list(journal["removed"]) == ["input_boolean.b1"]
+
+
+async def test_dump_unchanged_states(hass):
+    """Test that states are only dumped when they changed."""
+    states = [State("input_boolean.b1", "on")]
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+
+    data = await RestoreStateData.async_get_instance(hass)
+    # Let the dump on startup finish
+    await hass.async_block_till_done()
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 1
 
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
-    assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 1
+
+        states[0] = State("input_boolean.b1", "off")
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 2
+
+    written_states = mock_write_data.mock_calls[1][1][0]
+    assert len(written_states) == 1
     assert written_states[0]["state"]["state"] == "off"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+
+
+async def test_dump_changed_states_to_journal(hass):
+    """Test that only changed states are written to the journal."""
+    states = [State(f"input_boolean.b{idx}", "on") for idx in range(4)]
+
+    for state in states:
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = state.entity_id
+        await entity.async_internal_added_to_hass()
+
+    data = await RestoreStateData.async_get_instance(hass)
+    # Let the dump on startup finish
+    await hass.async_block_till_done()
+
+    with patch.object(data.store, "async_save") as mock_write_data, patch.object(
+        data.journal, "async_save"
+    ) as mock_write_journal, patch.object(
+        hass.states, "async_all", return_value=states
+    ):
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 1
+        assert len(mock_write_journal.mock_calls) == 0
+
+        states[1] = State("input_boolean.b1", "off")
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 1
+        assert len(mock_write_journal.mock_calls) == 1
+
+        journal = mock_write_journal.mock_calls[0][1][0]
+        assert [item["state"]["state"] for item in journal["states"]] == ["off"]
+        assert journal["removed"] == {}
+
+        # More changes than the journal may hold write all states again
+        states[2] = State("input_boolean.b2", "off")
+        states[3] = State("input_boolean.b3", "off")
+        await data.async_dump_states()
+        assert len(mock_write_data.mock_calls) == 2
+        assert len(mock_write_journal.mock_calls) == 2
+        assert mock_write_journal.mock_calls[1][1][0] == {"states": [], "removed": {}}
+
+
+async def test_load_journal(hass, hass_storage):
+    """Test that the journal is applied to the stored states."""
+    before = dt_util.utcnow()
+    after = before + timedelta(minutes=1)
+
+    def stored_state(entity_id, state, last_seen):
+        return StoredState(State(entity_id, state), last_seen).as_dict()
+
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            stored_state("input_boolean.b0", "on", before),
+            stored_state("input_boolean.b1", "on", before),
+            stored_state("input_boolean.b2", "on", after),
+            stored_state("input_boolean.b3", "on", after),
+        ],
+    }
+    hass_storage[JOURNAL_STORAGE_KEY] = {
+        "version": 1,
+        "key": JOURNAL_STORAGE_KEY,
+        "data": {
+            "states": [
+                stored_state("input_boolean.b0", "off", after),
+                # Written before the stored states
+                stored_state("input_boolean.b2", "off", before),
+            ],
+            "removed": {
+                "input_boolean.b1": after.isoformat(),
+                "input_boolean.b3": before.isoformat(),
+            },
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert {
+        entity_id: stored.state.state for entity_id, stored in data.last_states.items()
+    } == {"input_boolean.b0": "off", "input_boolean.b2": "on", "input_boolean.b3": "on"}
+    assert data.journal_written
 
 
 async def test_dump_error(hass):
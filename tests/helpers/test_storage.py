@@ -137,6 +137,40 @@ async def test_writing_while_writing_delay(hass, store, hass_storage):
     assert data == {"delay": "no"}
 
 
+async def test_min_write_interval(hass, hass_storage):
+    """Test delayed saves are merged and spaced by the minimum write interval."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, min_write_interval=10)
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    store.async_delay_save(lambda: MOCK_DATA2, 5)
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key]["data"] == MOCK_DATA2
+
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key]["data"] == MOCK_DATA2
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+
+
+async def test_write_metrics(tmp_path):
+    """Test the size and durations of the last write are recorded."""
+    hass = Mock()
+    hass.config.path = lambda *path: str(tmp_path.joinpath(*path))
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, compact=True)
+    assert store.last_write_size is None
+
+    store._write_data(store.path, {"data": MOCK_DATA})
+
+    assert store.last_write_size == (tmp_path / ".storage" / MOCK_KEY).stat().st_size
+    assert store.last_serialize_duration >= 0
+    assert store.last_write_duration >= 0
+
+
 async def test_migrator_no_existing_config(hass, store, hass_storage):
     """Test migrator with no existing config."""
     with patch("os.path.isfile", return_value=False), patch.object(
@@ -39,7 +39,7 @@ def extract_entities(hass, template_str, variables=None):
     """Extract entities from a template."""
     info = render_to_info(hass, template_str, variables)
     # pylint: disable=protected-access
-    assert not hasattr(info, "_domains")
+    assert not info._domains
     return info._entities
 
 
@@ -59,7 +59,7 @@ def assert_result_info(info, result, entities=None, domains=None, all_states=Fal
         assert info._domains == frozenset(domains)
         assert all([info.filter_lifecycle(domain + ".entity") for domain in domains])
     else:
-        assert not hasattr(info, "_domains")
+        assert not info._domains
 
 
 def test_template_equality():
@@ -1803,3 +1803,78 @@ def test_render_complex_handling_non_template_values(hass):
     assert template.render_complex(
         {True: 1, False: template.Template("{{ hello }}", hass)}, {"hello": 2}
     ) == {True: 1, False: "2"}
+
+
+def test_static_template(hass):
+    """Test templates without Jinja markup are not compiled."""
+    with patch.object(template.TemplateEnvironment, "compile") as mock_compile:
+        tpl = template.Template(" light.kitchen\n", hass)
+        tpl.ensure_valid()
+        assert tpl.is_static
+        assert tpl.async_render({"hello": 1}) == "light.kitchen"
+        assert tpl.async_render_with_possible_json_value("on") == "light.kitchen"
+        assert template.render_complex([{"entity_id": tpl}]) == [
+            {"entity_id": "light.kitchen"}
+        ]
+
+    assert len(mock_compile.mock_calls) == 0
+    assert not template.Template("{# comment #}", hass).is_static
+    assert template.Template("{# comment #}", hass).async_render() == ""
+
+
+def test_compiled_code_is_shared(hass):
+    """Test templates with the same source are compiled once."""
+    with patch.object(
+        template.TemplateEnvironment,
+        "compile",
+        autospec=True,
+        side_effect=template.TemplateEnvironment.compile,
+    ) as mock_compile:
+        tpl1 = template.Template("{{ 1 + 1 }}", hass)
+        tpl2 = template.Template("{{ 1 + 1 }}", hass)
+        assert tpl1.async_render() == "2"
+        assert tpl2.async_render() == "2"
+
+    assert len(mock_compile.mock_calls) == 1
+
+
+def test_bytecode_cache(hass, tmp_path):
+    """Test compiled templates are persisted in the bytecode cache."""
+    path = str(tmp_path / template.BYTECODE_CACHE_FILE)
+    bytecode_cache = template.TemplateBytecodeCache(path)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == "4"
+    bytecode_cache.save()
+
+    bytecode_cache = template.TemplateBytecodeCache(path)
+    bytecode_cache.load()
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    hass.data[template._ENVIRONMENT].clear_compiled_cache()
+
+    with patch.object(template.TemplateEnvironment, "compile") as mock_compile:
+        assert template.Template("{{ 2 + 2 }}", hass).async_render() == "4"
+
+    assert len(mock_compile.mock_calls) == 0
+
+
+async def test_bytecode_cache_in_storage_dir(hass, tmp_path):
+    """Test the bytecode cache is saved in the storage dir."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    path = tmp_path / ".storage" / template.BYTECODE_CACHE_FILE
+    assert bytecode_cache.path == str(path)
+
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == "4"
+    await hass.async_add_executor_job(bytecode_cache.save)
+    assert path.exists()
+
+
+def test_bytecode_cache_corrupt(tmp_path):
+    """Test a corrupt bytecode cache file is removed."""
+    path = tmp_path / template.BYTECODE_CACHE_FILE
+    path.write_bytes(b"\xff")
+
+    template.TemplateBytecodeCache(str(path)).load()
+    assert not path.exists()
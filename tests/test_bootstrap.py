@@ -236,12 +236,22 @@ def mock_ensure_config_exists():
         yield ensure_config_exists
 
 
+@pytest.fixture
+def mock_custom_components():
+    """Mock looking up custom integrations in the test config dir."""
+    with patch(
+        "homeassistant.loader.async_get_custom_components", return_value={}
+    ) as get_custom_components:
+        yield get_custom_components
+
+
 async def test_setup_hass(
     mock_enable_logging,
     mock_is_virtual_env,
     mock_mount_local_lib_path,
     mock_ensure_config_exists,
     mock_process_ha_config_upgrade,
+    mock_custom_components,
 ):
     """Test it works."""
     verbose = Mock()
@@ -283,6 +293,7 @@ async def test_setup_hass_invalid_yaml(
     mock_mount_local_lib_path,
     mock_ensure_config_exists,
     mock_process_ha_config_upgrade,
+    mock_custom_components,
 ):
     """Test it works."""
     with patch(
@@ -308,6 +319,7 @@ async def test_setup_hass_config_dir_nonexistent(
     mock_mount_local_lib_path,
     mock_ensure_config_exists,
     mock_process_ha_config_upgrade,
+    mock_custom_components,
 ):
     """Test it works."""
     mock_ensure_config_exists.return_value = False
@@ -333,6 +345,7 @@ async def test_setup_hass_safe_mode(
     mock_mount_local_lib_path,
     mock_ensure_config_exists,
     mock_process_ha_config_upgrade,
+    mock_custom_components,
 ):
     """Test it works."""
     # Add a config entry to storage.
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -30,7 +31,11 @@ from homeassistant.const import (
     __version__,
 )
 import homeassistant.core as ha
-from homeassistant.exceptions import InvalidEntityFormatError, InvalidStateError
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    InvalidEntityFormatError,
+    InvalidStateError,
+)
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -510,6 +515,21 @@ def test_state_dict_conversion():
     assert state == ha.State.from_dict(state.as_dict())
 
 
+def test_state_as_json():
+    """Test a state is serialized to JSON once."""
+    state = ha.State("domain.hello", "world", {"some": "attr"})
+    dumped = state.as_json()
+    assert dumped is state.as_json()
+    assert ha.State.from_dict(json.loads(dumped)) == state
+
+
+def test_state_as_json_invalid():
+    """Test serializing a state with attributes that are not valid JSON."""
+    state = ha.State("domain.hello", "world", {"some": float("nan")})
+    with pytest.raises(ValueError):
+        state.as_json()
+
+
 def test_state_dict_conversion_with_wrong_data():
     """Test conversion with wrong data."""
     assert ha.State.from_dict(None) is None
@@ -1180,3 +1200,96 @@ def test_context():
     assert c.user_id == 23
     assert c.parent_id == 100
     assert c.id is not None
+
+
+async def test_keyed_state_changed_listeners(hass):
+    """Test keyed listeners only receive matching state changes."""
+    entity_calls = []
+    domain_calls = []
+    both_calls = []
+
+    @ha.callback
+    def entity_listener(event):
+        """Record calls for the entity."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Record calls for the domain."""
+        domain_calls.append(event)
+
+    @ha.callback
+    def both_listener(event):
+        """Record calls for the domain and the entity."""
+        both_calls.append(event)
+
+    unsub_entity = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, ["light.Kitchen"], entity_listener
+    )
+    hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, ["switch"], domain_listener)
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, ["light", "light.kitchen"], both_listener
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 3
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("switch.pump", "on")
+    hass.states.async_remove("switch.pump")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == ["light.kitchen"]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "switch.pump",
+        "switch.pump",
+    ]
+    assert [event.data["entity_id"] for event in both_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+
+    unsub_entity()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 2
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 1
+    assert len(both_calls) == 3
+
+
+async def test_event_filter(hass):
+    """Test event filters run before listeners are scheduled."""
+    calls = []
+    filtered = []
+
+    @ha.callback
+    def event_filter(event):
+        """Only pass events with a matching value."""
+        filtered.append(event)
+        return event.data.get("value") == 1
+
+    @ha.callback
+    def listener(event):
+        """Record calls."""
+        calls.append(event)
+
+    hass.bus.async_listen("test_event", listener, event_filter)
+
+    hass.bus.async_fire("test_event", {"value": 1})
+    hass.bus.async_fire("test_event", {"value": 2})
+    await hass.async_block_till_done()
+
+    assert len(filtered) == 2
+    assert len(calls) == 1
+    assert calls[0].data["value"] == 1
+
+
+async def test_event_filter_must_be_callback(hass):
+    """Test event filters need to be callbacks."""
+
+    def event_filter(event):
+        """Filter events."""
+        return True
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen("test_event", lambda event: None, event_filter)
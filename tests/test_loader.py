@@ -126,6 +126,17 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test resolving a built-in integration does not read its manifest."""
+    with patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.file_path.name == "hue"
+    assert integration.config_flow is True
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -189,6 +200,25 @@ async def test_get_custom_components_internal(hass):
     assert integrations == {"test": ANY, "test_package": ANY}
 
 
+async def test_get_custom_components_cached_manifests(hass, hass_storage):
+    """Test that unmodified custom manifests are read from storage."""
+    # pylint: disable=protected-access
+    await loader._async_get_custom_components(hass)
+    await hass.async_block_till_done()
+    cached = hass_storage[loader.STORAGE_KEY_CUSTOM_COMPONENTS]["data"]
+    assert len(cached) == 2
+
+    for cached_manifest in cached.values():
+        cached_manifest["manifest"]["name"] = "Cached"
+
+    with patch("pathlib.Path.read_text") as mock_read:
+        integrations = await loader._async_get_custom_components(hass)
+
+    assert not mock_read.called
+    assert integrations["test"].name == "Cached"
+    assert integrations["test_package"].name == "Cached"
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
@@ -46,6 +46,15 @@ def test_save_and_load():
     assert data == TEST_JSON_A
 
 
+def test_save_and_load_compact():
+    """Test saving compact JSON and loading it back."""
+    fname = _path_for("test_compact")
+    save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname) as fil:
+        assert fil.read() == '{"a":1,"B":"two"}'
+    assert load_json(fname) == TEST_JSON_A
+
+
 # Skipped on Windows
 @unittest.skipIf(
     sys.platform.startswith("win"), "private permissions not supported on Windows"
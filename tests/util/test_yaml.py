@@ -274,6 +274,25 @@ def test_load_yaml_encoding_error(mock_open):
         yaml_loader.load_yaml("test")
 
 
+def test_yaml_cache():
+    """Test that unchanged files are not parsed again."""
+    files = {YAML_CONFIG_FILE: "key: !include included.yaml", "included.yaml": "one"}
+    yaml_cache = yaml_loader.YamlCache()
+
+    with patch_yaml_files(files), patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse:
+        assert load_yaml_config_file(YAML_CONFIG_FILE, yaml_cache) == {"key": "one"}
+        assert mock_parse.call_count == 2
+
+        assert load_yaml_config_file(YAML_CONFIG_FILE, yaml_cache) == {"key": "one"}
+        assert mock_parse.call_count == 2
+
+        files["included.yaml"] = "two"
+        assert load_yaml_config_file(YAML_CONFIG_FILE, yaml_cache) == {"key": "two"}
+        assert mock_parse.call_count == 4
+
+
 def test_dump():
     """The that the dump method returns empty None values."""
     assert yaml.dump({"a": None, "b": "b"}) == "a:\nb: b\n"